@@ -0,0 +1,424 @@
+"""
+Throughput benchmarks for the engine's hot paths.
+
+    python -m benchmarks.bench_engine [--quick] [--filter NAME] [--output results.json]
+                                      [--compare baseline.json] [--threshold 0.2]
+
+Every benchmark builds its fixtures from the real board, placement file and piece
+assets, and uses seeded randomness, so two runs measure the same work. Results are
+written as JSON: per benchmark the operations per repeat, the median and best time per
+operation, and operations per second. With --compare the run fails (exit code 1) when
+a benchmark's median got slower than the baseline by more than --threshold.
+"""
+import argparse
+import contextlib
+import io
+import json
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+import cv2
+import numpy as np
+
+from src.core.board import Board
+from src.core.clock import SimulatedClock
+from src.core.game import Game
+from src.core.table import Table
+from src.enums.states_names import StatesNames
+from src.graphics.compositing import PremultipliedSprite, Rect, _clip, blit_all
+from src.graphics.img import Img
+from src.graphics.screen import Screen
+from src.input.command import Command
+from src.input.event_bus import EventBus
+from src.pieces.piece_factory import PieceFactory
+from src.pieces.piece_store import PieceStore
+
+PIECES_ROOT = ROOT / "assets" / "pieces"
+PLACEMENT_CSV = ROOT / "src" / "board.csv"
+BOARD_PNG = ROOT / "board.png"
+SEED = 1234
+
+Benchmark = Callable[[], Tuple[Callable[[], None], int]]  # builds (run once, operations per run)
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str):
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def make_board() -> Board:
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8,
+                 img=Img().read(BOARD_PNG, size=(640, 640)))
+
+
+def make_game(board: Optional[Board] = None) -> Game:
+    game = Game(None, board or make_board(), PIECES_ROOT, PLACEMENT_CSV, None,
+                clock=SimulatedClock(), bus=EventBus())
+    game.reset_pieces(0)
+    return game
+
+
+def random_commands(game: Game, rng: random.Random, rate: float = 0.3) -> List[Command]:
+    """Occasionally order a random idle piece to a random legal cell (or to jump)."""
+    if rng.random() >= rate:
+        return []
+    cell, piece = rng.choice(list(game.pos_to_piece.items()))
+    if piece.state.name != StatesNames.IDLE or piece.get_id()[0] == 'K':
+        return []
+    destinations = game.legal_destinations(cell)
+    dst = rng.choice(destinations) if destinations else cell
+    kind = StatesNames.MOVE if dst != cell else StatesNames.JUMP
+    board = game.board
+    return [Command(game.game_time_ms(), piece.get_id()[:2], kind,
+                    (board.cell_to_square(cell), board.cell_to_square(dst)))]
+
+
+def make_screen() -> Screen:
+    return Screen(['time', 'source', 'destination'], screen_size=(780, 1600), bg_color=(255, 255, 255))
+
+
+def midgame(ticks: int = 400) -> Game:
+    """A game a few seconds into seeded random play, with pieces moving between cells."""
+    game = make_game()
+    game.screen = make_screen()
+    rng = random.Random(SEED)
+    for _ in range(ticks):
+        game.step(random_commands(game, rng, rate=0.6))
+    return game
+
+
+@benchmark("update_position_mapping")
+def bench_update_position_mapping():
+    game = midgame()
+    return game._update_position_mapping, 1
+
+
+@benchmark("is_path_clean")
+def bench_is_path_clean():
+    game = make_game()
+    rng = random.Random(SEED)
+    cells = [(r, c) for r in range(8) for c in range(8)]
+    pairs = [(rng.choice(cells), rng.choice(cells)) for _ in range(1000)]
+
+    def run():
+        for dst, src in pairs:
+            game.is_path_clean(dst, src)
+    return run, len(pairs)
+
+
+@benchmark("moves_get_moves")
+def bench_moves_get_moves():
+    game = make_game()
+    moves = {piece.get_id()[:2]: piece.state._moves for piece in game.pieces.values()}
+    cells = [(r, c) for r in range(8) for c in range(8)]
+
+    def run():
+        for table in moves.values():
+            for r, c in cells:
+                table.get_moves(r, c)
+    return run, len(moves) * len(cells)
+
+
+@benchmark("piece_draw_on_board")
+def bench_piece_draw_on_board():
+    game = make_game()
+    frame = game.board.clone()
+    pieces = list(game.pieces.values())
+
+    def run():
+        for piece in pieces:
+            piece.draw_on_board(frame, 0)
+    return run, len(pieces)
+
+
+@benchmark("table_create_img")
+def bench_table_create_img():
+    table = Table(['time', 'source', 'destination'])
+    table.update_data([[f"00:00:{i:02d}", f"e{i % 8 + 1}", f"d{i % 8 + 1}"] for i in range(15)])
+
+    def run():
+        table._row_strips.clear()  # measure rendering the rows, not the strip cache
+        table._create_table_img()
+    return run, 1
+
+
+@benchmark("screen_draw_full")
+def bench_screen_draw_full():
+    game = midgame()
+    game._draw()
+    screen = make_screen()
+    frame = game._renderer.frame
+
+    def run():
+        screen._chrome_key = None  # force the full redraw a score or log change causes
+        screen.draw(frame, white_score=3, black_score=5)
+    return run, 1
+
+
+@benchmark("screen_draw_dirty")
+def bench_screen_draw_dirty():
+    game = midgame()
+    game._draw()
+    screen = make_screen()
+    frame = game._renderer.frame
+    screen.draw(frame, white_score=3, black_score=5)
+    dirty = [(80 * c, 80 * 4, 80 * (c + 1), 80 * 5) for c in range(4)]
+
+    def run():
+        screen.draw(frame, white_score=3, black_score=5, dirty_rects=dirty)
+    return run, 1
+
+
+@benchmark("board_render_frame")
+def bench_board_render_frame():
+    game = midgame()
+    rng = random.Random(SEED)
+
+    def run():
+        game.step(random_commands(game, rng))
+        game._draw()
+    return run, 1
+
+
+def frame_sprite_draws(game: Game, now_ms: int = 0) -> List[Tuple[PremultipliedSprite, int, int, Rect]]:
+    """The (sprite, x, y, clip) draws of a full board redraw: every piece clipped to each cell it touches."""
+    cw, ch = game.board.cell_W_pix, game.board.cell_H_pix
+    draws = []
+    for piece in game.pieces.values():
+        x, y = map(int, piece.position_at(now_ms))
+        sprite = piece.sprite_at(now_ms)
+        h, w = sprite.shape
+        for row in range(y // ch, (y + h - 1) // ch + 1):
+            for col in range(x // cw, (x + w - 1) // cw + 1):
+                draws.append((sprite, x, y, (col * cw, row * ch, (col + 1) * cw, (row + 1) * ch)))
+    return draws
+
+
+def composite_single_layer(dst: np.ndarray, draws) -> int:
+    """
+    The alternative to blit_all's loop: every visible sprite goes into one premultiplied
+    layer over the bounding box of the draws (copied where it overlaps nothing drawn before,
+    composited 'over' where it does), then the layer is blended onto dst with a single
+    multiply and add.
+    """
+    visible = []
+    for sprite, x, y, clip in draws:
+        rect = _clip(dst.shape, sprite.shape, x, y, clip)
+        if rect is not None:
+            visible.append((sprite, rect, x, y))
+    if not visible:
+        return 0
+    bx0, by0 = min(r[0] for _, r, _, _ in visible), min(r[1] for _, r, _, _ in visible)
+    bx1, by1 = max(r[2] for _, r, _, _ in visible), max(r[3] for _, r, _, _ in visible)
+    channels = dst.shape[2]
+    layer = np.zeros((by1 - by0, bx1 - bx0, channels), dtype=np.uint8)
+    layer_inv_alpha = np.full_like(layer, 255)
+    drawn: List[Rect] = []
+    for sprite, rect, x, y in visible:
+        x0, y0, x1, y1 = rect
+        color, inv_alpha = sprite.layers(channels)
+        src = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        roi = (slice(y0 - by0, y1 - by0), slice(x0 - bx0, x1 - bx0))
+        if any(x0 < dx1 and dx0 < x1 and y0 < dy1 and dy0 < y1 for dx0, dy0, dx1, dy1 in drawn):
+            cv2.multiply(layer[roi], inv_alpha[src], dst=layer[roi], scale=1 / 255)
+            cv2.add(layer[roi], color[src], dst=layer[roi])
+            cv2.multiply(layer_inv_alpha[roi], inv_alpha[src], dst=layer_inv_alpha[roi], scale=1 / 255)
+        else:
+            layer[roi] = color[src]
+            layer_inv_alpha[roi] = inv_alpha[src]
+        drawn.append(rect)
+    target = dst[by0:by1, bx0:bx1]
+    cv2.multiply(target, layer_inv_alpha, dst=target, scale=1 / 255)
+    cv2.add(target, layer, dst=target)
+    return len(visible)
+
+
+def sprite_compositing(composite: Callable[[np.ndarray, list], int]):
+    game = midgame()
+    draws = frame_sprite_draws(game, game.game_time_ms())
+    frame = game.board.img.img.copy()
+
+    def run():
+        composite(frame, draws)
+    return run, len(draws)
+
+
+@benchmark("blit_all_loop")
+def bench_blit_all_loop():
+    return sprite_compositing(blit_all)
+
+
+@benchmark("blit_all_single_layer")
+def bench_blit_all_single_layer():
+    return sprite_compositing(composite_single_layer)
+
+
+@benchmark("piece_factory_startup")
+def bench_piece_factory_startup():
+    board = make_board()
+    codes = [(code, (r, c)) for r, row in enumerate(PLACEMENT_CSV.read_text().splitlines())
+             for c, code in enumerate(row.split(',')) if code]
+
+    def run():
+        factory = PieceFactory(board, PIECES_ROOT, EventBus())
+        for code, cell in codes:
+            factory.create_piece(code, cell)
+    return run, len(codes)
+
+
+@benchmark("headless_ticks")
+def bench_headless_ticks():
+    board = make_board()
+    ticks = 2000
+
+    def run():
+        game = make_game(board)
+        rng = random.Random(SEED)
+        for _ in range(ticks):
+            game.step(random_commands(game, rng))
+    return run, ticks
+
+
+def crowd(count: int = 512):
+    """count pieces, every other one moving, as on the large boards of a variant. They share
+    the cells of one board, since nothing here consults the occupancy."""
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=None)
+    factory = PieceFactory(board, PIECES_ROOT, EventBus())
+    pieces = []
+    for i in range(count):
+        cell = (i // 8 % 7, i % 8)
+        piece = factory.create_piece('QW', cell, piece_id=f"QW_{i}")
+        if i % 2:
+            dst = (cell[0] + 1, cell[1])
+            piece.on_command(Command(0, piece.get_id(), StatesNames.MOVE,
+                                     (board.cell_to_square(cell), board.cell_to_square(dst))), 0)
+        piece.update(0)
+        pieces.append(piece)
+    return pieces
+
+
+@benchmark("crowd_positions_scalar")
+def bench_crowd_positions_scalar():
+    pieces = crowd()
+
+    def run():
+        for piece in pieces:
+            piece.position_at(400)
+            piece.sprite_at(400)
+    return run, len(pieces)
+
+
+@benchmark("crowd_positions_store")
+def bench_crowd_positions_store():
+    pieces = crowd()
+    store = PieceStore()
+    for piece in pieces:
+        piece.attach(store, 0)
+
+    def run():
+        store.advance(400)
+        for piece in pieces:
+            piece.position_at(400)
+            piece.sprite_at(400)
+    return run, len(pieces)
+
+
+@benchmark("crowd_store_advance")
+def bench_crowd_store_advance():
+    pieces = crowd()
+    store = PieceStore()
+    for piece in pieces:
+        piece.attach(store, 0)
+
+    def run():
+        store.advance(400)
+        store.due(400)
+    return run, len(pieces)
+
+
+def measure(setup: Benchmark, repeat: int, min_time: float) -> Dict[str, float]:
+    run, operations = setup()
+    run()  # warm caches and lazily built state
+    # Loop each repeat enough times to last about min_time, so short operations are timed reliably
+    start = time.perf_counter()
+    run()
+    once = max(time.perf_counter() - start, 1e-9)
+    loops = max(1, int(min_time / once))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        timings.append((time.perf_counter() - start) / (loops * operations))
+    median = statistics.median(timings)
+    return {
+        'operations': operations * loops,
+        'repeat': repeat,
+        'median_us': median * 1e6,
+        'best_us': min(timings) * 1e6,
+        'stdev_us': statistics.stdev(timings) * 1e6 if repeat > 1 else 0.0,
+        'ops_per_sec': 1 / median,
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {'python': platform.python_version(), 'platform': platform.platform(),
+            'numpy': np.__version__, 'opencv': cv2.__version__,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+
+
+def regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                threshold: float) -> List[str]:
+    slower = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is not None and result['median_us'] > before['median_us'] * (1 + threshold):
+            slower.append(f"{name}: {before['median_us']:.2f} us -> {result['median_us']:.2f} us")
+    return slower
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', action='append', default=[], help="only run benchmarks containing this text")
+    parser.add_argument('--quick', action='store_true', help="fewer, shorter repeats for a smoke run")
+    parser.add_argument('--output', type=pathlib.Path, help="write the JSON results here instead of stdout")
+    parser.add_argument('--compare', type=pathlib.Path, help="baseline JSON from an earlier run")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    repeat, min_time = (3, 0.05) if args.quick else (7, 0.2)
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if args.filter and not any(text in name for text in args.filter):
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):  # the game prints rejected moves and scores
+            results[name] = measure(setup, repeat, min_time)
+        print(f"{name:<26}{results[name]['median_us']:12.2f} us/op {results[name]['ops_per_sec']:14.0f} ops/s",
+              file=sys.stderr)
+
+    report = json.dumps({'environment': environment(), 'results': results}, indent=2)
+    if args.output is not None:
+        args.output.write_text(report + '\n')
+    else:
+        print(report)
+
+    if args.compare is not None:
+        slower = regressions(results, json.loads(args.compare.read_text())['results'], args.threshold)
+        for line in slower:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
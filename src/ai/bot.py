@@ -0,0 +1,362 @@
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.core.bitboard import Bitboards, BoardGeometry
+from src.core.board import Board
+from src.core.occupancy import Occupancy
+from src.core.snapshot import PieceRecord, Snapshot
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+
+if TYPE_CHECKING:
+    from src.core.game import Game
+    from src.pieces.piece import Piece
+    from src.pieces.piece_factory import PieceFactory
+
+Cell = Tuple[int, int]
+
+# King is worth more than everything else together: losing it loses the match
+PIECE_VALUES = {'P': 1, 'N': 3, 'B': 3, 'R': 5, 'Q': 9, 'K': 100}
+PIECE_KINDS = 'PNBRQK'
+# How likely a piece that is free to move still stands on its cell when a slower attacker lands
+DODGE_FACTOR = 0.5
+# A move must be worth at least this much to be played; idling is better than pointless moves
+MIN_SCORE = 0.05
+
+
+class KindRules:
+    """Movement rules and timing of one piece type, read from its prototype."""
+
+    def __init__(self, template: "Piece"):
+        self.template = template
+        self.kind, self.color = template.get_id()[0], template.get_id()[1]
+        self.value = PIECE_VALUES[self.kind]
+        self._moves = template.state._moves
+        states = template.state_machine()
+        self._move = states[StatesNames.MOVE].physics
+        # The state a finished state hands over to, and how long fixed-length states last
+        self._after = {name: next(iter(state.transitions)) for name, state in states.items()
+                       if name != StatesNames.IDLE and state.transitions}
+        self._hold = {name: state.physics.hold_ms() for name, state in states.items()}
+
+    def moves_mask(self, cell: Cell) -> int:
+        return self._moves.get_moves_mask(*cell)
+
+    def travel_ms(self, src: Cell, dst: Cell) -> int:
+        return self._move.travel_ms(src, dst)
+
+    def busy_ms(self, state: StatesNames, src: Cell, dst: Cell, finished: bool = False) -> int:
+        """Time a piece entering `state` for src -> dst needs until it is idle again."""
+        total = 0
+        while state != StatesNames.IDLE:
+            if state == StatesNames.MOVE:
+                total += self.travel_ms(src, dst) + self._move.extra_delay_ms
+            elif not finished:
+                total += self._hold[state] or 0
+            finished = False
+            state = self._after[state]
+        return total
+
+
+class Unit:
+    """A piece as the search sees it: where it is or will land, and when it can act again."""
+    __slots__ = ('piece_id', 'color', 'rules', 'cell', 'on_board', 'state', 'lands_at', 'free_at')
+
+    def __init__(self, record: PieceRecord, rules: KindRules, now: int):
+        self.piece_id = record.piece_id
+        self.color = record.piece_id[1]
+        self.rules = rules
+        self.state = record.state
+        started = record.start_time if record.start_time is not None else now
+        self.lands_at = now
+        if record.state == StatesNames.MOVE:
+            self.lands_at = started + rules.travel_ms(record.start_cell, record.target_cell)
+        # A piece in flight counts as standing on its target from the moment it lands
+        self.on_board = record.cell is not None and self.lands_at <= now
+        self.cell: Cell = record.cell if self.on_board else record.target_cell
+        finished = record.state in record.finished
+        self.free_at = max(now, started + rules.busy_ms(record.state, record.start_cell, record.target_cell,
+                                                        finished))
+
+    @property
+    def value(self) -> int:
+        return self.rules.value
+
+    def get_id(self) -> str:
+        return self.piece_id
+
+
+class Position:
+    """Everything the search needs from one snapshot, indexed for attack tests."""
+
+    def __init__(self, snapshot: Snapshot, rules: Dict[str, KindRules], geometry: BoardGeometry):
+        self.now = snapshot.time_ms
+        self.geometry = geometry
+        self.units = [Unit(record, rules[record.piece_id[:2]], self.now) for record in snapshot.pieces.values()]
+        self.occupancy = Occupancy(Bitboards(geometry))
+        for unit in self.units:
+            if unit.on_board:
+                self.occupancy.place(unit, unit.cell)
+        self.at: Dict[Cell, Unit] = self.occupancy.cell_to_piece
+        self.occupied = self.occupancy.bitboards.occupied
+        self._attack_masks: Dict[int, Dict[str, int]] = {}
+
+    def attack_masks(self, occupied: int) -> Dict[str, int]:
+        """
+        Per piece id, the squares each piece can capture on from where it stands or lands,
+        given the occupied squares. Computed once per occupancy the search looks at.
+        """
+        masks = self._attack_masks.get(occupied)
+        if masks is None:
+            masks = self._attack_masks[occupied] = {unit.piece_id: self._attack_mask(unit, occupied)
+                                                    for unit in self.units}
+        return masks
+
+    def _attack_mask(self, unit: Unit, occupied: int) -> int:
+        src = unit.cell
+        geometry = self.geometry
+        if unit.rules.kind == 'P':
+            row = src[0] + (-1 if unit.color == 'W' else 1)
+            if not 0 <= row < geometry.height:
+                return 0
+            return geometry.mask_of((row, col) for col in (src[1] - 1, src[1] + 1) if 0 <= col < geometry.width)
+        return unit.rules.moves_mask(src) & geometry.reachable(src, occupied) & ~geometry.bit(src)
+
+    def attacks(self, unit: Unit, dst: Cell, occupied: int) -> bool:
+        """Whether unit, from where it stands or lands, can capture on dst given the occupied squares."""
+        return bool(self.attack_masks(occupied)[unit.piece_id] & self.geometry.bit(dst))
+
+    def arrival(self, unit: Unit, dst: Cell) -> int:
+        """Earliest time unit can land on dst when ordered as soon as it is free."""
+        return max(self.now, unit.free_at) + unit.rules.travel_ms(unit.cell, dst)
+
+
+class TimedSearch:
+    """
+    Picks one order for `color` from a snapshot. Candidates are the legal moves and jumps of
+    its idle pieces. Each is scored by what it captures, the threat it escapes and what it
+    exposes, all timed with each piece's travel time and rest cooldowns: a resting piece
+    cannot dodge, and a piece that just moved sits on its target until its long rest ends.
+
+    The search deepens while the budget lasts: every candidate is first scored against
+    attacks on the moved piece only, then, best first, against the opponent's best capture
+    anywhere on the board after the move. Candidates the deeper pass did not reach keep
+    their first score.
+    """
+
+    def __init__(self, factory: "PieceFactory", board: Board, color: str, seed: Optional[int] = None):
+        self.color = color
+        self.enemy = 'B' if color == 'W' else 'W'
+        self.board = board
+        self.geometry = BoardGeometry.for_board(board.W_cells, board.H_cells)
+        # Prototypes are built here, on the caller's thread; the search only reads them
+        self.rules = {kind + c: KindRules(factory.template(kind + c)) for kind in PIECE_KINDS for c in 'WB'}
+        self._rng = random.Random(seed)
+        self.last_depth = 0  # deepest pass the last decision completed or started
+
+    def decide(self, snapshot: Snapshot, budget_ms: Optional[float] = None) -> Optional[Command]:
+        """The best order for this position, or None when no move is worth playing."""
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        pos = Position(snapshot, self.rules, self.geometry)
+        candidates = self._candidates(pos)
+        if not candidates:
+            return None
+
+        scores = []
+        self.last_depth = 1
+        for unit, dst in candidates:
+            scores.append(self._score(pos, unit, dst))
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        ranked = sorted(zip(scores, range(len(scores))), reverse=True)
+
+        if deadline is None or time.perf_counter() < deadline:
+            self.last_depth = 2
+            baseline = self._opponent_best(pos, None, None)
+            for score, i in ranked:
+                unit, dst = candidates[i]
+                scores[i] = self._gain(pos, unit, dst) + self._positional(pos, unit, dst) + \
+                    baseline - self._opponent_best(pos, unit, dst)
+                if deadline is not None and time.perf_counter() > deadline:
+                    break
+
+        best = max(scores)
+        if best < MIN_SCORE:
+            return None
+        unit, dst = candidates[self._rng.choice([i for i, s in enumerate(scores) if s == best])]
+        kind = StatesNames.JUMP if dst == unit.cell else StatesNames.MOVE
+        return Command(snapshot.time_ms, unit.piece_id, kind,
+                       (self.board.cell_to_square(unit.cell), self.board.cell_to_square(dst)))
+
+    def _candidates(self, pos: Position) -> List[Tuple[Unit, Cell]]:
+        candidates = []
+        for unit in pos.units:
+            if unit.color != self.color or unit.state != StatesNames.IDLE or not unit.on_board:
+                continue
+            candidates.append((unit, unit.cell))
+            for dst in pos.occupancy.legal_destinations(unit.cell, unit.rules.template):
+                candidates.append((unit, dst))
+        return candidates
+
+    def _score(self, pos: Position, unit: Unit, dst: Cell) -> float:
+        """First pass: gain, plus the threat on the piece escaped, minus what it is exposed to on dst."""
+        occupied_after = (pos.occupied & ~pos.geometry.bit(unit.cell)) | pos.geometry.bit(dst)
+        if dst == unit.cell:
+            settle = pos.now + unit.rules.busy_ms(StatesNames.JUMP, dst, dst)
+        else:
+            settle = pos.now + unit.rules.busy_ms(StatesNames.MOVE, unit.cell, dst)
+        escaped = self._exposure(pos, unit, unit.cell, pos.now, pos.occupied, None)
+        if dst == unit.cell:
+            exposed = self._exposure(pos, unit, dst, settle, occupied_after, None, jumping_until=settle)
+        else:
+            exposed = self._exposure(pos, unit, dst, settle, occupied_after, pos.at.get(dst))
+        return self._gain(pos, unit, dst) + escaped - exposed + self._positional(pos, unit, dst)
+
+    def _gain(self, pos: Position, unit: Unit, dst: Cell) -> float:
+        """Material the order wins by itself."""
+        if dst == unit.cell:
+            # A jump captures movers that were already on their way to this cell when it lands on them
+            jump_ms = unit.rules.busy_ms(StatesNames.JUMP, dst, dst) - unit.rules.busy_ms(StatesNames.SHORT_REST, dst, dst)
+            return max((u.value for u in pos.units
+                        if u.color == self.enemy and not u.on_board and u.cell == dst
+                        and pos.now < u.lands_at <= pos.now + jump_ms), default=0)
+        target = pos.at.get(dst)
+        if target is None or target.color == self.color:
+            return 0
+        arrive = pos.now + unit.rules.travel_ms(unit.cell, dst)
+        if target.state == StatesNames.JUMP and target.free_at > arrive:
+            return -unit.value  # landing on a jumping piece loses the mover
+        return target.value if target.free_at >= arrive else target.value * DODGE_FACTOR
+
+    def _exposure(self, pos: Position, victim: Unit, cell: Cell, stuck_until: int, occupied: int,
+                  ignore: Optional[Unit], jumping_until: int = 0) -> float:
+        """
+        What victim standing on cell stands to lose: an enemy that lands there while the victim
+        cannot leave takes it, one that lands later only might. A defended victim costs the
+        difference to the cheapest attacker.
+        """
+        masks = pos.attack_masks(occupied)
+        bit = pos.geometry.bit(cell)
+        attackers = []
+        for enemy in pos.units:
+            if enemy.color == victim.color or enemy is ignore:
+                continue
+            if not enemy.on_board and enemy.cell == cell and enemy.lands_at > pos.now:
+                landing = enemy.lands_at  # already on its way to this very cell
+            elif masks[enemy.piece_id] & bit:
+                landing = pos.arrival(enemy, cell)
+            else:
+                continue
+            if landing <= jumping_until:
+                continue
+            attackers.append((enemy.value, 1.0 if landing < stuck_until else DODGE_FACTOR))
+        if not attackers:
+            return 0.0
+        cheapest = min(value for value, _ in attackers)
+        certainty = max(factor for _, factor in attackers)
+        defended = any(friend is not victim and friend.color == victim.color and masks[friend.piece_id] & bit
+                       for friend in pos.units)
+        loss = victim.value - cheapest if defended else victim.value
+        return max(0.0, loss) * certainty
+
+    def _opponent_best(self, pos: Position, moved: Optional[Unit], dst: Optional[Cell]) -> float:
+        """Largest exposure of any of our pieces once `moved` went to dst (nothing moved when None)."""
+        occupied = pos.occupied
+        settle = pos.now
+        if moved is not None:
+            occupied = (occupied & ~pos.geometry.bit(moved.cell)) | pos.geometry.bit(dst)
+            state = StatesNames.JUMP if dst == moved.cell else StatesNames.MOVE
+            settle = pos.now + moved.rules.busy_ms(state, moved.cell, dst)
+        worst = 0.0
+        for unit in pos.units:
+            if unit.color != self.color:
+                continue
+            if unit is moved:
+                captured = None if dst == moved.cell else pos.at.get(dst)
+                exposure = self._exposure(pos, unit, dst, settle, occupied, captured,
+                                          jumping_until=settle if dst == moved.cell else 0)
+            else:
+                exposure = self._exposure(pos, unit, unit.cell, unit.free_at, occupied, None)
+            worst = max(worst, exposure)
+        return worst
+
+    def _positional(self, pos: Position, unit: Unit, dst: Cell) -> float:
+        """Small nudges so quiet positions still make progress: advance pawns, centralize minor pieces."""
+        if dst == unit.cell:
+            return 0.0
+        kind = unit.rules.kind
+        if kind == 'P':
+            forward = -1 if unit.color == 'W' else 1
+            return 0.06 * (dst[0] - unit.cell[0]) * forward
+        if kind in 'NB':
+            center_r, center_c = (pos.geometry.height - 1) / 2, (pos.geometry.width - 1) / 2
+            def spread(cell: Cell) -> float:
+                return abs(cell[0] - center_r) + abs(cell[1] - center_c)
+            return 0.03 * (spread(unit.cell) - spread(dst))
+        if kind == 'K':
+            return -0.1
+        return 0.0
+
+
+class BotPlayer:
+    """
+    Plays one color of a live game from its own thread. The game hands it a snapshot at
+    most every decision_interval_ms; the bot spends at most budget_ms of search on it and
+    queues the chosen Command on the game's input queue like any other player.
+    """
+
+    def __init__(self, game: "Game", color: str, budget_ms: float = 5.0, decision_interval_ms: int = 100,
+                 seed: Optional[int] = None):
+        self.color = color
+        self.budget_ms = budget_ms
+        self.decision_interval_ms = decision_interval_ms
+        self.search = TimedSearch(game.piece_factory, game.board, color, seed)
+        self.decisions = 0
+        self.orders = 0
+        self._queue = game.user_input_queue
+        self._next_decision_ms = 0
+        self._latest: Optional[Snapshot] = None
+        self._wake = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def wants_snapshot(self, now_ms: int) -> bool:
+        return self._running and now_ms >= self._next_decision_ms
+
+    def observe(self, snapshot: Snapshot):
+        """Called by the game thread with the position to answer next."""
+        with self._wake:
+            self._latest = snapshot
+            self._next_decision_ms = snapshot.time_ms + self.decision_interval_ms
+            self._wake.notify()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._play, name=f"bot-{self.color}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._wake:
+            self._running = False
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _play(self):
+        while True:
+            with self._wake:
+                while self._running and self._latest is None:
+                    self._wake.wait()
+                if not self._running:
+                    return
+                snapshot, self._latest = self._latest, None
+            cmd = self.search.decide(snapshot, self.budget_ms)
+            self.decisions += 1
+            if cmd is not None:
+                self.orders += 1
+                self._queue.put(cmd)
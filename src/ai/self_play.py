@@ -0,0 +1,302 @@
+"""
+Plays many headless matches across a process pool and streams their results.
+
+    python -m src.ai.self_play [--games 100] [--workers N] [--white bot] [--black random]
+                               [--seed 0] [--max-time-ms 300000] [--archive games.kfa]
+
+Every match gets its own seed, and its policies draw all their randomness from it, so
+a match replays identically no matter which worker played it.
+"""
+import argparse
+import multiprocessing
+import os
+import pathlib
+import queue
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from src.ai.bot import TimedSearch
+from src.core.board import Board
+from src.enums.states_names import StatesNames
+from src.infrastructure.archive import ArchiveWriter, GameResult
+from src.input.command import Command
+from src.server.game_server import headless_game_factory
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+PIECES_ROOT = ROOT / "assets" / "pieces"
+PLACEMENT_CSV = ROOT / "src" / "board.csv"
+
+NO_MATCH = -1  # a worker's slot value while it is between matches
+
+
+class MatchSpec(NamedTuple):
+    game_id: int
+    seed: int
+    white: str                  # policy name, see POLICIES
+    black: str
+    max_time_ms: int = 300_000  # a match still running at this game time ends without a winner
+
+
+class MatchOutcome(NamedTuple):
+    game_id: int
+    seed: int
+    winner: Optional[str]            # 'white', 'black' or None for a draw by time or a failed match
+    duration_ms: int                 # game time the match lasted
+    white_score: int                 # material captured by white, from its Score
+    black_score: int
+    white_captures: int              # black pieces white took off the board
+    black_captures: int
+    result: Optional[GameResult]     # everything an ArchiveWriter needs; None when the match failed
+    error: Optional[str] = None      # why the match failed: an exception or the worker dying
+
+
+class RandomPolicy:
+    """Every interval, orders a random idle piece to a random legal cell, or to jump in place."""
+
+    def __init__(self, game, color: str, seed: int, interval_ms: int = 200):
+        self._game = game
+        self._color = color
+        self._rng = random.Random(seed)
+        self._interval_ms = interval_ms
+        self._next_ms = 0
+
+    def poll(self, now_ms: int) -> List[Command]:
+        if now_ms < self._next_ms:
+            return []
+        self._next_ms = now_ms + self._interval_ms
+        game = self._game
+        idle = [(cell, piece) for cell, piece in sorted(game.pos_to_piece.items())
+                if piece.get_id()[1] == self._color and piece.state.name == StatesNames.IDLE]
+        if not idle:
+            return []
+        cell, piece = self._rng.choice(idle)
+        destinations = game.legal_destinations(cell)
+        dst = self._rng.choice(destinations) if destinations else cell
+        kind = StatesNames.MOVE if dst != cell else StatesNames.JUMP
+        return [Command(now_ms, piece.get_id(), kind,
+                        (game.board.cell_to_square(cell), game.board.cell_to_square(dst)))]
+
+    def next_timestamp(self) -> int:
+        return self._next_ms
+
+
+class SearchPolicy:
+    """Every interval, plays the order an unbudgeted TimedSearch picks, so results do not depend on CPU speed."""
+
+    def __init__(self, game, color: str, seed: int, interval_ms: int = 100):
+        self._game = game
+        self._search = TimedSearch(game.piece_factory, game.board, color, seed)
+        self._interval_ms = interval_ms
+        self._next_ms = 0
+
+    def poll(self, now_ms: int) -> List[Command]:
+        if now_ms < self._next_ms:
+            return []
+        self._next_ms = now_ms + self._interval_ms
+        cmd = self._search.decide(self._game.snapshot(now_ms))
+        return [] if cmd is None else [cmd]
+
+    def next_timestamp(self) -> int:
+        return self._next_ms
+
+
+POLICIES: Dict[str, Callable] = {'random': RandomPolicy, 'bot': SearchPolicy}
+
+
+class _BothSides:
+    """Command source run_headless polls: the white and black policies together."""
+
+    def __init__(self, white, black):
+        self._sides = (white, black)
+
+    def poll(self, now_ms: int) -> List[Command]:
+        return [cmd for side in self._sides for cmd in side.poll(now_ms)]
+
+    def next_timestamp(self) -> int:
+        # Policies only act when polled on time, so the ticks in between can be skipped
+        return min(side.next_timestamp() for side in self._sides)
+
+
+def play_match(spec: MatchSpec, make_game: Callable) -> MatchOutcome:
+    """Play one match in this process."""
+    game = make_game()
+    counts = _counts(game)
+    # Each color gets its own stream derived from the match seed
+    source = _BothSides(POLICIES[spec.white](game, 'W', spec.seed * 2),
+                        POLICIES[spec.black](game, 'B', spec.seed * 2 + 1))
+    game.run_headless(source, max_time_ms=spec.max_time_ms)
+    left = _counts(game)
+    result = game.result()
+    return MatchOutcome(spec.game_id, spec.seed, result.winner, result.end_ms, result.white_score,
+                        result.black_score, counts['B'] - left['B'], counts['W'] - left['W'], result)
+
+
+def _counts(game) -> Dict[str, int]:
+    counts = {'W': 0, 'B': 0}
+    for piece_id in game.pieces:
+        counts[piece_id[1]] += 1
+    return counts
+
+
+def failed(spec: MatchSpec, error: str) -> MatchOutcome:
+    return MatchOutcome(spec.game_id, spec.seed, None, 0, 0, 0, 0, 0, None, error)
+
+
+def _worker(slot: int, current, tasks, results, pieces_root: pathlib.Path, placement_csv: pathlib.Path):
+    """Plays matches from tasks until it reads None; `current[slot]` names the match in progress."""
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=None)
+    make_game = headless_game_factory(board, pieces_root, placement_csv)
+    while True:
+        spec = tasks.get()
+        if spec is None:
+            return
+        current[slot] = spec.game_id
+        try:
+            outcome = play_match(spec, make_game)
+        except Exception as e:
+            outcome = failed(spec, f"{type(e).__name__}: {e}")
+        # Cleared first: once the outcome is out, dying must not get the match reported as lost too
+        current[slot] = NO_MATCH
+        results.put(outcome)  # blocks while the consumer is behind
+
+
+class SelfPlayRunner:
+    """
+    Runs matches on `workers` processes and yields each outcome as soon as it is ready.
+
+    Outcomes travel back through a queue of at most queue_size entries, so workers wait
+    when the consumer falls behind instead of piling results up in memory. A match that
+    raises comes back as an outcome carrying the error. A worker that dies outright loses
+    only the match it was playing: that match is reported as failed, and a fresh worker
+    takes over the remaining ones.
+    """
+
+    def __init__(self, workers: Optional[int] = None, queue_size: int = 64,
+                 pieces_root: pathlib.Path = PIECES_ROOT, placement_csv: pathlib.Path = PLACEMENT_CSV,
+                 start_method: str = 'spawn'):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.pieces_root = pieces_root
+        self.placement_csv = placement_csv
+        self.crashed = 0  # workers that died during the last run
+        # Spawned workers do not inherit the parent's threads (event bus, mixer) mid-operation
+        self._context = multiprocessing.get_context(start_method)
+
+    def run(self, specs: Iterable[MatchSpec]) -> Iterator[MatchOutcome]:
+        specs = {spec.game_id: spec for spec in specs}
+        ctx = self._context
+        tasks = ctx.Queue()
+        results = ctx.Queue(self.queue_size)
+        current = ctx.Array('q', [NO_MATCH] * self.workers, lock=False)
+        for spec in specs.values():
+            tasks.put(spec)
+        for _ in range(self.workers):
+            tasks.put(None)
+
+        processes = [self._start(ctx, slot, current, tasks, results) for slot in range(self.workers)]
+        pending = set(specs)
+        self.crashed = 0
+        try:
+            while pending:
+                try:
+                    outcome = results.get(timeout=0.1)
+                except queue.Empty:
+                    for slot, process in enumerate(processes):
+                        if process.is_alive() or process.exitcode == 0:
+                            continue
+                        # Its match is lost; the stop marker it never read stays queued for its replacement
+                        self.crashed += 1
+                        lost = current[slot]
+                        current[slot] = NO_MATCH
+                        processes[slot] = self._start(ctx, slot, current, tasks, results)
+                        # A match already reported, or never started, is not lost
+                        if lost != NO_MATCH and lost in pending:
+                            pending.discard(lost)
+                            yield failed(specs[lost], f"worker exited with code {process.exitcode}")
+                    if not any(process.is_alive() for process in processes) and results.empty():
+                        for game_id in sorted(pending):
+                            yield failed(specs[game_id], "no worker left to play it")
+                        return
+                    continue
+                if outcome.game_id in pending:
+                    pending.discard(outcome.game_id)
+                    yield outcome
+        finally:
+            for process in processes:
+                if pending:
+                    process.terminate()
+                process.join()
+
+    def _start(self, ctx, slot: int, current, tasks, results):
+        process = ctx.Process(target=_worker, name=f"self-play-{slot}", daemon=True,
+                              args=(slot, current, tasks, results, self.pieces_root, self.placement_csv))
+        process.start()
+        return process
+
+
+def in_game_id_order(outcomes: Iterable[MatchOutcome], first_id: int = 0) -> Iterator[MatchOutcome]:
+    """Reorder outcomes by game_id, holding each back until every lower id has come in."""
+    ready: Dict[int, MatchOutcome] = {}
+    next_id = first_id
+    for outcome in outcomes:
+        ready[outcome.game_id] = outcome
+        while next_id in ready:
+            yield ready.pop(next_id)
+            next_id += 1
+    for game_id in sorted(ready):  # after a gap in the ids
+        yield ready[game_id]
+
+
+def match_specs(games: int, white: str, black: str, seed: int = 0,
+                max_time_ms: int = 300_000) -> List[MatchSpec]:
+    """Specs for `games` matches with seeds seed, seed + 1, ..."""
+    return [MatchSpec(i, seed + i, white, black, max_time_ms) for i in range(games)]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None, help="default: one per core")
+    parser.add_argument('--white', choices=sorted(POLICIES), default='bot')
+    parser.add_argument('--black', choices=sorted(POLICIES), default='bot')
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first match; the rest count up")
+    parser.add_argument('--max-time-ms', type=int, default=300_000)
+    parser.add_argument('--pieces', type=pathlib.Path, default=PIECES_ROOT,
+                        help="piece assets to play with, e.g. a copy with tuned config.json speeds and durations")
+    parser.add_argument('--archive', type=pathlib.Path, help="append every finished match to this archive")
+    args = parser.parse_args(argv)
+
+    runner = SelfPlayRunner(args.workers, pieces_root=args.pieces)
+    wins = {'white': 0, 'black': 0, None: 0}
+    durations, failures = [], 0
+    start = time.perf_counter()
+    writer = ArchiveWriter(args.archive) if args.archive is not None else None
+    try:
+        # Archived in game_id order, so archive ids follow the specs whichever worker finished first
+        for outcome in in_game_id_order(runner.run(match_specs(args.games, args.white, args.black,
+                                                               args.seed, args.max_time_ms))):
+            if outcome.error is not None:
+                failures += 1
+                print(f"match {outcome.game_id} (seed {outcome.seed}) failed: {outcome.error}", file=sys.stderr)
+                continue
+            wins[outcome.winner] += 1
+            durations.append(outcome.duration_ms)
+            if writer is not None:
+                writer.append(outcome.result)
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - start
+
+    played = len(durations)
+    print(f"{played} matches on {runner.workers} workers in {elapsed:.1f} s ({played / elapsed:.2f} matches/s)")
+    print(f"white {wins['white']}  black {wins['black']}  undecided {wins[None]}  failed {failures}")
+    if played:
+        print(f"mean duration {sum(durations) / played / 1000:.1f} s of game time")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
+import argparse
 from pathlib import Path
 from src.core.board import Board
 from src.graphics.img import Img
 from src.graphics.screen import Screen
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bot', choices=['white', 'black'], help="let the computer play this color")
+    parser.add_argument('--bot-budget-ms', type=float, default=5.0, help="search time per bot decision")
+    args = parser.parse_args()
+
     base_path = Path(__file__).resolve().parent
     pieces_root = base_path.parent / "PIECES"
     placement_csv = base_path / "board.csv"
@@ -23,4 +29,7 @@ if __name__ == "__main__":
 
     from src.core.game import Game
     game = Game(screen, board, pieces_root, placement_csv, sounds_root)
+    if args.bot is not None:
+        from src.ai.bot import BotPlayer
+        game.attach_bot(BotPlayer(game, 'W' if args.bot == 'white' else 'B', budget_ms=args.bot_budget_ms))
     game.run()
@@ -0,0 +1,148 @@
+import logging
+import pathlib
+import threading
+import wave
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+logger = logging.getLogger(__name__)
+
+
+def decode_wav(path: pathlib.Path, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS) -> np.ndarray:
+    """16-bit PCM WAV as float32 frames in [-1, 1], resampled and up/down-mixed to the mixer format."""
+    with wave.open(str(path), 'rb') as f:
+        if f.getsampwidth() != 2:
+            raise ValueError(f"{path} is {8 * f.getsampwidth()}-bit, only 16-bit PCM is supported")
+        n_channels, rate = f.getnchannels(), f.getframerate()
+        pcm = np.frombuffer(f.readframes(f.getnframes()), dtype='<i2').reshape(-1, n_channels)
+    samples = pcm.astype(np.float32) / 32768
+    if rate != sample_rate:
+        n_out = int(round(len(samples) * sample_rate / rate))
+        positions = np.arange(n_out) * (rate / sample_rate)
+        source = np.arange(len(samples))
+        samples = np.stack([np.interp(positions, source, samples[:, c]) for c in range(n_channels)], axis=1)
+    if n_channels != channels:
+        samples = np.repeat(samples.mean(axis=1, keepdims=True), channels, axis=1)
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+
+class SoundBank:
+    """Every WAV of a sounds folder, decoded once; sounds are looked up by file name, ignoring case."""
+
+    def __init__(self, sounds: Dict[str, np.ndarray]):
+        self._sounds = {name.lower(): samples for name, samples in sounds.items()}
+
+    @classmethod
+    def load(cls, sounds_root: pathlib.Path, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS) -> "SoundBank":
+        return cls({path.name: decode_wav(path, sample_rate, channels)
+                    for path in sorted(pathlib.Path(sounds_root).iterdir()) if path.suffix.lower() == '.wav'})
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._sounds
+
+    def get(self, name: str) -> np.ndarray:
+        try:
+            return self._sounds[name.lower()]
+        except KeyError:
+            raise KeyError(f"No sound {name!r} in the bank") from None
+
+
+class _Voice:
+    __slots__ = ('samples', 'position', 'gain')
+
+    def __init__(self, samples: np.ndarray, gain: float):
+        self.samples = samples
+        self.position = 0
+        self.gain = gain
+
+
+class Mixer:
+    """
+    Mixes every playing sound into one stream on a single worker thread. play() only queues
+    a voice, so it is cheap to call from the game loop. At most max_voices sounds play at
+    once; starting another one cuts off the oldest. The sink decides the pace: a device sink
+    blocks in real time, a null or file sink takes blocks as fast as they are mixed.
+    """
+
+    def __init__(self, bank: SoundBank, sink, max_voices: int = 8, block_frames: int = 512,
+                 channels: int = CHANNELS):
+        self.bank = bank
+        self.max_voices = max_voices
+        self.block_frames = block_frames
+        self.channels = channels
+        self.stolen = 0  # voices cut off to respect max_voices
+        self.missing: Set[str] = set()  # requested sounds the bank does not have, each warned about once
+        self._sink = sink
+        self._voices: List[_Voice] = []
+        self._wake = threading.Condition()
+        self._running = False
+        self._worker: Optional[threading.Thread] = None
+
+    def play(self, name: str, gain: float = 1.0):
+        """Start a sound; one the bank does not have is skipped, so a missing asset never stops the game."""
+        if name not in self.bank:
+            if name.lower() not in self.missing:
+                self.missing.add(name.lower())
+                logger.warning("No sound %r in the bank, skipping it", name)
+            return
+        voice = _Voice(self.bank.get(name), gain)
+        with self._wake:
+            if len(self._voices) >= self.max_voices:
+                self._voices.pop(0)
+                self.stolen += 1
+            self._voices.append(voice)
+            self._wake.notify()
+
+    def active_voices(self) -> int:
+        with self._wake:
+            return len(self._voices)
+
+    def render(self, frames: int) -> np.ndarray:
+        """Mix the next `frames` frames of every voice as int16, retiring voices that ended."""
+        mix = np.zeros((frames, self.channels), dtype=np.float32)
+        with self._wake:
+            voices = list(self._voices)
+        for voice in voices:
+            chunk = voice.samples[voice.position:voice.position + frames]
+            if voice.gain == 1.0:
+                mix[:len(chunk)] += chunk
+            else:
+                mix[:len(chunk)] += chunk * voice.gain
+            voice.position += len(chunk)
+        with self._wake:
+            self._voices = [v for v in self._voices if v.position < len(v.samples)]
+            self._wake.notify_all()
+        np.clip(mix, -1.0, 1.0, out=mix)
+        return (mix * 32767).astype(np.int16)
+
+    def start(self):
+        if self._worker is not None:
+            return
+        self._running = True
+        self._worker = threading.Thread(target=self._mix_loop, name="audio-mixer", daemon=True)
+        self._worker.start()
+
+    def close(self, drain: bool = False):
+        """Stop mixing and close the sink; with drain, sounds still playing are finished first."""
+        with self._wake:
+            while drain and self._voices and self._worker is not None:
+                self._wake.wait()
+            self._running = False
+            self._wake.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        self._sink.close()
+
+    def _mix_loop(self):
+        while True:
+            with self._wake:
+                while self._running and not self._voices:
+                    self._wake.wait()
+                if not self._running:
+                    return
+            self._sink.write(self.render(self.block_frames))
@@ -0,0 +1,65 @@
+import pathlib
+import wave
+
+import numpy as np
+
+
+class NullSink:
+    """Discards the mix; for headless runs. Counts the frames it was given."""
+
+    def __init__(self):
+        self.frames_written = 0
+
+    def write(self, block: np.ndarray):
+        self.frames_written += len(block)
+
+    def close(self):
+        pass
+
+
+class FileSink:
+    """
+    Writes the mix to a 16-bit WAV file. Only mixed audio is written: the silence between
+    sounds is not, so the file is the sequence of everything that played.
+    """
+
+    def __init__(self, path: pathlib.Path, sample_rate: int, channels: int):
+        self.path = pathlib.Path(path)
+        self._file = wave.open(str(self.path), 'wb')
+        self._file.setnchannels(channels)
+        self._file.setsampwidth(2)
+        self._file.setframerate(sample_rate)
+
+    def write(self, block: np.ndarray):
+        self._file.writeframes(block.astype('<i2', copy=False).tobytes())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class DeviceSink:
+    """Plays the mix on the default output device; writes block until the device takes the audio."""
+
+    def __init__(self, sample_rate: int, channels: int):
+        import sounddevice  # optional: only needed when sound is actually played
+
+        self._stream = sounddevice.OutputStream(samplerate=sample_rate, channels=channels, dtype='int16')
+        self._stream.start()
+
+    def write(self, block: np.ndarray):
+        self._stream.write(block)
+
+    def close(self):
+        self._stream.stop()
+        self._stream.close()
+
+
+def default_sink(sample_rate: int, channels: int):
+    """The output device when one can be opened, otherwise a NullSink so the game still runs silently."""
+    try:
+        return DeviceSink(sample_rate, channels)
+    except Exception as e:  # sounddevice missing, no PortAudio or no output device
+        print(f"Sound disabled: {e}")
+        return NullSink()
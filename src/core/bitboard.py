@@ -0,0 +1,146 @@
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# (d_row, d_col) for the four orthogonal and four diagonal rays
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+_DIRECTION_INDEX = {d: i for i, d in enumerate(DIRECTIONS)}
+
+
+def _sign(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+
+class BoardGeometry:
+    """
+    Square numbering and precomputed ray masks for a W x H board.
+    Square index is row * W + col, and a mask is a Python int with one bit per square,
+    so boards larger than 8x8 simply use wider masks.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.full = (1 << self.size) - 1
+        # rays[d][sq]: every square from sq (exclusive) to the edge in direction d
+        self.rays: List[List[int]] = [[0] * self.size for _ in DIRECTIONS]
+        # off_ray[sq]: squares not on any ray from sq (knight-like jumps, no path to check)
+        self.off_ray: List[int] = [0] * self.size
+        for sq in range(self.size):
+            row, col = divmod(sq, width)
+            aligned = 1 << sq
+            for d, (dr, dc) in enumerate(DIRECTIONS):
+                mask = 0
+                r, c = row + dr, col + dc
+                while 0 <= r < height and 0 <= c < width:
+                    mask |= 1 << (r * width + c)
+                    r, c = r + dr, c + dc
+                self.rays[d][sq] = mask
+                aligned |= mask
+            self.off_ray[sq] = self.full & ~aligned
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_board(width: int, height: int) -> "BoardGeometry":
+        """Shared geometry per board size; the tables are immutable once built."""
+        return BoardGeometry(width, height)
+
+    def square(self, cell: Tuple[int, int]) -> int:
+        return cell[0] * self.width + cell[1]
+
+    def cell(self, square: int) -> Tuple[int, int]:
+        return divmod(square, self.width)
+
+    def bit(self, cell: Tuple[int, int]) -> int:
+        return 1 << (cell[0] * self.width + cell[1])
+
+    def mask_of(self, cells: Iterable[Tuple[int, int]]) -> int:
+        mask = 0
+        for cell in cells:
+            mask |= self.bit(cell)
+        return mask
+
+    def squares(self, mask: int) -> Iterator[int]:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def cells(self, mask: int) -> List[Tuple[int, int]]:
+        return [divmod(sq, self.width) for sq in self.squares(mask)]
+
+    def direction(self, src: Tuple[int, int], dst: Tuple[int, int]) -> int:
+        """Index into DIRECTIONS of the ray from src through dst, or -1 if they are not aligned."""
+        dr, dc = dst[0] - src[0], dst[1] - src[1]
+        if (dr == 0 and dc == 0) or (dr != 0 and dc != 0 and abs(dr) != abs(dc)):
+            return -1
+        return _DIRECTION_INDEX[(_sign(dr), _sign(dc))]
+
+    def between(self, src: Tuple[int, int], dst: Tuple[int, int]) -> int:
+        """Squares strictly between src and dst on a rank, file or diagonal; 0 if not aligned."""
+        d = self.direction(src, dst)
+        if d < 0:
+            return 0
+        opposite = _DIRECTION_INDEX[(-DIRECTIONS[d][0], -DIRECTIONS[d][1])]
+        return self.rays[d][self.square(src)] & self.rays[opposite][self.square(dst)]
+
+    def reachable(self, src: Tuple[int, int], occupied: int) -> int:
+        """
+        Squares a piece on src can reach without passing over an occupied square: each ray up
+        to and including its first blocker, plus every off-ray square (which has no path).
+        """
+        sq = self.square(src)
+        result = self.off_ray[sq]
+        for d, (dr, dc) in enumerate(DIRECTIONS):
+            ray = self.rays[d][sq]
+            blockers = ray & occupied
+            if blockers:
+                if dr * self.width + dc > 0:
+                    nearest = (blockers & -blockers).bit_length() - 1
+                else:
+                    nearest = blockers.bit_length() - 1
+                ray &= ~self.rays[d][nearest]
+            result |= ray
+        return result
+
+    def path_cells(self, src: Tuple[int, int], dst: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Cells strictly between src and dst, ordered from src towards dst."""
+        path = self.cells(self.between(src, dst))
+        if self.square(dst) < self.square(src):
+            path.reverse()
+        return path
+
+
+class Bitboards:
+    """Occupancy masks per color and per piece type, kept in sync by Occupancy."""
+
+    def __init__(self, geometry: BoardGeometry):
+        self.geometry = geometry
+        self.occupied = 0
+        self.by_color: Dict[str, int] = {'W': 0, 'B': 0}
+        self.by_type: Dict[str, int] = {}
+
+    def add(self, piece_id: str, cell: Tuple[int, int]):
+        bit = self.geometry.bit(cell)
+        self.occupied |= bit
+        self.by_color[piece_id[1]] = self.by_color.get(piece_id[1], 0) | bit
+        self.by_type[piece_id[0]] = self.by_type.get(piece_id[0], 0) | bit
+
+    def remove(self, piece_id: str, cell: Tuple[int, int]):
+        clear = ~self.geometry.bit(cell)
+        self.occupied &= clear
+        self.by_color[piece_id[1]] = self.by_color.get(piece_id[1], 0) & clear
+        self.by_type[piece_id[0]] = self.by_type.get(piece_id[0], 0) & clear
+
+    def pieces_of(self, piece_type: str, color: str) -> int:
+        return self.by_type.get(piece_type, 0) & self.by_color.get(color, 0)
+
+    def is_path_clear(self, src: Tuple[int, int], dst: Tuple[int, int]) -> bool:
+        return not (self.geometry.between(src, dst) & self.occupied)
+
+    def reachable(self, src: Tuple[int, int]) -> int:
+        return self.geometry.reachable(src, self.occupied)
+
+    def legal_destinations(self, src: Tuple[int, int], moves_mask: int, color: str) -> int:
+        """Squares in moves_mask that are reachable from src and not held by the mover's own color."""
+        return moves_mask & self.reachable(src) & ~self.by_color.get(color, 0)
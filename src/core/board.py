@@ -31,15 +31,34 @@ class Board:
         y = row * self.cell_H_pix
         return x, y
 
+    def cell_to_square(self, cell: Tuple[int, int]) -> int:
+        """Square number of a cell, row * W_cells + col: how commands name cells."""
+        return cell[0] * self.W_cells + cell[1]
+
+    def square_to_cell(self, square: int) -> Tuple[int, int]:
+        return divmod(square, self.W_cells)
+
     def algebraic_to_cell(self, notation: str) -> Tuple[int, int]:
         """
-        Converts algebraic notation (e.g., "a1") to board coordinates.
-        Example: "a1" -> (7, 0) if (0,0) is top-left
+        Converts algebraic notation (e.g., "a1") to board coordinates, (0, 0) being top-left.
+        Files run a..z, then aa, ab, ...; ranks count up from 1 on the bottom row, so on
+        an 8x8 board "a1" -> (7, 0) and on a 12x10 board "l10" -> (0, 11).
         """
-        col = ord(notation[0].lower()) - ord('a')
-        row = 8 - int(notation[1])  # Assuming board is 8x8
+        letters = notation.rstrip('0123456789').lower()
+        digits = notation[len(letters):]
+        if not letters or not letters.isalpha() or not digits:
+            raise ValueError(f"Not a square: {notation!r}")
+        col = 0
+        for letter in letters:
+            col = col * 26 + ord(letter) - ord('a') + 1
+        row, col = self.H_cells - int(digits), col - 1
+        if not (0 <= row < self.H_cells and 0 <= col < self.W_cells):
+            raise ValueError(f"{notation!r} is off the {self.W_cells}x{self.H_cells} board")
         return row, col
 
+    def algebraic_to_square(self, notation: str) -> int:
+        return self.cell_to_square(self.algebraic_to_cell(notation))
+
     def world_to_cell(self, pos: Tuple[float, float]) -> Tuple[int, int]:
         x, y = pos
         col = int(x // self.cell_W_pix)
@@ -48,9 +67,15 @@ class Board:
 
     def cell_to_algebraic(self, cell: Tuple[int, int]) -> str:
         row, col = cell
-        col_letter = chr(ord('a') + col)
-        row_number = str(8 - row)  # assuming 8x8 board
-        return f"{col_letter}{row_number}"
+        letters = ''
+        col += 1
+        while col:
+            col, letter = divmod(col - 1, 26)
+            letters = chr(ord('a') + letter) + letters
+        return f"{letters}{self.H_cells - row}"
+
+    def square_to_algebraic(self, square: int) -> str:
+        return self.cell_to_algebraic(self.square_to_cell(square))
 
     def is_valid_cell(self, x: int, y: int) -> bool:
         return x % self.cell_W_pix == 0 and y % self.cell_H_pix == 0
\ No newline at end of file
@@ -0,0 +1,44 @@
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    """Source of game time in milliseconds since the clock was started."""
+
+    def start(self):
+        pass
+
+    @abstractmethod
+    def now_ms(self) -> int:
+        pass
+
+
+class MonotonicClock(Clock):
+    """Wall clock used by the interactive game."""
+
+    def __init__(self):
+        self._start = time.monotonic()
+
+    def start(self):
+        self._start = time.monotonic()
+
+    def now_ms(self) -> int:
+        return int((time.monotonic() - self._start) * 1000)
+
+
+class SimulatedClock(Clock):
+    """Virtual clock that only moves when advanced, for headless runs."""
+
+    def __init__(self, start_ms: int = 0):
+        self._now_ms = start_ms
+
+    def advance(self, delta_ms: int):
+        if delta_ms < 0:
+            raise ValueError(f"Cannot move a clock backwards: {delta_ms}")
+        self._now_ms += delta_ms
+
+    def advance_to(self, target_ms: int):
+        self.advance(target_ms - self._now_ms)
+
+    def now_ms(self) -> int:
+        return self._now_ms
@@ -1,36 +1,87 @@
 import csv
+import heapq
+import itertools
+import logging
+import math
 import pathlib
-import time
 import queue
-import cv2
-from typing import Dict, Tuple, Optional, Callable
-import threading
-import keyboard
-from board import Board
+from typing import Dict, Iterable, List, Tuple, Optional, Callable, TYPE_CHECKING
+from src.core.board import Board
 from src.input.command import Command
+from src.enums.dispatch_modes import DispatchModes
 from src.enums.events_names import EventsNames
 from src.infrastructure.log import Log
 from src.pieces.piece import Piece
 from src.core.score import Score
 from src.graphics.screen import Screen
-from src.input.event_bus import event_bus, Event
+from src.input.event_bus import CaptureEvent, EventBus, SoundEvent, event_bus
+from src.input.scripted_source import ScriptedCommandSource
+from src.input.keyboard_input import KeyboardInput
+from src.enums.input_actions import InputActions
 from src.pieces.piece_factory import PieceFactory
-from playsound import playsound
+from src.pieces.piece_store import PieceStore
+from src.core.clock import Clock, MonotonicClock, SimulatedClock
+from src.core.occupancy import Occupancy
+from src.core.snapshot import PieceRecord, Snapshot
+from src.infrastructure.journal import CommandJournal, JournalEntry
+from src.infrastructure.archive import GameResult
+from src.infrastructure.profiler import TickProfiler
+from src.enums.profile_metrics import ProfileMetrics
+from src.core.bitboard import BoardGeometry, Bitboards
+from src.physics.collisions import CollisionSweep
+from src.graphics.board_renderer import BoardRenderer
+from src.audio.mixer import CHANNELS, SAMPLE_RATE, Mixer, SoundBank
+from src.audio.sinks import default_sink
 
 from src.enums.states_names import StatesNames
 
+if TYPE_CHECKING:
+    from src.ai.bot import BotPlayer
+
+# (d_row, d_col) a focus cursor moves per direction action
+_FOCUS_STEPS = {
+    InputActions.UP: (-1, 0),
+    InputActions.DOWN: (1, 0),
+    InputActions.LEFT: (0, -1),
+    InputActions.RIGHT: (0, 1),
+}
+
+logger = logging.getLogger(__name__)
+
 
 class Game:
-    def __init__(self, screen: Screen, board: Board, pieces_root: pathlib.Path, placement_csv: pathlib.Path, sounds_root: pathlib.Path):
+    def __init__(self, screen: Optional[Screen], board: Board, pieces_root: pathlib.Path, placement_csv: pathlib.Path,
+                 sounds_root: Optional[pathlib.Path], clock: Optional[Clock] = None, bus: Optional[EventBus] = None,
+                 tick_ms: int = 16, journal: Optional[CommandJournal] = None, audio: Optional[Mixer] = None,
+                 profiler: Optional[TickProfiler] = None, piece_store: Optional[PieceStore] = None):
+        if journal is not None and journal.tick_ms != tick_ms:
+            raise ValueError(f"Journal ticks every {journal.tick_ms} ms, the game every {tick_ms} ms")
         self.screen = screen
         self._sounds_root = sounds_root
+        self._audio = audio  # built from sounds_root when the live game starts
+        self.profiler = profiler  # None keeps instrumentation off
         self.board = board
         self.user_input_queue = queue.Queue()
-        self.start_time = 0
-        self.piece_factory = PieceFactory(self.board, pieces_root)
+        self.clock: Clock = clock if clock is not None else MonotonicClock()
+        self.tick_ms = tick_ms
+        self._journal = journal  # records accepted commands and keyframes; closed when the match ends
+        self.accepted_commands: List[JournalEntry] = []  # every command that moved a piece, in order
+        self._bus = bus if bus is not None else event_bus
+        self.piece_factory = PieceFactory(self.board, pieces_root, self._bus)
         self.pieces: Dict[str, Piece] = {}
-        self.pos_to_piece: Dict[Tuple[int, int], Piece] = {}
+        self.occupancy = self._new_occupancy()
+        self._moving: Dict[str, Piece] = {}  # pieces whose cell may change this tick
+        self._collisions = CollisionSweep(BoardGeometry.for_board(self.board.W_cells, self.board.H_cells))
+        # (due ms, sequence, piece id) of the next update each piece needs; only the latest
+        # sequence per piece in _wake_sequence is live, older heap entries are skipped
+        self._wakeups: List[Tuple[int, int, str]] = []
+        self._wake_sequence: Dict[str, int] = {}
+        self._wake_counter = itertools.count()
+        # With a store, due updates, positions and animation frames are computed for all pieces at once
+        self._store = piece_store
         self._current_board = None
+        self._renderer: Optional[BoardRenderer] = None  # built on first draw, never in headless runs
+        self._bots: List["BotPlayer"] = []  # computer players fed a snapshot at the end of a tick
         self._load_pieces_from_csv(placement_csv)
         self.focus_cell = (0, 0)
         self._selection_mode = "source"
@@ -41,7 +92,7 @@ class Game:
         self._selection_mode2 = "source"
         self._selected_source2: Optional[Tuple[int, int]] = None
 
-        self._lock = threading.Lock()
+        self._input: Optional[KeyboardInput] = None  # built by start_keyboard_thread; headless games never need it
         self._running = True
 
         self.black_log: Log = Log()
@@ -51,11 +102,16 @@ class Game:
         self.subscriptions(sounds_root)
 
     def subscriptions(self, sounds_root):
-        event_bus.subscribe(EventsNames.BLACK_MOVE, self.black_log.update_log)
-        event_bus.subscribe(EventsNames.WHITE_MOVE, self.white_log.update_log)
+        # Logs, scores and sounds are consumed in the flush at the end of each tick, not inside its updates
+        deferred = DispatchModes.DEFERRED
+        self._bus.subscribe(EventsNames.BLACK_MOVE, self.black_log.update_log, deferred)
+        self._bus.subscribe(EventsNames.WHITE_MOVE, self.white_log.update_log, deferred)
+
+        self._bus.subscribe(EventsNames.BLACK_CAPTURE, self.black_score.update_score, deferred)
+        self._bus.subscribe(EventsNames.WHITE_CAPTURE, self.white_score.update_score, deferred)
 
-        event_bus.subscribe(EventsNames.BLACK_CAPTURE, self.black_score.update_score)
-        event_bus.subscribe(EventsNames.WHITE_CAPTURE, self.white_score.update_score)
+        if sounds_root is None and self._audio is None:
+            return
 
         for event in [
             EventsNames.BLACK_MOVE,
@@ -65,13 +121,34 @@ class Game:
             EventsNames.JUMP,
             EventsNames.VICTORY,
         ]:
-            event_bus.subscribe(event, self.play_sounds)
+            self._bus.subscribe(event, self.play_sounds, deferred)
+
+    def play_sounds(self, event: SoundEvent):
+        # Only queues a voice; the mixer's own thread does the mixing and output
+        if self._audio is not None:
+            self._audio.play(event.sound)
+
+    def _start_audio(self):
+        if self._audio is None and self._sounds_root is not None:
+            self._audio = Mixer(SoundBank.load(self._sounds_root), default_sink(SAMPLE_RATE, CHANNELS))
+        if self._audio is not None:
+            self._audio.start()
+
+    def _stop_audio(self):
+        if self._audio is not None:
+            self._audio.close(drain=True)
+
+    def attach_bot(self, bot: "BotPlayer"):
+        """Let a computer player take part; run() and run_headless() start and stop it."""
+        self._bots.append(bot)
 
-    def play_sounds(self, event : Event):
-        def _play():
-            playsound(str(self._sounds_root / event.data['sound']))
+    def _start_bots(self):
+        for bot in self._bots:
+            bot.start()
 
-        threading.Thread(target=_play, daemon=True).start()
+    def _stop_bots(self):
+        for bot in self._bots:
+            bot.stop()
 
     def _load_pieces_from_csv(self, csv_path: pathlib.Path):
         with csv_path.open() as f:
@@ -83,62 +160,66 @@ class Game:
                         continue
                     cell = (row_idx, col_idx)
                     piece = self.piece_factory.create_piece(code, cell)
-                    self.pieces[piece.get_id()] = piece
-                    self.pos_to_piece[cell] = piece
+                    self._add_piece(piece, self.game_time_ms())
+                    self.occupancy.place(piece, cell)
+
+    def _add_piece(self, piece: Piece, now: int):
+        self.pieces[piece.get_id()] = piece
+        if self._store is not None:
+            piece.attach(self._store, now)
+
+    def _new_occupancy(self) -> Occupancy:
+        return Occupancy(Bitboards(BoardGeometry.for_board(self.board.W_cells, self.board.H_cells)))
+
+    @property
+    def pos_to_piece(self) -> Dict[Tuple[int, int], Piece]:
+        return self.occupancy.cell_to_piece
+
+    @pos_to_piece.setter
+    def pos_to_piece(self, mapping: Dict[Tuple[int, int], Piece]):
+        self.occupancy = self._new_occupancy()
+        for cell, piece in mapping.items():
+            self.occupancy.place(piece, cell)
 
     def game_time_ms(self) -> int:
-        return int((time.monotonic() - self.start_time) * 1000)
+        return self.clock.now_ms()
 
     def clone_board(self) -> Board:
         return self.board.clone()
 
     def start_keyboard_thread(self):
-        def keyboard_loop():
-            while self._running:
-                time.sleep(0.05)
-                with self._lock:
-                    dy, dx = 0, 0
-                    if keyboard.is_pressed('esc'):
-                        self._running = False
-                        break
-                    if keyboard.is_pressed('left'):
-                        dx = -1
-                    elif keyboard.is_pressed('right'):
-                        dx = 1
-                    if keyboard.is_pressed('up'):
-                        dy = -1
-                    elif keyboard.is_pressed('down'):
-                        dy = 1
-                    if dx != 0 or dy != 0:
-                        h, w = self.board.H_cells, self.board.W_cells
-                        y, x = self.focus_cell
-                        self.focus_cell = ((y + dy) % h, (x + dx) % w)
-                        time.sleep(0.2)
-                    if keyboard.is_pressed('enter'):
-                        self._on_enter_pressed()
-                        time.sleep(0.2)
-
-                    dy2, dx2 = 0, 0
-                    if keyboard.is_pressed('a'):
-                        dx2 = -1
-                    elif keyboard.is_pressed('d'):
-                        dx2 = 1
-                    if keyboard.is_pressed('w'):
-                        dy2 = -1
-                    elif keyboard.is_pressed('s'):
-                        dy2 = 1
-                    if dx2 != 0 or dy2 != 0:
-                        h, w = self.board.H_cells, self.board.W_cells
-                        y2, x2 = self.focus_cell2
-                        self.focus_cell2 = ((y2 + dy2) % h, (x2 + dx2) % w)
-                        time.sleep(0.2)
-                    if keyboard.is_pressed('space'):
-                        self._on_space_pressed()
-                        time.sleep(0.2)
-        threading.Thread(target=keyboard_loop, daemon=True).start()
+        """Start listening for key events; they are applied on the game loop by _handle_input."""
+        import keyboard  # the keyboard backend is only loaded by interactive games
+        if self._input is None:
+            self._input = KeyboardInput(self.clock, keyboard)
+        self._input.start()
+
+    def _handle_input(self, now: int):
+        """Apply every key action received since the previous frame."""
+        if self._input is None:
+            return
+        for action in self._input.poll(now):
+            if action.action is InputActions.QUIT:
+                self._running = False
+                return
+            if action.action is InputActions.SELECT:
+                if action.player == 1:
+                    self._on_enter_pressed()
+                else:
+                    self._on_space_pressed()
+                continue
+            dy, dx = _FOCUS_STEPS[action.action]
+            h, w = self.board.H_cells, self.board.W_cells
+            if action.player == 1:
+                y, x = self.focus_cell
+                self.focus_cell = ((y + dy) % h, (x + dx) % w)
+            else:
+                y2, x2 = self.focus_cell2
+                self.focus_cell2 = ((y2 + dy) % h, (x2 + dx) % w)
 
     def run(self):
-        self.start_time = time.monotonic()
+        import cv2  # the window is only needed by interactive games
+        self.clock.start()
         self.screen.reset()
         self.screen.show("Chess")
         while True:
@@ -147,132 +228,415 @@ class Game:
                 break
 
         self.start_keyboard_thread()
+        self._start_audio()
+        self._start_bots()
 
-        start_ms = self.game_time_ms()
-        for piece in self.pieces.values():
-            piece.reset(start_ms)
+        sim_ms = self.game_time_ms()
+        self.reset_pieces(sim_ms)
 
         while self._running and not self._is_win():
             now = self.game_time_ms()
-
-            for piece in self.pieces.values():
-                piece.update(now)
-
-            self._update_position_mapping()
-
-            while not self.user_input_queue.empty():
-                cmd = self.user_input_queue.get()
-                src_cell = self.board.algebraic_to_cell(cmd.params[0])
-                dst_cell = self.board.algebraic_to_cell(cmd.params[1])
-
-                if src_cell not in self.pos_to_piece:
-                    print("Source cell empty. Command ignored.")
-                    continue
-                moving_piece = self.pos_to_piece[src_cell]
-
-                dst_empty : bool = True
-                if dst_cell in self.pos_to_piece:
-                    target_piece = self.pos_to_piece[dst_cell]
-                    if target_piece.get_id()[1] == moving_piece.get_id()[1] and target_piece.get_id() != moving_piece.get_id():
-                        print("Move blocked: Destination occupied by friendly piece.")
-                        continue
-                    else:
-                        dst_empty = False
-
-                if not self.is_path_clean(dst_cell, src_cell):
-                    print("Move blocked: Path is obstructed.")
-                    continue
-
-                self.pos_to_piece[src_cell].on_command(cmd, now, dst_empty)
+            self._handle_input(now)
+            # The simulation advances on a fixed tick grid, so a journaled match replays identically
+            while sim_ms <= now and not self._is_win():
+                self.tick(sim_ms)
+                sim_ms += self.tick_ms
 
             self._draw()
 
-            self.screen.show("Chess")
+            profiler = self.profiler
+            if profiler is not None and profiler.overlay:
+                self.screen.show("Chess", profiler.stats_lines())
+            else:
+                self.screen.show("Chess")
             cv2.waitKey(1)
+            if profiler is not None:
+                profiler.lap(ProfileMetrics.SHOW)
 
         self._announce_win()
         self._running = False
+        if self._input is not None:
+            self._input.stop()
+        self._stop_bots()
+        self._stop_audio()
+        self._close_journal(sim_ms)
         cv2.destroyAllWindows()
 
-    def is_path_clean(self, dst_cell, src_cell):
-        dx = dst_cell[1] - src_cell[1]
-        dy = dst_cell[0] - src_cell[0]
-        if dx != 0:
-            step_x = dx // abs(dx)
-        else:
-            step_x = 0
-        if dy != 0:
-            step_y = dy // abs(dy)
+    def run_headless(self, source: ScriptedCommandSource, tick_ms: Optional[int] = None,
+                     max_time_ms: Optional[int] = None, skip_idle: bool = True) -> Optional[str]:
+        """
+        Play the match without a window or keyboard, advancing the simulated clock by
+        tick_ms (default: the game's tick) per step. Sounds only go to a Mixer passed in
+        as `audio`. Returns the winner's name, or None if max_time_ms was reached first.
+
+        With skip_idle, when the source tells when its next command is due (next_timestamp)
+        and no bot is attached, the clock jumps over the ticks in which nothing can happen.
+        It stays on the same tick grid, so the match plays out exactly as tick by tick.
+        """
+        if not isinstance(self.clock, SimulatedClock):
+            raise TypeError("run_headless requires a SimulatedClock")
+        tick_ms = self.tick_ms if tick_ms is None else tick_ms
+        if tick_ms <= 0:
+            raise ValueError(f"tick_ms must be positive, got {tick_ms}")
+        if self._journal is not None and tick_ms != self._journal.tick_ms:
+            raise ValueError(f"Journal ticks every {self._journal.tick_ms} ms, not {tick_ms} ms")
+
+        self.reset_pieces(self.game_time_ms())
+        if self._audio is not None:
+            self._audio.start()
+        self._start_bots()
+        skip_idle = skip_idle and not self._bots and hasattr(source, 'next_timestamp')
+
+        while self._running and not self._is_win():
+            now = self.game_time_ms()
+            if max_time_ms is not None and now >= max_time_ms:
+                self._stop_bots()
+                self._close_journal(now)
+                self._stop_audio()
+                return None
+            self.step(source.poll(now), tick_ms)
+            if skip_idle and not self._is_win():
+                self._skip_idle_ticks(source.next_timestamp(), tick_ms, max_time_ms)
+
+        self._stop_bots()
+        self._close_journal(self.game_time_ms())
+        if not self._is_win():
+            self._stop_audio()
+            return None
+        self._announce_win()
+        self._stop_audio()
+        return self._winner_name()
+
+    def _skip_idle_ticks(self, next_command_ms: Optional[int], tick_ms: int, max_time_ms: Optional[int]):
+        """Advance the clock to the first tick at or after the next thing that can happen."""
+        upcoming = [t for t in (self.next_event_ms(), next_command_ms, max_time_ms) if t is not None]
+        if not upcoming:
+            return
+        now = self.game_time_ms()
+        idle_ticks = math.ceil((min(upcoming) - now) / tick_ms)
+        if idle_ticks > 0:
+            self.clock.advance(idle_ticks * tick_ms)
+
+    def reset_pieces(self, now: int):
+        """Put every piece into its starting state at game time `now`."""
+        for piece in self.pieces.values():
+            piece.reset(now)
+            self._schedule(piece, now)
+
+    def step(self, commands: Iterable[Command] = (), tick_ms: Optional[int] = None):
+        """One headless tick: queue commands, tick at the current time, then advance the simulated clock."""
+        for cmd in commands:
+            self.user_input_queue.put(cmd)
+        self.tick(self.game_time_ms())
+        self.clock.advance(self.tick_ms if tick_ms is None else tick_ms)
+
+    def tick(self, now: int):
+        """Advance every piece to `now`, resolve captures and apply the queued commands."""
+        if self._journal is not None and self._journal.keyframe_due(now):
+            self._journal.write_keyframe(self.snapshot(now))
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark()
+        updated = self._wake(now)
+        if profiler is not None:
+            profiler.lap(ProfileMetrics.UPDATE)
+            profiler.record(ProfileMetrics.PIECES_UPDATED, updated)
+
+        captures = self._update_position_mapping(now)
+        if profiler is not None:
+            profiler.lap(ProfileMetrics.POSITIONS)
+            profiler.record(ProfileMetrics.CAPTURES, captures)
+
+        rejected = self._process_commands(now)
+        self._bus.flush()
+        if profiler is not None:
+            profiler.lap(ProfileMetrics.COMMANDS)
+            profiler.record(ProfileMetrics.COMMANDS_REJECTED, rejected)
+
+        bots = [bot for bot in self._bots if bot.wants_snapshot(now)]
+        if bots:
+            snapshot = self.snapshot(now)
+            for bot in bots:
+                bot.observe(snapshot)
+
+    def _wake(self, now: int) -> int:
+        """Update the pieces whose next update is due by now; returns how many were updated."""
+        # Collected before any is rescheduled: a piece that changed state this tick starts it on the next one
+        due = self._due_pieces(now)
+        for piece in due:
+            piece.update(now)
+            self._schedule(piece, now)
+        return len(due)
+
+    def _due_pieces(self, now: int) -> List[Piece]:
+        if self._store is not None:
+            return [self._store.piece(slot) for slot in self._store.due(now)]
+        due = []
+        wakeups = self._wakeups
+        while wakeups and wakeups[0][0] <= now:
+            _, sequence, piece_id = heapq.heappop(wakeups)
+            if self._wake_sequence.get(piece_id) == sequence and piece_id in self.pieces:
+                due.append(self.pieces[piece_id])
+        return due
+
+    def _schedule(self, piece: Piece, now: int):
+        """
+        Queue the next update piece needs: on the next tick when its physics has yet to take
+        its start time (or already finished), otherwise when its physics finishes. A piece
+        whose physics never finishes, such as an idle one, is not updated at all.
+        """
+        if self._store is not None:
+            self._store.write(piece, now)
+            return
+        physics = piece.state.physics
+        due = now if physics.start_time is None or physics.finished else physics.next_event_ms()
+        piece_id = piece.get_id()
+        if due is None:
+            self._wake_sequence.pop(piece_id, None)
+            return
+        sequence = next(self._wake_counter)
+        self._wake_sequence[piece_id] = sequence
+        heapq.heappush(self._wakeups, (due, sequence, piece_id))
+
+    def next_event_ms(self) -> Optional[int]:
+        """Earliest game time a piece changes state or crosses into a cell, None while all are idle."""
+        if self._store is not None:
+            next_update = self._store.next_due_ms()
         else:
-            step_y = 0
-        if (step_x != 0 or step_y != 0) and (abs(dx) == abs(dy) or dx == 0 or dy == 0):
-            cur_cell = (src_cell[0] + step_y, src_cell[1] + step_x)
-            while cur_cell != dst_cell:
-                if cur_cell in self.pos_to_piece:
-                    return False
-                cur_cell = (cur_cell[0] + step_y, cur_cell[1] + step_x)
-        return True
+            next_update = self._wakeups[0][0] if self._wakeups else None
+        upcoming = [t for t in (next_update,
+                                self._collisions.next_crossing_ms()) if t is not None]
+        return min(upcoming) if upcoming else None
+
+    def _process_commands(self, now: int) -> int:
+        """Apply the queued commands; returns how many were rejected."""
+        rejected = 0
+        while not self.user_input_queue.empty():
+            cmd = self.user_input_queue.get()
+            src_cell = self.board.square_to_cell(cmd.params[0])
+            dst_cell = self.board.square_to_cell(cmd.params[1])
+
+            if src_cell not in self.pos_to_piece:
+                logger.debug("Source cell empty. Command ignored.")
+                rejected += 1
+                continue
+            moving_piece = self.pos_to_piece[src_cell]
+
+            dst_empty : bool = True
+            if dst_cell in self.pos_to_piece:
+                target_piece = self.pos_to_piece[dst_cell]
+                if target_piece.get_id()[1] == moving_piece.get_id()[1] and target_piece.get_id() != moving_piece.get_id():
+                    logger.debug("Move blocked: Destination occupied by friendly piece.")
+                    rejected += 1
+                    continue
+                else:
+                    dst_empty = False
+
+            if not self.is_path_clean(dst_cell, src_cell):
+                logger.debug("Move blocked: Path is obstructed.")
+                rejected += 1
+                continue
+
+            state_before = moving_piece.state
+            moving_piece.on_command(cmd, now, dst_empty)
+            if moving_piece.state is not state_before:
+                self._moving[moving_piece.get_id()] = moving_piece
+                self._schedule(moving_piece, now)
+                entry = JournalEntry.from_command(now, cmd, self.board, moving_piece.get_id())
+                self.accepted_commands.append(entry)
+                if self._journal is not None:
+                    self._journal.append(entry)
+            else:
+                rejected += 1
+        return rejected
+
+    def snapshot(self, time_ms: Optional[int] = None) -> Snapshot:
+        """
+        Everything needed to continue this match elsewhere: time (default: now), scores and
+        every piece's state.
+        """
+        pieces = {}
+        for piece_id, piece in self.pieces.items():
+            state = piece.state
+            physics = state.physics
+            cmd = state.current_command
+            pieces[piece_id] = PieceRecord(
+                piece_id=piece_id,
+                state=state.name,
+                cell=self.occupancy.cell_of(piece),
+                start_cell=tuple(physics.start_cell),
+                target_cell=tuple(physics.get_target_cell()),
+                start_time=physics.start_time,
+                command_time=None if cmd is None else cmd.timestamp,
+                finished=piece.finished_states(),
+            )
+        return Snapshot(self.game_time_ms() if time_ms is None else time_ms, self.board.W_cells, self.board.H_cells,
+                        self.white_score.score, self.black_score.score, pieces)
+
+    def load_snapshot(self, snapshot: Snapshot):
+        """Replace the match state with a snapshot; the game must run on a SimulatedClock not past it."""
+        if not isinstance(self.clock, SimulatedClock):
+            raise TypeError("load_snapshot requires a SimulatedClock")
+        if (snapshot.width, snapshot.height) != (self.board.W_cells, self.board.H_cells):
+            raise ValueError(f"Snapshot is for a {snapshot.width}x{snapshot.height} board")
+        self.clock.advance_to(snapshot.time_ms)
+
+        for piece_id in [pid for pid in self.pieces if pid not in snapshot.pieces]:
+            self._remove_piece(piece_id)
+        for piece_id, record in snapshot.pieces.items():
+            piece = self.pieces.get(piece_id)
+            if piece is None:
+                piece = self.piece_factory.create_piece(piece_id[:2], record.start_cell, piece_id=piece_id)
+                self._add_piece(piece, snapshot.time_ms)
+            cmd = None
+            if record.command_time is not None:
+                target = record.target_cell if record.state in (StatesNames.MOVE, StatesNames.JUMP) else record.start_cell
+                cmd = Command(record.command_time, piece_id, record.state,
+                              (self.board.cell_to_square(record.start_cell), self.board.cell_to_square(target)))
+            piece.restore(record.state, cmd, record.start_cell, record.start_time, record.finished)
+
+        self.pos_to_piece = {record.cell: self.pieces[piece_id]
+                             for piece_id, record in snapshot.pieces.items() if record.cell is not None}
+        self._moving = {pid: piece for pid, piece in self.pieces.items() if self._in_motion(piece)}
+        self._wakeups, self._wake_sequence = [], {}
+        for piece in self.pieces.values():
+            self._schedule(piece, snapshot.time_ms)
+        self._collisions = CollisionSweep(self._collisions.geometry)
+        for piece_id, piece in self._moving.items():
+            if piece.state.name == StatesNames.MOVE and piece.state.physics.start_time is not None:
+                # The snapshot's cells already reflect the sweep of the tick before it
+                self._collisions.resume(piece_id, piece.state.physics, snapshot.time_ms - self.tick_ms)
+        self.white_score.score = snapshot.white_score
+        self.black_score.score = snapshot.black_score
+
+    def result(self) -> GameResult:
+        """Winner, scores and accepted commands of the match so far, ready for a GameArchive."""
+        return GameResult(self.winner(), self.white_score.score, self.black_score.score,
+                          self.game_time_ms(), tuple(self.accepted_commands))
+
+    def _close_journal(self, end_ms: int):
+        if self._journal is not None:
+            self._journal.close(end_ms)
+
+    def is_path_clean(self, dst_cell, src_cell):
+        return self.occupancy.bitboards.is_path_clear(src_cell, dst_cell)
 
     def get_path_cells(self, src: Tuple[int, int], dst: Tuple[int, int]) -> list[Tuple[int, int]]:
-        path = []
-        dx = dst[1] - src[1]
-        dy = dst[0] - src[0]
-        step_x = dx // abs(dx) if dx != 0 else 0
-        step_y = dy // abs(dy) if dy != 0 else 0
-
-        cur = (src[0] + step_y, src[1] + step_x)
-        while cur != dst:
-            path.append(cur)
-            cur = (cur[0] + step_y, cur[1] + step_x)
-        return path
-
-    def _update_position_mapping(self):
-        self.pos_to_piece.clear()
+        return self.occupancy.bitboards.geometry.path_cells(src, dst)
+
+    def legal_destinations(self, src: Tuple[int, int]) -> list[Tuple[int, int]]:
+        """Cells the piece on src may currently be ordered to move to."""
+        piece = self.occupancy.piece_at(src)
+        if piece is None:
+            return []
+        return self.occupancy.legal_destinations(src, piece)
+
+    def _update_position_mapping(self, now: Optional[int] = None) -> int:
+        """
+        Sync the occupancy index with the pieces that are in motion. Idle and resting
+        pieces cannot change cell, so only the pieces in self._moving are inspected and
+        the index is touched only when one of them leaves or enters a cell.
+        Moves are swept: every cell a moving piece entered since the last tick is visited
+        in the order the crossings happened, so pieces cannot pass through each other
+        between frames. Other pieces in motion are placed on the cell they stand on.
+        Returns the number of pieces captured.
+        """
+        now = self.game_time_ms() if now is None else now
         to_remove = set()
         to_promote = []  # Collect here the pawns that need to be promoted to queen
 
-        for piece in list(self.pieces.values()):  # Use list to freeze values during loop
-            x, y = map(int, piece.state.physics.get_pos())
-            if not self.board.is_valid_cell(x, y):
+        sweeping = []
+        for piece in self._moving.values():
+            physics = piece.state.physics
+            if piece.state.name == StatesNames.MOVE and physics.start_time is not None:
+                sweeping.append((piece.get_id(), physics))
+        for crossing in self._collisions.due(sweeping, now):
+            piece = self.pieces.get(crossing.piece_id)
+            if piece is None or crossing.piece_id in to_remove:
                 continue
-            cell_x = x // self.board.cell_W_pix
-            cell_y = y // self.board.cell_H_pix
-            pos = (cell_y, cell_x)
+            self.occupancy.remove(piece)
+            if self._enter_cell(piece, crossing.cell, to_remove, passing=not crossing.final):
+                self._promote_if_last_row(piece, crossing.cell, to_promote)
 
-            if pos in self.pos_to_piece:
-                opponent = self.pos_to_piece[pos]
-                if piece.state.current_command and piece.state.current_command.type == StatesNames.JUMP:
-                    continue
-                if self.should_capture(opponent, piece):
-                    event_bus.publish(
-                        EventsNames.BLACK_CAPTURE if piece.get_id()[1] == 'B' else EventsNames.WHITE_CAPTURE,
-                        {'capture_piece': piece.get_id(), 'captured_piece': opponent.get_id(), 'sound': 'capture.wav'}
-                    )
-                    self.pos_to_piece[pos] = piece
-                    to_remove.add(opponent.get_id())
-                else:
-                    to_remove.add(piece.get_id())
-                    event_bus.publish(
-                        EventsNames.BLACK_CAPTURE if opponent.get_id()[1] == 'B' else EventsNames.WHITE_CAPTURE,
-                        {'capture_piece': opponent.get_id(), 'captured_piece': piece.get_id(), 'sound': 'capture.wav'}
-                    )
-            else:
-                self.pos_to_piece[pos] = piece
+        for piece in list(self._moving.values()):  # Use list to freeze values during loop
+            if piece.get_id() in to_remove:
+                continue
+            if piece.state.name != StatesNames.MOVE:
+                pos = self._aligned_cell(piece)
+                if pos != self.occupancy.cell_of(piece):
+                    self.occupancy.remove(piece)
+                    if pos is not None and self._enter_cell(piece, pos, to_remove):
+                        self._promote_if_last_row(piece, pos, to_promote)
 
-            # Instead of promoting here, save for after the loop
-            if piece.get_id()[0] == 'P' and (pos[0] == 0 or pos[0] == 7):
-                to_promote.append((piece.get_id(), pos))
+            if not self._in_motion(piece):
+                self._moving.pop(piece.get_id(), None)
+                self._collisions.forget(piece.get_id())
 
         # Remove captured pieces
         for k in to_remove:
-            self.pieces.pop(k, None)
+            self._remove_piece(k)
 
         # Handle promotion to queen after all captures are done
         for pawn_id, pos in to_promote:
             if pawn_id in self.pieces:
-                new_queen = self.piece_factory.create_piece('Q' + self.pieces[pawn_id].get_id()[1], pos)
-                self.pieces[new_queen.get_id()] = new_queen
-                self.pos_to_piece[pos] = new_queen
+                new_queen = self.piece_factory.create_piece('Q' + pawn_id[1], pos)
+                self._remove_piece(pawn_id)
+                self._add_piece(new_queen, now)
+                self.occupancy.place(new_queen, pos)
+        return len(to_remove)
+
+    def _promote_if_last_row(self, piece: Piece, pos: Tuple[int, int], to_promote: list):
+        # Instead of promoting here, save for after the sweep
+        if piece.get_id()[0] == 'P' and (pos[0] == 0 or pos[0] == self.board.H_cells - 1):
+            to_promote.append((piece.get_id(), pos))
+
+    def _enter_cell(self, piece: Piece, pos: Tuple[int, int], to_remove: set, passing: bool = False) -> bool:
+        """
+        Move piece into pos, resolving a capture if the cell is taken. A piece only passing
+        through a cell its own side holds goes over it. Returns True if piece now holds pos.
+        """
+        opponent = self.occupancy.piece_at(pos)
+        if opponent is None:
+            self.occupancy.place(piece, pos)
+            return True
+        if passing and opponent.get_id()[1] == piece.get_id()[1]:
+            return False
+        if piece.state.current_command and piece.state.current_command.type == StatesNames.JUMP:
+            return False
+        if self.should_capture(opponent, piece):
+            self._publish_capture(piece, opponent)
+            self.occupancy.place(piece, pos)
+            to_remove.add(opponent.get_id())
+            return True
+        to_remove.add(piece.get_id())
+        self._publish_capture(opponent, piece)
+        return False
+
+    def _publish_capture(self, capturer: Piece, captured: Piece):
+        topic = EventsNames.BLACK_CAPTURE if capturer.get_id()[1] == 'B' else EventsNames.WHITE_CAPTURE
+        self._bus.publish(topic, CaptureEvent(topic, capturer.get_id(), captured.get_id()))
+
+    def _aligned_cell(self, piece: Piece) -> Optional[Tuple[int, int]]:
+        """The cell a piece stands on, or None while it is between cells."""
+        x, y = map(int, piece.state.physics.get_pos())
+        if not self.board.is_valid_cell(x, y):
+            return None
+        return y // self.board.cell_H_pix, x // self.board.cell_W_pix
+
+    @staticmethod
+    def _in_motion(piece: Piece) -> bool:
+        cmd = piece.state.current_command
+        return cmd is not None and cmd.type in (StatesNames.MOVE, StatesNames.JUMP)
+
+    def _remove_piece(self, piece_id: str):
+        piece = self.pieces.pop(piece_id, None)
+        self._moving.pop(piece_id, None)
+        self._collisions.forget(piece_id)
+        self._wake_sequence.pop(piece_id, None)
+        if self._store is not None:
+            self._store.remove(piece_id)
+        if piece is not None:
+            self.occupancy.remove(piece)
 
     def should_capture(self, opponent, piece):
         if not opponent.state.current_command or opponent.state.current_command.type in [
@@ -284,25 +648,34 @@ class Game:
         return False
 
     def _draw(self):
-        board = self.clone_board()
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark()
         now_ms = self.game_time_ms()
+        if self._renderer is None:
+            self._renderer = BoardRenderer(self.board)
 
-        for piece in self.pieces.values():
-            piece.draw_on_board(board, now_ms)
-
-        self._draw_rectangle_on_board(board, self.focus_cell, (0, 255, 255))
-        self._draw_rectangle_on_board(board, self.focus_cell2, (255, 0, 0))
-
+        highlights = [(self.focus_cell, (0, 255, 255)), (self.focus_cell2, (255, 0, 0))]
         if self._selected_source:
-            self._draw_rectangle_on_board(board, self._selected_source, (0, 0, 255))
-
+            highlights.append((self._selected_source, (0, 0, 255)))
         if self._selected_source2:
-            self._draw_rectangle_on_board(board, self._selected_source2, (0, 255, 0))
+            highlights.append((self._selected_source2, (0, 255, 0)))
+
+        # Sprite animation is a matter of display: the simulation only updates pieces when their state changes
+        if self._store is not None:
+            self._store.advance(now_ms)
+        dirty = self._renderer.render(self.pieces.values(), highlights, now_ms)
+        if profiler is not None:
+            profiler.lap(ProfileMetrics.RENDER)
+            profiler.record(ProfileMetrics.SPRITES_BLITTED, self._renderer.sprites_blitted)
 
-        self._current_board = board
+        self._current_board = self._renderer.frame
         self.screen.update_left(self.black_log.log)
         self.screen.update_right(self.white_log.log)
-        self.screen.draw(self._current_board, white_score=self.white_score.score, black_score=self.black_score.score)
+        self.screen.draw(self._current_board, white_score=self.white_score.score, black_score=self.black_score.score,
+                         dirty_rects=dirty)
+        if profiler is not None:
+            profiler.lap(ProfileMetrics.SCREEN)
 
     def _cell_to_rect(self, cell: Tuple[int, int]) -> Tuple[int, int, int, int]:
         """Receives a cell and returns the coordinates of the rectangle surrounding it in pixels"""
@@ -313,20 +686,23 @@ class Game:
         y2 = (y + 1) * self.board.cell_H_pix
         return x1, y1, x2, y2
 
-    def _draw_rectangle_on_board(self, board, cell: Tuple[int, int], color: Tuple[int, int, int]):
-        """Draws a rectangle on a cell in the given color"""
-        x1, y1, x2, y2 = self._cell_to_rect(cell)
-        cv2.rectangle(board.img.img, (x1, y1), (x2, y2), color, 2)
-
     def _is_win(self) -> bool:
         kings = [p for p in self.pieces.values() if p.get_id().lower().startswith("k")]
         return len(kings) <= 1
 
-    def _announce_win(self):
-        event_bus.publish(EventsNames.VICTORY, {'sound': 'victory.WAV'})
+    def winner(self) -> Optional[str]:
+        """'black' or 'white' once only one king is left, otherwise None."""
+        return self._winner_name() if self._is_win() else None
+
+    def _winner_name(self) -> str:
         king = next(p for p in self.pieces.values() if p.get_id().lower().startswith("k"))
-        winner_name = 'black' if king.get_id()[1] == 'B' else 'white'
-        self.screen.announce_win(winner_name)
+        return 'black' if king.get_id()[1] == 'B' else 'white'
+
+    def _announce_win(self):
+        self._bus.publish(EventsNames.VICTORY, SoundEvent(EventsNames.VICTORY, 'victory.WAV'))
+        self._bus.flush()
+        if self.screen is not None:
+            self.screen.announce_win(self._winner_name())
 
     def _on_enter_pressed(self):
         self._selection_mode, self._selected_source = self._handle_selection(
@@ -355,19 +731,18 @@ class Game:
             if focus_cell in self.pos_to_piece:
                 piece = self.pos_to_piece[focus_cell]
                 if not piece.get_id()[1] == player_color:
-                    print(f"User {user_id} cannot select this piece.")
+                    logger.debug("User %s cannot select this piece.", user_id)
                     return selection_mode, selected_source
                 src_alg = self.board.cell_to_algebraic(focus_cell)
-                print(f"User {user_id} source selected at {focus_cell} -> {src_alg}")
+                logger.debug("User %s source selected at %s -> %s", user_id, focus_cell, src_alg)
                 return "dest", focus_cell
         elif selection_mode == "dest":
             if selected_source is None:
                 return selection_mode, selected_source
             src_cell = selected_source
             dst_cell = focus_cell
-            src_alg = self.board.cell_to_algebraic(src_cell)
             dst_alg = self.board.cell_to_algebraic(dst_cell)
-            print(f"User {user_id} destination selected at {dst_cell} -> {dst_alg}")
+            logger.debug("User %s destination selected at %s -> %s", user_id, dst_cell, dst_alg)
             piece = self.pos_to_piece.get(src_cell)
             if piece:
                 move_type = StatesNames.JUMP if src_cell == dst_cell else StatesNames.MOVE
@@ -375,7 +750,7 @@ class Game:
                     timestamp=self.game_time_ms(),
                     piece_id=piece.get_id(),
                     type=move_type,
-                    params=[src_alg, dst_alg]
+                    params=(self.board.cell_to_square(src_cell), self.board.cell_to_square(dst_cell))
                 )
                 self.user_input_queue.put(cmd)
             reset_func()
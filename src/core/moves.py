@@ -1,10 +1,24 @@
 import pathlib
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 class Moves:
+    # Tables shared by every piece of a type on a board size, keyed by (rules file, dims)
+    _shared: Dict[Tuple[pathlib.Path, Tuple[int, int]], "Moves"] = {}
+
     def __init__(self, txt_path: pathlib.Path, dims: Tuple[int, int]):
         """Initialize moves with rules from text file and board dimensions."""
         self.dims = dims  # Dimensions of the board (rows, cols)
         self.rules = self._load_rules(txt_path)  # Load movement rules from file
+        self._table, self._masks = self._build_tables()  # Destinations per square, built once
+
+    @classmethod
+    def load(cls, txt_path: pathlib.Path, dims: Tuple[int, int]) -> "Moves":
+        """Return the process-wide Moves for this rules file and board size, parsing it only once."""
+        key = (pathlib.Path(txt_path).resolve(), tuple(dims))
+        moves = cls._shared.get(key)
+        if moves is None:
+            moves = cls._shared.setdefault(key, cls(txt_path, dims))
+        return moves
+
     def _load_rules(self, txt_path: pathlib.Path) -> List[Tuple[int, int]]:
         """Load movement rules from a text file."""
         rules = []
@@ -19,12 +33,34 @@ class Moves:
         except Exception as e:
             raise ValueError(f"Error loading rules from {txt_path}: {e}")
         return rules
+
+    def _build_tables(self) -> Tuple[Tuple[Tuple[Tuple[int, int], ...], ...], Tuple[int, ...]]:
+        """Precompute the in-bounds destinations of every square, in rules order and as bitmasks."""
+        rows, cols = self.dims
+        table = []
+        masks = []
+        for r in range(rows):
+            for c in range(cols):
+                destinations = []
+                mask = 0
+                for dr, dc in self.rules:
+                    new_r, new_c = r + dr, c + dc
+                    # Check if the new position is within board boundaries
+                    if 0 <= new_r < rows and 0 <= new_c < cols:
+                        destinations.append((new_r, new_c))
+                        mask |= 1 << (new_r * cols + new_c)
+                table.append(tuple(destinations))
+                masks.append(mask)
+        return tuple(table), tuple(masks)
+
     def get_moves(self, r: int, c: int) -> List[Tuple[int, int]]:
         """Get all possible moves from a given position."""
-        possible_moves = []
-        for dr, dc in self.rules:
-            new_r, new_c = r + dr, c + dc
-            # Check if the new position is within board boundaries
-            if 0 <= new_r < self.dims[0] and 0 <= new_c < self.dims[1]:
-                possible_moves.append((new_r, new_c))
-        return possible_moves
+        if not (0 <= r < self.dims[0] and 0 <= c < self.dims[1]):
+            return []
+        return list(self._table[r * self.dims[1] + c])
+
+    def get_moves_mask(self, r: int, c: int) -> int:
+        """Destinations from (r, c) as a bitmask over squares numbered row * cols + col."""
+        if not (0 <= r < self.dims[0] and 0 <= c < self.dims[1]):
+            return 0
+        return self._masks[r * self.dims[1] + c]
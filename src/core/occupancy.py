@@ -0,0 +1,72 @@
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.core.bitboard import Bitboards
+
+if TYPE_CHECKING:
+    from src.pieces.piece import Piece
+
+
+class Occupancy:
+    """Cell <-> piece index, updated only when a piece enters or leaves a cell."""
+
+    def __init__(self, bitboards: Optional[Bitboards] = None):
+        self._cell_to_piece: Dict[Tuple[int, int], "Piece"] = {}
+        self._piece_to_cell: Dict[str, Tuple[int, int]] = {}
+        self.bitboards = bitboards
+
+    @property
+    def cell_to_piece(self) -> Dict[Tuple[int, int], "Piece"]:
+        """Live cell -> piece mapping. Treat as read-only; mutate through place/remove."""
+        return self._cell_to_piece
+
+    def place(self, piece: "Piece", cell: Tuple[int, int]):
+        """Put piece on cell, vacating its previous cell and evicting any other occupant."""
+        self.remove(piece)
+        occupant = self._cell_to_piece.get(cell)
+        if occupant is not None:
+            self.remove(occupant)
+        self._cell_to_piece[cell] = piece
+        self._piece_to_cell[piece.get_id()] = cell
+        if self.bitboards is not None:
+            self.bitboards.add(piece.get_id(), cell)
+
+    def remove(self, piece: "Piece") -> Optional[Tuple[int, int]]:
+        """Take piece off the board index and return the cell it occupied, if any."""
+        cell = self._piece_to_cell.pop(piece.get_id(), None)
+        if cell is not None and self._cell_to_piece.get(cell) is piece:
+            del self._cell_to_piece[cell]
+            if self.bitboards is not None:
+                self.bitboards.remove(piece.get_id(), cell)
+        return cell
+
+    def cell_of(self, piece: "Piece") -> Optional[Tuple[int, int]]:
+        return self._piece_to_cell.get(piece.get_id())
+
+    def piece_at(self, cell: Tuple[int, int]) -> Optional["Piece"]:
+        return self._cell_to_piece.get(cell)
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return cell in self._cell_to_piece
+
+    def __len__(self) -> int:
+        return len(self._cell_to_piece)
+
+    def legal_destinations(self, src: Tuple[int, int], piece: "Piece") -> List[Tuple[int, int]]:
+        """
+        Cells `piece` standing on src may be ordered to, by its movement rules and this index.
+        The piece only provides its rules and color, so a piece type's prototype works too.
+        """
+        bitboards = self.bitboards
+        geometry = bitboards.geometry
+        if piece.get_id()[0] == 'P':
+            # Pawn moves depend on what stands on the target, so test the few cells a pawn can reach
+            moves_mask = geometry.mask_of(
+                (src[0] + dr, src[1] + dc) for dr in (-2, -1, 1, 2) for dc in (-1, 0, 1)
+                if 0 <= src[0] + dr < geometry.height and 0 <= src[1] + dc < geometry.width
+            )
+        else:
+            moves_mask = piece.state._moves.get_moves_mask(*src)
+        cells = geometry.cells(bitboards.legal_destinations(src, moves_mask, piece.get_id()[1]))
+        if piece.get_id()[0] == 'P':
+            cells = [dst for dst in cells if piece.is_move_legal(src, dst, dst not in self)]
+        return cells
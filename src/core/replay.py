@@ -0,0 +1,69 @@
+import bisect
+import pathlib
+from typing import Callable, Optional, TYPE_CHECKING
+
+from src.infrastructure.journal import read_journal
+
+if TYPE_CHECKING:
+    from src.core.game import Game
+
+
+class Replay:
+    """
+    Re-runs a journaled match on a simulated clock, as fast as the simulation allows.
+    The game is rebuilt from the journal's keyframe snapshots and the accepted commands
+    are fed back on the ticks that originally applied them, so every capture, score and
+    log entry comes out as it did in the recorded match.
+    """
+
+    def __init__(self, journal_path: pathlib.Path, game_factory: Callable[[], "Game"]):
+        self._contents = read_journal(journal_path)
+        self._game_factory = game_factory
+        self._applied_at = [entry.applied_at for entry in self._contents.commands]
+        self._next_command = 0
+        self.game: Optional["Game"] = None
+
+    @property
+    def start_ms(self) -> int:
+        return self._contents.keyframes[0].time_ms
+
+    @property
+    def end_ms(self) -> Optional[int]:
+        return self._contents.end_ms
+
+    def seek(self, time_ms: int) -> "Game":
+        """Game as it was at the first tick at or after time_ms, restored from the nearest earlier keyframe."""
+        keyframes = self._contents.keyframes
+        times = [keyframe.time_ms for keyframe in keyframes]
+        keyframe = keyframes[max(0, bisect.bisect_right(times, time_ms) - 1)]
+        if self.game is None or self.game.game_time_ms() > time_ms or keyframe.time_ms > self.game.game_time_ms():
+            self.game = self._game_factory()
+            if self.game.tick_ms != self._contents.tick_ms:
+                raise ValueError(f"Journal ticks every {self._contents.tick_ms} ms, the game every {self.game.tick_ms} ms")
+            self.game.load_snapshot(keyframe)
+            self._next_command = bisect.bisect_left(self._applied_at, keyframe.time_ms)
+        while self.game.game_time_ms() < time_ms:
+            self._step()
+        return self.game
+
+    def run(self, until_ms: Optional[int] = None) -> Optional[str]:
+        """Play on to until_ms (default: the recorded end); returns the winner if the match was decided."""
+        if self.game is None:
+            self.seek(self.start_ms)
+        if until_ms is None:
+            until_ms = self.end_ms if self.end_ms is not None else self._applied_at[-1] if self._applied_at else self.start_ms
+        while self.game.game_time_ms() <= until_ms and self.game.winner() is None:
+            self._step()
+        return self.game.winner()
+
+    def _step(self):
+        now = self.game.game_time_ms()
+        commands = []
+        entries = self._contents.commands
+        # Commands from before this tick can only be waiting here after a seek between keyframe and tick
+        while self._next_command < len(entries) and entries[self._next_command].applied_at <= now:
+            entry = entries[self._next_command]
+            if entry.applied_at == now:
+                commands.append(entry.to_command(self.game.board))
+            self._next_command += 1
+        self.game.step(commands)
@@ -1,4 +1,9 @@
-from src.input.event_bus import Event
+import logging
+
+from src.input.event_bus import CaptureEvent
+
+logger = logging.getLogger(__name__)
+
 
 class Score:
     _piece_score = {
@@ -12,7 +17,7 @@ class Score:
     def __init__(self):
         self.score = 0
 
-    def update_score(self, event: Event):
-        captured_piece_type = event.data['captured_piece'][0]
+    def update_score(self, event: CaptureEvent):
+        captured_piece_type = event.captured_piece[0]
         self.score += Score._piece_score[captured_piece_type]
-        print(f'black updated score {self.score}')
\ No newline at end of file
+        logger.debug('updated score %s', self.score)
\ No newline at end of file
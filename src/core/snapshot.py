@@ -0,0 +1,149 @@
+import struct
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from src.enums.states_names import StatesNames
+
+SNAPSHOT_MAGIC = b'KFS1'
+DELTA_MAGIC = b'KFD1'
+
+NO_CELL = 0xFF  # row/col byte of a piece that is between cells
+NO_TIME = -1    # time field of a physics that has not started, or a piece that never got a command
+
+STATES: Tuple[StatesNames, ...] = tuple(StatesNames)
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+# All layouts are little-endian without padding
+# magic, board width, board height, time ms, white score, black score, piece count
+SNAPSHOT_HEADER = struct.Struct('<4sBBIHHH')
+# magic, base time ms, time ms, white score, black score, changed count, removed count
+DELTA_HEADER = struct.Struct('<4sIIHHHH')
+# type, color, serial, state, finished-state bits, cell, start cell, target cell (row, col each),
+# physics start time, command time: 20 bytes per piece
+PIECE_RECORD = struct.Struct('<ccHBBBBBBBBii')
+PIECE_ID = struct.Struct('<ccH')
+
+
+class PieceRecord(NamedTuple):
+    piece_id: str
+    state: StatesNames
+    cell: Optional[Tuple[int, int]]        # cell the piece holds on the board, None while it holds none
+    start_cell: Tuple[int, int]            # where the current state's physics started
+    target_cell: Tuple[int, int]           # where it is heading (start_cell when not moving)
+    start_time: Optional[int]              # physics start time in ms, None until its first update
+    command_time: Optional[int]            # timestamp of the command that entered the state
+    finished: FrozenSet[StatesNames]       # states whose physics currently reports finished
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    time_ms: int
+    width: int
+    height: int
+    white_score: int
+    black_score: int
+    pieces: Dict[str, PieceRecord]
+
+
+def encode_snapshot(snapshot: Snapshot) -> bytes:
+    parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, snapshot.width, snapshot.height, snapshot.time_ms,
+                                  snapshot.white_score, snapshot.black_score, len(snapshot.pieces))]
+    parts.extend(_pack_record(record) for record in snapshot.pieces.values())
+    return b''.join(parts)
+
+
+def decode_snapshot(data: bytes) -> Snapshot:
+    magic, width, height, time_ms, white, black, count = _unpack(SNAPSHOT_HEADER, data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"Not a snapshot (magic {magic!r})")
+    offset = SNAPSHOT_HEADER.size
+    pieces = {}
+    for _ in range(count):
+        record = _unpack_record(data, offset)
+        pieces[record.piece_id] = record
+        offset += PIECE_RECORD.size
+    _check_consumed(data, offset)
+    return Snapshot(time_ms, width, height, white, black, pieces)
+
+
+def encode_delta(base: Snapshot, snapshot: Snapshot) -> bytes:
+    """Records that differ from base, plus the ids of pieces that are gone."""
+    changed = [record for piece_id, record in snapshot.pieces.items() if base.pieces.get(piece_id) != record]
+    removed = [piece_id for piece_id in base.pieces if piece_id not in snapshot.pieces]
+    parts = [DELTA_HEADER.pack(DELTA_MAGIC, base.time_ms, snapshot.time_ms, snapshot.white_score,
+                               snapshot.black_score, len(changed), len(removed))]
+    parts.extend(_pack_record(record) for record in changed)
+    parts.extend(PIECE_ID.pack(*_split_id(piece_id)) for piece_id in removed)
+    return b''.join(parts)
+
+
+def apply_delta(base: Snapshot, data: bytes) -> Snapshot:
+    """The snapshot a delta produced by encode_delta(base, ...) describes."""
+    magic, base_time, time_ms, white, black, n_changed, n_removed = _unpack(DELTA_HEADER, data, 0)
+    if magic != DELTA_MAGIC:
+        raise ValueError(f"Not a delta (magic {magic!r})")
+    if base_time != base.time_ms:
+        raise ValueError(f"Delta is based on {base_time} ms, not {base.time_ms} ms")
+    pieces = dict(base.pieces)
+    offset = DELTA_HEADER.size
+    for _ in range(n_changed):
+        record = _unpack_record(data, offset)
+        pieces[record.piece_id] = record
+        offset += PIECE_RECORD.size
+    for _ in range(n_removed):
+        pieces.pop(_join_id(*_unpack(PIECE_ID, data, offset)), None)
+        offset += PIECE_ID.size
+    _check_consumed(data, offset)
+    return Snapshot(time_ms, base.width, base.height, white, black, pieces)
+
+
+def _pack_record(record: PieceRecord) -> bytes:
+    kind, color, serial = _split_id(record.piece_id)
+    cell = record.cell if record.cell is not None else (NO_CELL, NO_CELL)
+    finished = 0
+    for state in record.finished:
+        finished |= 1 << STATE_CODES[state]
+    return PIECE_RECORD.pack(kind, color, serial, STATE_CODES[record.state], finished,
+                             cell[0], cell[1], record.start_cell[0], record.start_cell[1],
+                             record.target_cell[0], record.target_cell[1],
+                             _time_field(record.start_time), _time_field(record.command_time))
+
+
+def _unpack_record(data: bytes, offset: int) -> PieceRecord:
+    (kind, color, serial, state, finished, row, col, start_row, start_col,
+     target_row, target_col, start_time, command_time) = _unpack(PIECE_RECORD, data, offset)
+    return PieceRecord(
+        piece_id=_join_id(kind, color, serial),
+        state=STATES[state],
+        cell=None if row == NO_CELL else (row, col),
+        start_cell=(start_row, start_col),
+        target_cell=(target_row, target_col),
+        start_time=None if start_time == NO_TIME else start_time,
+        command_time=None if command_time == NO_TIME else command_time,
+        finished=frozenset(s for code, s in enumerate(STATES) if finished >> code & 1),
+    )
+
+
+def _split_id(piece_id: str) -> Tuple[bytes, bytes, int]:
+    # "PW_3" -> (b'P', b'W', 3)
+    return piece_id[0].encode(), piece_id[1].encode(), int(piece_id[3:])
+
+
+def _join_id(kind: bytes, color: bytes, serial: int) -> str:
+    return f"{kind.decode()}{color.decode()}_{serial}"
+
+
+def _time_field(value: Optional[int]) -> int:
+    return NO_TIME if value is None else int(value)
+
+
+def _unpack(layout: struct.Struct, data: bytes, offset: int) -> tuple:
+    try:
+        return layout.unpack_from(data, offset)
+    except struct.error as e:
+        raise ValueError(f"Truncated state data at byte {offset}: {e}") from None
+
+
+def _check_consumed(data: bytes, offset: int):
+    if offset != len(data):
+        raise ValueError(f"{len(data) - offset} unexpected trailing bytes in state data")
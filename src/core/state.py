@@ -1,5 +1,5 @@
 from src.input.command import Command
-from moves import Moves
+from src.core.moves import Moves
 from src.graphics.graphics import Graphics
 from src.physics.physics import Physics
 from typing import Dict, Optional
@@ -8,7 +8,8 @@ from src.enums.states_names import StatesNames
 
 
 class State:
-    def __init__(self, moves: Moves, graphics: Graphics, physics: Physics):
+    def __init__(self, moves: Moves, graphics: Graphics, physics: Physics, name: Optional[StatesNames] = None):
+        self.name = name
         self._moves = moves
         self._graphics = graphics
         self._physics = physics
@@ -19,6 +20,10 @@ class State:
     def physics(self):
         return self._physics
 
+    @property
+    def graphics(self):
+        return self._graphics
+
     @property
     def current_command(self):
         return self._current_command
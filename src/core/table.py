@@ -1,6 +1,6 @@
 import cv2
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 
 class Table:
@@ -19,12 +19,54 @@ class Table:
 
         # Empty data at start
         self.rows: List[List[str]] = []
+        self.version = 0  # Bumped whenever the rendered image changes
+        # Rendered strip of every displayed row, so rebuilds and scrolling never re-render text
+        self._row_strips: Dict[Tuple[str, ...], np.ndarray] = {}
+        # How many entries of the log given to sync_log are already shown (None: resync from scratch)
+        self._log_len: Optional[int] = None
         self._img = self._create_table_img()
 
     def update_data(self, rows: List[List[str]]):
         """Update new data (excluding headers)"""
-        self.rows = rows[-self.max_rows:]  # Take the last max_rows
+        self._log_len = None
+        rows = rows[-self.max_rows:]  # Take the last max_rows
+        if rows == self.rows:
+            return
+        self.rows = rows
         self._img = self._create_table_img()
+        self.version += 1
+
+    def append_rows(self, rows: List[List[str]]):
+        """
+        Add rows at the bottom, rendering only the new ones. Once the table is full the body
+        is scrolled up by shifting the existing pixels instead of redrawing it.
+        """
+        rows = rows[-self.max_rows:]
+        if not rows:
+            return
+        body = self._img[self.cell_h:]
+        for row in rows:
+            if len(self.rows) == self.max_rows:
+                dropped = self.rows.pop(0)
+                body[:-self.cell_h] = body[self.cell_h:]
+                self._row_strips.pop(self._key(dropped), None)
+            slot = len(self.rows)
+            body[slot * self.cell_h:(slot + 1) * self.cell_h] = self._row_strip(row)
+            self.rows.append(row)
+        self.version += 1
+
+    def sync_log(self, log: List[Dict[str, Any]]):
+        """
+        Show the tail of an append-only log, rendering only the entries added since the previous
+        call. A log that got shorter, or a table that was changed through update_data, is rebuilt.
+        """
+        if self._log_len is None or len(log) < self._log_len:
+            table_data = self.log_to_table_data(log)
+            self.update_data(table_data[1:])
+        elif len(log) > self._log_len:
+            keys = list(log[0].keys())
+            self.append_rows([[str(entry[key]) for key in keys] for entry in log[self._log_len:]])
+        self._log_len = len(log)
 
     def _create_table_img(self):
         total_rows = self.max_rows + 1  # Including the header row
@@ -34,23 +76,38 @@ class Table:
                       self.bg_color, dtype=np.uint8)
 
         # Draw headers (without rectangle)
-        for j, text in enumerate(self.headers):
-            x = j * self.cell_w
-            y = 0
-            cv2.putText(img, str(text), (x + 5, y + int(self.cell_h * 0.7)),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.text_color, 1)
+        self._draw_row(img, self.headers)
 
-        # Draw rows (without rectangle)
-        for i in range(self.max_rows):
-            for j in range(len(self.headers)):
-                x = j * self.cell_w
-                y = (i + 1) * self.cell_h
-                text = self.rows[i][j] if i < len(self.rows) and j < len(self.rows[i]) else ""
-                cv2.putText(img, str(text), (x + 5, y + int(self.cell_h * 0.7)),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.text_color, 1)
+        # Draw rows from their cached strips, keeping only the strips of rows still shown
+        strips = {}
+        for i, row in enumerate(self.rows):
+            key = self._key(row)
+            strips[key] = self._row_strip(row)
+            img[(i + 1) * self.cell_h:(i + 2) * self.cell_h] = strips[key]
+        self._row_strips = strips
 
         return img
 
+    def _row_strip(self, row: List[str]) -> np.ndarray:
+        key = self._key(row)
+        strip = self._row_strips.get(key)
+        if strip is None:
+            strip = np.full((self.cell_h, len(self.headers) * self.cell_w, 3), self.bg_color, dtype=np.uint8)
+            self._draw_row(strip, row)
+            self._row_strips[key] = strip
+        return strip
+
+    def _draw_row(self, img: np.ndarray, row: List[Any]):
+        # Draw one row of text (without rectangle) at the top of img
+        for j in range(len(self.headers)):
+            text = row[j] if j < len(row) else ""
+            cv2.putText(img, str(text), (j * self.cell_w + 5, int(self.cell_h * 0.7)),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.text_color, 1)
+
+    @staticmethod
+    def _key(row: List[Any]) -> Tuple[str, ...]:
+        return tuple(str(text) for text in row)
+
     @staticmethod
     def log_to_table_data(log: List[Dict[str, Any]]) -> List[List[str]]:
         if not log:
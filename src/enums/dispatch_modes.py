@@ -0,0 +1,6 @@
+from enum import Enum
+
+class DispatchModes(Enum):
+    SYNC = "sync"           # called inside publish
+    DEFERRED = "deferred"   # called by EventBus.flush at the end of the tick
+    WORKER = "worker"       # called on one of the bus's worker threads
@@ -0,0 +1,9 @@
+from enum import Enum
+
+class InputActions(Enum):
+    UP = "up"
+    DOWN = "down"
+    LEFT = "left"
+    RIGHT = "right"
+    SELECT = "select"
+    QUIT = "quit"
@@ -0,0 +1,15 @@
+from enum import Enum
+
+class ProfileMetrics(Enum):
+    # Phases timed in ms, in game loop order
+    UPDATE = "update"                         # piece.update for every piece
+    POSITIONS = "positions"                   # occupancy, captures and promotions
+    COMMANDS = "commands"                     # applying queued commands
+    RENDER = "render"                         # BoardRenderer.render
+    SCREEN = "screen"                         # move logs and Screen.draw
+    SHOW = "show"                             # cv2.imshow and waitKey
+    # Counters, one sample per tick or frame
+    PIECES_UPDATED = "pieces_updated"
+    CAPTURES = "captures"
+    COMMANDS_REJECTED = "commands_rejected"
+    SPRITES_BLITTED = "sprites_blitted"
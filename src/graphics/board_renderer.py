@@ -0,0 +1,112 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import cv2
+
+from src.core.board import Board
+from src.graphics.compositing import blit_all
+
+if TYPE_CHECKING:
+    from src.pieces.piece import Piece
+
+Rect = Tuple[int, int, int, int]  # (x0, y0, x1, y1) in board pixels, end exclusive
+
+HIGHLIGHT_THICKNESS = 2
+
+
+class BoardRenderer:
+    """
+    Keeps a persistent composited board frame and, on every render, repaints only the
+    cells whose pieces, sprite frames or highlights changed since the previous frame:
+    each dirty cell gets its background back, then its sprites are blitted one at a time,
+    clipped to the cell, and its highlights drawn over them.
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self._background = board.img.img
+        self.frame: Board = board.clone()
+        self._last_signatures: Optional[Dict[Tuple[int, int], tuple]] = None
+        self.sprites_blitted = 0  # sprites composited by the last render
+
+    def invalidate(self):
+        """Force the next render to repaint the whole board."""
+        self._last_signatures = None
+
+    def render(self, pieces: Iterable["Piece"],
+               highlights: Sequence[Tuple[Tuple[int, int], Tuple[int, int, int]]],
+               now_ms: int) -> List[Rect]:
+        """Bring the frame up to date and return the board rectangles that were repainted."""
+        items = []
+        for piece in pieces:
+            items.append(self._piece_item(piece, now_ms))
+        for cell, color in highlights:
+            items.append(self._highlight_item(cell, color))
+
+        cell_items: Dict[Tuple[int, int], List[int]] = {}
+        for index, (bbox, _, _) in enumerate(items):
+            for cell in self._cells_touching(bbox):
+                cell_items.setdefault(cell, []).append(index)
+
+        signatures = {cell: tuple(items[i][1] for i in indices) for cell, indices in cell_items.items()}
+
+        if self._last_signatures is None:
+            self.frame.img.img[...] = self._background
+            dirty_cells = list(cell_items)
+            dirty = [(0, 0, self._background.shape[1], self._background.shape[0])]
+        else:
+            changed = set(signatures) | set(self._last_signatures)
+            dirty_cells = [cell for cell in changed if signatures.get(cell) != self._last_signatures.get(cell)]
+            dirty = [self._cell_rect(cell) for cell in dirty_cells]
+            for x0, y0, x1, y1 in dirty:
+                self.frame.img.img[y0:y1, x0:x1] = self._background[y0:y1, x0:x1]
+
+        # The piece sprites of the dirty cells are blitted one by one, clipped to their cell, then highlights on top
+        sprite_draws = []
+        overlays = []
+        for cell in dirty_cells:
+            clip = self._cell_rect(cell)
+            for i in cell_items.get(cell, ()):
+                draw = items[i][2]
+                if callable(draw):
+                    overlays.append((draw, clip))
+                else:
+                    sprite, x, y = draw
+                    sprite_draws.append((sprite, x, y, clip))
+        self.sprites_blitted = blit_all(self.frame.img.img, sprite_draws)
+        for draw, clip in overlays:
+            draw(clip, now_ms)
+
+        self._last_signatures = signatures
+        return dirty
+
+    def _piece_item(self, piece: "Piece", now_ms: int):
+        x, y = map(int, piece.position_at(now_ms))
+        sprite = piece.sprite_at(now_ms)
+        h, w = sprite.shape
+        return (x, y, x + w, y + h), (piece.get_id(), x, y, id(sprite)), (sprite, x, y)
+
+    def _highlight_item(self, cell: Tuple[int, int], color: Tuple[int, int, int]):
+        x0, y0, x1, y1 = self._cell_rect(cell)
+        pad = HIGHLIGHT_THICKNESS
+        bbox = (x0 - pad, y0 - pad, x1 + pad + 1, y1 + pad + 1)
+
+        def draw(clip: Rect, now_ms: int):
+            cx0, cy0, cx1, cy1 = clip
+            region = self.frame.img.img[cy0:cy1, cx0:cx1]
+            cv2.rectangle(region, (x0 - cx0, y0 - cy0), (x1 - cx0, y1 - cy0), color, HIGHLIGHT_THICKNESS)
+
+        return bbox, ('highlight', cell, tuple(color)), draw
+
+    def _cells_touching(self, bbox: Rect) -> Iterable[Tuple[int, int]]:
+        x0, y0, x1, y1 = bbox
+        cw, ch = self.board.cell_W_pix, self.board.cell_H_pix
+        col0, col1 = max(0, x0 // cw), min(self.board.W_cells - 1, (x1 - 1) // cw)
+        row0, row1 = max(0, y0 // ch), min(self.board.H_cells - 1, (y1 - 1) // ch)
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                yield row, col
+
+    def _cell_rect(self, cell: Tuple[int, int]) -> Rect:
+        row, col = cell
+        cw, ch = self.board.cell_W_pix, self.board.cell_H_pix
+        return col * cw, row * ch, (col + 1) * cw, (row + 1) * ch
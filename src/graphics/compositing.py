@@ -0,0 +1,99 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# Opacity given to sprites that carry no alpha channel of their own
+SPRITE_OPACITY = 0.8
+
+Rect = Tuple[int, int, int, int]  # (x0, y0, x1, y1), end exclusive
+
+
+class PremultipliedSprite:
+    """
+    Sprite colors already multiplied by alpha, stored next to 255 - alpha, for blending
+    onto BGR or BGRA targets with saturating uint8 math. For BGRA targets the alpha
+    channel gets color 0 and weight 255, so the target keeps its own alpha.
+    """
+    __slots__ = ('shape', '_layers')
+
+    def __init__(self, color: np.ndarray, alpha: np.ndarray):
+        h, w = color.shape[:2]
+        self.shape: Tuple[int, int] = (h, w)
+        inv_alpha = np.repeat(255 - alpha, 3, axis=2)
+        self._layers: Dict[int, Tuple[np.ndarray, np.ndarray]] = {
+            3: (color, inv_alpha),
+            4: (np.dstack([color, np.zeros((h, w), dtype=np.uint8)]),
+                np.dstack([inv_alpha, np.full((h, w), 255, dtype=np.uint8)])),
+        }
+        for layer in self._layers.values():
+            for array in layer:
+                array.flags.writeable = False
+
+    def layers(self, channels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(premultiplied color, 255 - alpha) laid out for a target with this many channels."""
+        return self._layers[channels]
+
+
+def premultiply(img: np.ndarray, opacity: float = 1.0) -> PremultipliedSprite:
+    """
+    Premultiply a BGR / BGRA / gray image. BGRA images use their own per-pixel alpha;
+    images without alpha are given a uniform alpha of `opacity`.
+    """
+    if img.ndim == 2:
+        img = np.repeat(img[..., None], 3, axis=2)
+    if img.shape[2] == 4:
+        alpha = img[..., 3:4].astype(np.uint16)
+    else:
+        alpha = np.full(img.shape[:2] + (1,), round(255 * opacity), dtype=np.uint16)
+    color = ((img[..., :3].astype(np.uint16) * alpha + 127) // 255).astype(np.uint8)
+    return PremultipliedSprite(color, alpha.astype(np.uint8))
+
+
+def _clip(dst_shape, sprite_shape, x: int, y: int, clip: Optional[Rect]) -> Optional[Rect]:
+    h, w = sprite_shape
+    x0, y0, x1, y1 = clip if clip is not None else (0, 0, dst_shape[1], dst_shape[0])
+    x0, y0 = max(x0, x, 0), max(y0, y, 0)
+    x1, y1 = min(x1, x + w, dst_shape[1]), min(y1, y + h, dst_shape[0])
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1, y1
+
+
+def _over(dst: np.ndarray, sprite: PremultipliedSprite, rect: Rect, x: int, y: int):
+    """'Over' operator in place on dst[rect]: dst = color + dst * (255 - alpha) / 255."""
+    x0, y0, x1, y1 = rect
+    color, inv_alpha = sprite.layers(dst.shape[2])
+    sy, sx = y0 - y, x0 - x
+    h, w = y1 - y0, x1 - x0
+    roi = dst[y0:y1, x0:x1]
+    cv2.multiply(roi, inv_alpha[sy:sy + h, sx:sx + w], dst=roi, scale=1 / 255)
+    cv2.add(roi, color[sy:sy + h, sx:sx + w], dst=roi)
+
+
+def blit(dst: np.ndarray, sprite: PremultipliedSprite, x: int, y: int, clip: Optional[Rect] = None) -> bool:
+    """Composite one sprite with its top-left corner at (x, y). Returns False if nothing was visible."""
+    rect = _clip(dst.shape, sprite.shape, x, y, clip)
+    if rect is None:
+        return False
+    _over(dst, sprite, rect, x, y)
+    return True
+
+
+def blit_all(dst: np.ndarray, draws: Sequence[Tuple[PremultipliedSprite, int, int, Optional[Rect]]]) -> int:
+    """
+    Composite sprites, given as (sprite, x, y, clip), one after another in order, and return
+    how many were visible. This is a loop of clipped blits: every sprite is clipped first,
+    then each visible one costs its own multiply and saturating add on its target rectangle.
+    Building one premultiplied layer and blending it with a single multiply and add costs a
+    copy of every sprite plus a blend of the whole bounding box, and the blit_all_loop and
+    blit_all_single_layer benchmarks measure it at over twice the time per sprite.
+    """
+    visible: List[Tuple[PremultipliedSprite, Rect, int, int]] = []
+    for sprite, x, y, clip in draws:
+        rect = _clip(dst.shape, sprite.shape, x, y, clip)
+        if rect is not None:
+            visible.append((sprite, rect, x, y))
+    for sprite, rect, x, y in visible:
+        _over(dst, sprite, rect, x, y)
+    return len(visible)
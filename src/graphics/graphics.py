@@ -1,9 +1,11 @@
 import pathlib
 import time
 from typing import List
-from img import Img
+from src.graphics.img import Img
 from src.input.command import Command
 from src.core.board import Board
+from src.graphics.sprite_cache import sprite_cache
+from src.graphics.compositing import SPRITE_OPACITY, PremultipliedSprite
 
 
 class Graphics:
@@ -52,13 +54,11 @@ class Graphics:
     def get_img(self) -> Img:
         return self.sprites[self.current_frame]
 
+    def get_premultiplied(self) -> PremultipliedSprite:
+        return self.get_img().premultiplied(SPRITE_OPACITY)
+
     def _load_sprites(self, folder: pathlib.Path) -> List[Img]:
-        """Load all sprite images from a folder in sorted order and resize to cell size."""
-        images = []
-        cell_w, cell_h = self.board.cell_W_pix, self.board.cell_H_pix
-        for img_path in sorted(folder.iterdir()):
-            if img_path.suffix.lower() in (".png", ".jpg", ".jpeg"):
-                images.append(Img().read(img_path, size=(cell_w, cell_h)))
-        return images
+        """Sprite images of a folder in sorted order, resized to cell size and shared through the sprite cache."""
+        return sprite_cache.get(folder, (self.board.cell_W_pix, self.board.cell_H_pix))
 
 
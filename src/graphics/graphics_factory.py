@@ -1,5 +1,5 @@
 import pathlib
-from graphics import Graphics
+from src.graphics.graphics import Graphics
 from src.core.board import Board
 
 
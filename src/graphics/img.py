@@ -5,9 +5,12 @@ import pathlib
 import cv2
 import numpy as np
 
+from src.graphics.compositing import PremultipliedSprite, blit, premultiply
+
 class Img:
     def __init__(self):
         self.img = None
+        self._premultiplied: dict[float, PremultipliedSprite] = {}
 
     def read(self, path: str | pathlib.Path,
              size: tuple[int, int] | None = None,
@@ -35,6 +38,7 @@ class Img:
             `self`, so you can chain:  `sprite = Img().read("foo.png", (64,64))`
         """
         path = str(path)
+        self._premultiplied = {}
         self.img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
         if self.img is None:
             raise FileNotFoundError(f"Cannot load image: {path}")
@@ -53,31 +57,26 @@ class Img:
 
         return self
 
+    def premultiplied(self, opacity: float = 1.0) -> PremultipliedSprite:
+        """Alpha-premultiplied form of the image, computed once per opacity (used only without an alpha channel)."""
+        if self.img is None:
+            raise ValueError("Image not loaded.")
+        sprite = self._premultiplied.get(opacity)
+        if sprite is None:
+            sprite = self._premultiplied[opacity] = premultiply(self.img, opacity)
+        return sprite
+
     def draw_on(self, other_img, x, y):
         if self.img is None or other_img.img is None:
             raise ValueError("Both images must be loaded before drawing.")
 
-        if self.img.shape[2] != other_img.img.shape[2]:
-            if self.img.shape[2] == 3 and other_img.img.shape[2] == 4:
-                self.img = cv2.cvtColor(self.img, cv2.COLOR_BGR2BGRA)
-            elif self.img.shape[2] == 4 and other_img.img.shape[2] == 3:
-                self.img = cv2.cvtColor(self.img, cv2.COLOR_BGRA2BGR)
-
         h, w = self.img.shape[:2]
         H, W = other_img.img.shape[:2]
 
         if y + h > H or x + w > W:
             raise ValueError("Logo does not fit at the specified position.")
 
-        roi = other_img.img[y:y + h, x:x + w]
-
-        if self.img.shape[2] == 4:
-            b, g, r, a = cv2.split(self.img)
-            mask = a / 255.0
-            for c in range(3):
-                roi[..., c] = (1 - mask) * roi[..., c] + mask * self.img[..., c]
-        else:
-            other_img.img[y:y + h, x:x + w] = self.img
+        blit(other_img.img, self.premultiplied(), x, y)
 
     def put_text(self, txt, x, y, font_size, color=(255, 255, 255, 255), thickness=1):
         if self.img is None:
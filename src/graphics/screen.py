@@ -1,4 +1,4 @@
-from typing import Tuple, Any, List
+from typing import Tuple, Any, List, Optional, Sequence
 import cv2
 import numpy as np
 from src.core.board import Board
@@ -18,6 +18,10 @@ class Screen:
         self.left_table = Table(headers)
         self.right_table = Table(headers)
 
+        # What the static parts of the frame (background, tables, titles, scores) were drawn from
+        self._chrome_key = None
+        self._board_origin = (0, 0)
+
     @property
     def img(self):
         return self._img
@@ -184,6 +188,7 @@ class Screen:
 
         # Display screen with styled text
         self._img = reset_img
+        self._chrome_key = None
 
         # Clear tables (reset data)
         self.left_table.update_data([])
@@ -375,33 +380,39 @@ class Screen:
         cv2.waitKey(3000)
 
         self._img = original_img
+        self._chrome_key = None
 
         self.left_table.update_data([])
         self.right_table.update_data([])
 
     def update_left(self, log: List[dict[str, Any]]):
-        """Update the left table from the log"""
-        table_data = Table.log_to_table_data(log)
-        if table_data:
-            # Remove first row because headers are already fixed
-            self.left_table.update_data(table_data[1:])
-        else:
-            self.left_table.update_data([])
+        """Update the left table from the log (only entries appended since the last call are rendered)"""
+        self.left_table.sync_log(log)
 
     def update_right(self, log: List[dict[str, Any]]):
-        """Update the right table from the log"""
-        table_data = Table.log_to_table_data(log)
-        if table_data:
-            self.right_table.update_data(table_data[1:])
-        else:
-            self.right_table.update_data([])
+        """Update the right table from the log (only entries appended since the last call are rendered)"""
+        self.right_table.sync_log(log)
 
     def draw(self,
              board: Board = None,
              spacing=20,
              white_score: int = 0,
-             black_score: int = 0):
-        """Draws the board, tables, and scores with clean modern red styling"""
+             black_score: int = 0,
+             dirty_rects: Optional[Sequence[Tuple[int, int, int, int]]] = None):
+        """
+        Draws the board, tables, and scores with clean modern red styling.
+        The tables, titles and scores are only redrawn when they changed; otherwise just the
+        board rectangles listed in dirty_rects (x0, y0, x1, y1) are copied, or the whole
+        board when dirty_rects is None.
+        """
+        board_shape = board.img.img.shape if board is not None else None
+        chrome_key = (self.left_table.version, self.right_table.version, white_score, black_score,
+                      spacing, board_shape)
+        if chrome_key == self._chrome_key:
+            self._blit_board(board, dirty_rects)
+            return
+        self._chrome_key = chrome_key
+
         self._img[:, :] = self._bg_color
 
         # Draw the board
@@ -415,6 +426,7 @@ class Screen:
             bh, bw = board_img.shape[:2]
             board_offset_y = (self._screen_h - bh) // 2
             board_offset_x = (self._screen_w - bw) // 2
+            self._board_origin = (board_offset_x, board_offset_y)
             self._img[board_offset_y:board_offset_y + bh, board_offset_x:board_offset_x + bw] = board_img
 
         # Modern colors
@@ -524,5 +536,27 @@ class Screen:
                     cv2.putText(self._img, score_text, (score_x, score_y_alt),
                                 font, score_scale, score_color, score_thickness, cv2.LINE_AA)
 
-    def show(self, win_name="Screen"):
-        cv2.imshow(win_name, self._img)
+    def _blit_board(self, board: Optional[Board], dirty_rects: Optional[Sequence[Tuple[int, int, int, int]]]):
+        """Copy the given board rectangles (or the whole board) into the screen at the board origin."""
+        if board is None:
+            return
+        board_img = board.img.img
+        if dirty_rects is None:
+            dirty_rects = [(0, 0, board_img.shape[1], board_img.shape[0])]
+        ox, oy = self._board_origin
+        for x0, y0, x1, y1 in dirty_rects:
+            region = board_img[y0:y1, x0:x1]
+            if region.shape[2] == 4:
+                region = cv2.cvtColor(region, cv2.COLOR_BGRA2BGR)
+            self._img[oy + y0:oy + y1, ox + x0:ox + x1] = region
+
+    def show(self, win_name="Screen", overlay_lines: Optional[Sequence[str]] = None):
+        """Display the screen; overlay_lines (e.g. profiler stats) go on a copy, so the screen itself is untouched."""
+        if not overlay_lines:
+            cv2.imshow(win_name, self._img)
+            return
+        img = self._img.copy()
+        for i, line in enumerate(overlay_lines):
+            cv2.putText(img, line, (10, 20 + 18 * i), cv2.FONT_HERSHEY_PLAIN, 1.0, (0, 0, 0), 3, cv2.LINE_AA)
+            cv2.putText(img, line, (10, 20 + 18 * i), cv2.FONT_HERSHEY_PLAIN, 1.0, (255, 255, 255), 1, cv2.LINE_AA)
+        cv2.imshow(win_name, img)
@@ -0,0 +1,81 @@
+import pathlib
+import threading
+from typing import Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from src.graphics.img import Img
+from src.graphics.compositing import SPRITE_OPACITY
+
+SPRITE_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+
+class SpriteCache:
+    """
+    Process-wide store of decoded sprite folders. Every folder is decoded once per
+    (path, size, interpolation) and its frames are packed into a single read-only
+    atlas array of shape (frames, height, width, channels); the Img objects handed
+    out wrap views into that atlas instead of owning copies, and are premultiplied
+    for compositing while loading.
+    """
+
+    def __init__(self):
+        self._atlases: Dict[Tuple[pathlib.Path, Tuple[int, int], int], Tuple[np.ndarray, List[Img]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, folder: pathlib.Path, size: Tuple[int, int],
+            interpolation: int = cv2.INTER_AREA) -> List[Img]:
+        """Frames of folder resized to size=(width, height), in file-name order."""
+        key = (pathlib.Path(folder).resolve(), tuple(size), interpolation)
+        entry = self._atlases.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._atlases.get(key)
+                if entry is None:
+                    entry = self._build(folder, size, interpolation)
+                    self._atlases[key] = entry
+        return list(entry[1])
+
+    def atlas(self, folder: pathlib.Path, size: Tuple[int, int],
+              interpolation: int = cv2.INTER_AREA) -> np.ndarray:
+        self.get(folder, size, interpolation)
+        return self._atlases[(pathlib.Path(folder).resolve(), tuple(size), interpolation)][0]
+
+    def clear(self):
+        with self._lock:
+            self._atlases.clear()
+
+    def __len__(self) -> int:
+        return len(self._atlases)
+
+    @staticmethod
+    def _build(folder: pathlib.Path, size: Tuple[int, int], interpolation: int) -> Tuple[np.ndarray, List[Img]]:
+        frames = []
+        for img_path in sorted(pathlib.Path(folder).iterdir()):
+            if img_path.suffix.lower() in SPRITE_SUFFIXES:
+                frame = Img().read(img_path, size=size, interpolation=interpolation).img
+                if frame.ndim == 2:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+                frames.append(frame)
+
+        if not frames:
+            return np.empty((0, size[1], size[0], 4), dtype=np.uint8), []
+
+        # Mixed BGR / BGRA folders are widened to BGRA so the frames stack into one array
+        channels = max(frame.shape[2] for frame in frames)
+        frames = [cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA) if frame.shape[2] < channels else frame
+                  for frame in frames]
+        atlas = np.stack(frames)
+        atlas.flags.writeable = False
+
+        views = []
+        for i in range(len(atlas)):
+            view = Img()
+            view.img = atlas[i]
+            view.premultiplied(SPRITE_OPACITY)
+            views.append(view)
+        return atlas, views
+
+
+sprite_cache = SpriteCache()
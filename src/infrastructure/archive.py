@@ -0,0 +1,224 @@
+import mmap
+import pathlib
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.board import Board
+from src.infrastructure.journal import COMMAND_RECORD, JournalEntry, pack_entry, unpack_entry
+from src.input.command import Command
+
+ARCHIVE_MAGIC = b'KFA1'
+GAME_MAGIC = b'KFG1'
+INDEX_MAGIC = b'KFAX'
+
+WINNERS: Tuple[Optional[str], ...] = (None, 'white', 'black')
+_WINNER_CODES = {winner: code for code, winner in enumerate(WINNERS)}
+
+# All layouts are little-endian without padding
+# magic, format version
+ARCHIVE_HEADER = struct.Struct('<4sI')
+# magic, game id, winner, white score, black score, end time ms, command count; followed by the commands
+GAME_HEADER = struct.Struct('<4sQBHHII')
+# game id, offset of its game header, winner, white score, black score, end time ms, command count
+INDEX_RECORD = struct.Struct('<QQBHHII')
+# index offset, game count, magic: always the last 20 bytes of a closed archive
+TRAILER = struct.Struct('<QQ4s')
+GAME_ID = struct.Struct('<Q')  # leading field of an index record
+
+ARCHIVE_VERSION = 1
+
+# The same layouts as numpy dtypes, so the index and command streams are read in place from the map
+INDEX_DTYPE = np.dtype([('game_id', '<u8'), ('offset', '<u8'), ('winner', 'u1'), ('white_score', '<u2'),
+                        ('black_score', '<u2'), ('end_ms', '<u4'), ('commands', '<u4')])
+COMMAND_DTYPE = np.dtype([('applied_at', '<u4'), ('timestamp', '<u4'), ('type', 'S1'), ('color', 'S1'),
+                          ('serial', '<u2'), ('state', 'u1'), ('src_row', 'u1'), ('src_col', 'u1'),
+                          ('dst_row', 'u1'), ('dst_col', 'u1')])
+assert INDEX_DTYPE.itemsize == INDEX_RECORD.size and COMMAND_DTYPE.itemsize == COMMAND_RECORD.size
+
+
+class GameResult(NamedTuple):
+    winner: Optional[str]                   # 'white', 'black' or None for an unfinished match
+    white_score: int
+    black_score: int
+    end_ms: int
+    commands: Sequence[JournalEntry]        # accepted commands in the order they were applied
+
+
+class ArchiveWriter:
+    """
+    Appends finished matches to an archive. Each match is one contiguous block; the index of
+    every block is written as a footer on close. Reopening an archive drops its footer and
+    keeps appending, and an archive left without a footer by a crash is recovered by scanning
+    its complete blocks. Game ids must increase, so the footer stays sorted for lookups.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = pathlib.Path(path)
+        self._index: List[Tuple] = []
+        if self.path.exists() and self.path.stat().st_size > 0:
+            self._file: Optional[BinaryIO] = self.path.open('r+b')
+            end = self._load_index()
+            self._file.truncate(end)
+            self._file.seek(end)
+        else:
+            self._file = self.path.open('wb')
+            self._file.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION))
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append(self, result: GameResult, game_id: Optional[int] = None) -> int:
+        """Write one match; returns its id (one past the last id by default)."""
+        last_id = self._index[-1][0] if self._index else -1
+        game_id = last_id + 1 if game_id is None else game_id
+        if game_id <= last_id:
+            raise ValueError(f"Game ids must increase: {game_id} after {last_id}")
+        winner = _WINNER_CODES[result.winner]
+        offset = self._file.tell()
+        self._file.write(GAME_HEADER.pack(GAME_MAGIC, game_id, winner, result.white_score, result.black_score,
+                                          result.end_ms, len(result.commands)))
+        self._file.write(b''.join(pack_entry(entry) for entry in result.commands))
+        self._index.append((game_id, offset, winner, result.white_score, result.black_score,
+                            result.end_ms, len(result.commands)))
+        return game_id
+
+    def close(self):
+        if self._file is None:
+            return
+        index_offset = self._file.tell()
+        self._file.write(b''.join(INDEX_RECORD.pack(*record) for record in self._index))
+        self._file.write(TRAILER.pack(index_offset, len(self._index), INDEX_MAGIC))
+        self._file.close()
+        self._file = None
+
+    def _load_index(self) -> int:
+        """Read the existing index; returns where new games go."""
+        data = self._file.read()
+        _check_header(data, self.path)
+        if len(data) >= ARCHIVE_HEADER.size + TRAILER.size:
+            index_offset, count, magic = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+            if magic == INDEX_MAGIC and index_offset + count * INDEX_RECORD.size == len(data) - TRAILER.size:
+                self._index = [INDEX_RECORD.unpack_from(data, index_offset + i * INDEX_RECORD.size)
+                               for i in range(count)]
+                return index_offset
+        # No footer: the writer never closed, keep every complete game block
+        offset = ARCHIVE_HEADER.size
+        while offset + GAME_HEADER.size <= len(data):
+            magic, game_id, winner, white, black, end_ms, count = GAME_HEADER.unpack_from(data, offset)
+            size = GAME_HEADER.size + count * COMMAND_RECORD.size
+            if magic != GAME_MAGIC or offset + size > len(data):
+                break
+            self._index.append((game_id, offset, winner, white, black, end_ms, count))
+            offset += size
+        return offset
+
+
+class ArchivedGame:
+    """One match read in place from an archive; commands is a numpy view of its command records."""
+
+    __slots__ = ('game_id', 'winner', 'white_score', 'black_score', 'end_ms', 'commands')
+
+    def __init__(self, game_id: int, winner: Optional[str], white_score: int, black_score: int,
+                 end_ms: int, commands: np.ndarray):
+        self.game_id = game_id
+        self.winner = winner
+        self.white_score = white_score
+        self.black_score = black_score
+        self.end_ms = end_ms
+        self.commands = commands
+
+    def entries(self) -> Iterator[JournalEntry]:
+        data = memoryview(self.commands.view(np.uint8))
+        for offset in range(0, len(data), COMMAND_RECORD.size):
+            yield unpack_entry(data, offset)
+
+    def to_commands(self, board: Board) -> List[Command]:
+        return [entry.to_command(board) for entry in self.entries()]
+
+    def result(self) -> GameResult:
+        return GameResult(self.winner, self.white_score, self.black_score, self.end_ms, tuple(self.entries()))
+
+
+class GameArchive:
+    """
+    Read-only, memory-mapped view of an archive. Opening it reads only the footer; the index
+    and each game's commands are numpy views into the map, so nothing is copied or parsed
+    until it is used. Games are found by id with a binary search over the index.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = pathlib.Path(path)
+        with self.path.open('rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(self._map, self.path)
+        if len(self._map) < ARCHIVE_HEADER.size + TRAILER.size:
+            raise ValueError(f"{self.path} has no index")
+        index_offset, count, magic = TRAILER.unpack_from(self._map, len(self._map) - TRAILER.size)
+        if magic != INDEX_MAGIC or index_offset + count * INDEX_RECORD.size != len(self._map) - TRAILER.size:
+            raise ValueError(f"{self.path} has no index; reopen it with ArchiveWriter to recover it")
+        self._index_offset = index_offset
+        self.index: np.ndarray = np.frombuffer(self._map, INDEX_DTYPE, count, index_offset)
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[ArchivedGame]:
+        for position in range(len(self.index)):
+            yield self._game(position)
+
+    def __contains__(self, game_id: int) -> bool:
+        return self._position(game_id) is not None
+
+    def __getitem__(self, game_id: int) -> ArchivedGame:
+        position = self._position(game_id)
+        if position is None:
+            raise KeyError(game_id)
+        return self._game(position)
+
+    def close(self):
+        """Unmap the file; views of games taken from this archive must be dropped first."""
+        self.index = self.index[:0].copy()
+        self._map.close()
+
+    def _position(self, game_id: int) -> Optional[int]:
+        # Binary search reading ids straight from the map: searching the strided id column
+        # with numpy would first copy it, which costs more than the whole search
+        low, high = 0, len(self.index)
+        while low < high:
+            middle = (low + high) // 2
+            if GAME_ID.unpack_from(self._map, self._index_offset + middle * INDEX_RECORD.size)[0] < game_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.index) and int(self.index['game_id'][low]) == game_id:
+            return low
+        return None
+
+    def _game(self, position: int) -> ArchivedGame:
+        game_id, offset, winner, white, black, end_ms, count = self.index[position].tolist()
+        commands = np.frombuffer(self._map, COMMAND_DTYPE, count, offset + GAME_HEADER.size)
+        return ArchivedGame(game_id, WINNERS[winner], white, black, end_ms, commands)
+
+
+def _check_header(data, path: pathlib.Path):
+    if len(data) < ARCHIVE_HEADER.size:
+        raise ValueError(f"{path} is too short to be an archive")
+    magic, version = ARCHIVE_HEADER.unpack_from(data, 0)
+    if magic != ARCHIVE_MAGIC:
+        raise ValueError(f"{path} is not a game archive (magic {magic!r})")
+    if version != ARCHIVE_VERSION:
+        raise ValueError(f"{path} is archive version {version}, expected {ARCHIVE_VERSION}")
@@ -0,0 +1,149 @@
+import pathlib
+import struct
+from typing import BinaryIO, List, NamedTuple, Optional, Tuple
+
+from src.core.board import Board
+from src.core.snapshot import STATE_CODES, STATES, Snapshot, decode_snapshot, encode_snapshot
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+
+JOURNAL_MAGIC = b'KFJ1'
+
+# All layouts are little-endian without padding
+# magic, tick ms, board width, board height
+JOURNAL_HEADER = struct.Struct('<4sHBB')
+# applied-at ms, command timestamp, piece type, color, serial, command type, source row/col, destination row/col
+COMMAND_RECORD = struct.Struct('<IIccHBBBBB')
+SNAPSHOT_LENGTH = struct.Struct('<I')
+END_RECORD = struct.Struct('<I')
+
+# Every entry is one kind byte followed by its record
+COMMAND_ENTRY = b'C'
+SNAPSHOT_ENTRY = b'S'
+END_ENTRY = b'E'
+
+
+class JournalEntry(NamedTuple):
+    applied_at: int                 # game time of the tick that accepted the command
+    timestamp: int
+    piece_id: str
+    type: StatesNames
+    src: Tuple[int, int]
+    dst: Tuple[int, int]
+
+    @classmethod
+    def from_command(cls, applied_at: int, cmd: Command, board: Board, piece_id: Optional[str] = None) -> "JournalEntry":
+        """Entry for cmd as accepted at applied_at; piece_id overrides the command's own."""
+        return cls(applied_at, int(cmd.timestamp), piece_id if piece_id is not None else cmd.piece_id, cmd.type,
+                   board.square_to_cell(cmd.params[0]), board.square_to_cell(cmd.params[1]))
+
+    def to_command(self, board: Board) -> Command:
+        return Command(self.timestamp, self.piece_id, self.type,
+                       (board.cell_to_square(self.src), board.cell_to_square(self.dst)))
+
+
+def pack_entry(entry: JournalEntry) -> bytes:
+    piece_id = entry.piece_id
+    return COMMAND_RECORD.pack(entry.applied_at, entry.timestamp, piece_id[0].encode(), piece_id[1].encode(),
+                               int(piece_id[3:]), STATE_CODES[entry.type], entry.src[0], entry.src[1],
+                               entry.dst[0], entry.dst[1])
+
+
+def unpack_entry(data, offset: int = 0) -> JournalEntry:
+    (applied_at, timestamp, p_type, color, serial, cmd_type,
+     src_row, src_col, dst_row, dst_col) = COMMAND_RECORD.unpack_from(data, offset)
+    return JournalEntry(applied_at, timestamp, f"{p_type.decode()}{color.decode()}_{serial}",
+                        STATES[cmd_type], (src_row, src_col), (dst_row, dst_col))
+
+
+class CommandJournal:
+    """
+    Append-only binary record of a match: every command the game accepted, tagged with the
+    tick that applied it, plus a keyframe snapshot every keyframe_interval_ms for seeking.
+    Entries are written in order and a torn final entry is ignored on reading, so a match
+    that crashes still leaves a usable journal.
+    """
+
+    def __init__(self, path: pathlib.Path, board: Board, tick_ms: int, keyframe_interval_ms: int = 5000):
+        self.path = pathlib.Path(path)
+        self.board = board
+        self.tick_ms = tick_ms
+        self.keyframe_interval_ms = keyframe_interval_ms
+        self._next_keyframe_ms: Optional[int] = None
+        self._file: Optional[BinaryIO] = self.path.open('wb')
+        self._file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, tick_ms, board.W_cells, board.H_cells))
+
+    def record(self, applied_at: int, cmd: Command, piece_id: Optional[str] = None):
+        """Append a command accepted by the tick at applied_at; piece_id overrides the command's own."""
+        self.append(JournalEntry.from_command(applied_at, cmd, self.board, piece_id))
+
+    def append(self, entry: JournalEntry):
+        self._file.write(COMMAND_ENTRY + pack_entry(entry))
+
+    def keyframe_due(self, now_ms: int) -> bool:
+        return self._next_keyframe_ms is None or now_ms >= self._next_keyframe_ms
+
+    def write_keyframe(self, snapshot: Snapshot):
+        data = encode_snapshot(snapshot)
+        self._file.write(SNAPSHOT_ENTRY + SNAPSHOT_LENGTH.pack(len(data)) + data)
+        self._file.flush()
+        self._next_keyframe_ms = snapshot.time_ms + self.keyframe_interval_ms
+
+    def close(self, end_ms: Optional[int] = None):
+        """Finish the journal; end_ms marks the game time the match ended at."""
+        if self._file is None:
+            return
+        if end_ms is not None:
+            self._file.write(END_ENTRY + END_RECORD.pack(end_ms))
+        self._file.close()
+        self._file = None
+
+
+class JournalContents(NamedTuple):
+    tick_ms: int
+    width: int
+    height: int
+    commands: List[JournalEntry]
+    keyframes: List[Snapshot]       # in time order, the first is the starting position
+    end_ms: Optional[int]
+
+
+def read_journal(path: pathlib.Path) -> JournalContents:
+    data = pathlib.Path(path).read_bytes()
+    if len(data) < JOURNAL_HEADER.size:
+        raise ValueError(f"{path} is too short to be a journal")
+    magic, tick_ms, width, height = JOURNAL_HEADER.unpack_from(data, 0)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError(f"{path} is not a journal (magic {magic!r})")
+
+    commands: List[JournalEntry] = []
+    keyframes: List[Snapshot] = []
+    end_ms = None
+    offset = JOURNAL_HEADER.size
+    while offset < len(data):
+        kind, offset = data[offset:offset + 1], offset + 1
+        if kind == COMMAND_ENTRY:
+            if offset + COMMAND_RECORD.size > len(data):
+                break
+            commands.append(unpack_entry(data, offset))
+            offset += COMMAND_RECORD.size
+        elif kind == SNAPSHOT_ENTRY:
+            if offset + SNAPSHOT_LENGTH.size > len(data):
+                break
+            (length,) = SNAPSHOT_LENGTH.unpack_from(data, offset)
+            offset += SNAPSHOT_LENGTH.size
+            if offset + length > len(data):
+                break
+            keyframes.append(decode_snapshot(data[offset:offset + length]))
+            offset += length
+        elif kind == END_ENTRY:
+            if offset + END_RECORD.size > len(data):
+                break
+            (end_ms,) = END_RECORD.unpack_from(data, offset)
+            offset += END_RECORD.size
+        else:
+            raise ValueError(f"Corrupt journal entry {kind!r} at byte {offset - 1} of {path}")
+
+    if not keyframes:
+        raise ValueError(f"{path} has no starting snapshot")
+    return JournalContents(tick_ms, width, height, commands, keyframes, end_ms)
@@ -1,13 +1,13 @@
 from typing import Any
-from src.input.event_bus import Event
+from src.input.event_bus import MoveEvent
 
 
 class Log:
     def __init__(self):
         self.log: list[dict[str, Any]] = []
 
-    def update_log(self, event: Event):
-        event_time = event.data.get('time')
+    def update_log(self, event: MoveEvent):
+        event_time = event.time
         if isinstance(event_time, (int, float)):
             # Convert milliseconds to HH:MM:SS format
             seconds = event_time / 1000  # Convert ms to seconds
@@ -21,7 +21,7 @@ class Log:
 
         activity = {
             'time': time_str,
-            'source': event.data['source'],
-            'destination': event.data['destination']
+            'source': event.source,
+            'destination': event.destination
         }
         self.log.append(activity)
\ No newline at end of file
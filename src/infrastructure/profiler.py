@@ -0,0 +1,81 @@
+import time
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from src.enums.profile_metrics import ProfileMetrics
+
+
+class Stats(NamedTuple):
+    samples: int
+    mean: float
+    p50: float
+    p99: float
+    max: float
+
+
+class _Ring:
+    # A plain list: storing a float into it is several times cheaper than into a numpy array
+    __slots__ = ('values', 'count')
+
+    def __init__(self, capacity: int):
+        self.values = [0.0] * capacity
+        self.count = 0
+
+    def push(self, value: float):
+        self.values[self.count % len(self.values)] = value
+        self.count += 1
+
+    def recent(self) -> np.ndarray:
+        return np.asarray(self.values[:min(self.count, len(self.values))], dtype=np.float64)
+
+
+class TickProfiler:
+    """
+    Per-phase timings (ms) and counters of the last `capacity` ticks or frames, each kept in
+    its own ring buffer. The game only calls into a profiler it was given, so a game without
+    one pays a single None check per phase.
+
+    Timings are taken between marks: mark() starts the clock and every lap(phase) records
+    the time since the previous mark or lap.
+    """
+
+    def __init__(self, capacity: int = 600, overlay: bool = False):
+        self.capacity = capacity
+        self.overlay = overlay  # draw stats_lines() over the live game window
+        self._rings: Dict[ProfileMetrics, _Ring] = {}
+        self._last = time.perf_counter()
+
+    def mark(self):
+        self._last = time.perf_counter()
+
+    def lap(self, phase: ProfileMetrics):
+        now = time.perf_counter()
+        self.record(phase, (now - self._last) * 1000)
+        self._last = now
+
+    def record(self, name: ProfileMetrics, value: float):
+        ring = self._rings.get(name)
+        if ring is None:
+            ring = self._rings[name] = _Ring(self.capacity)
+        ring.push(value)
+
+    def names(self) -> List[ProfileMetrics]:
+        return list(self._rings)
+
+    def stats(self, name: ProfileMetrics) -> Stats:
+        ring = self._rings.get(name)
+        if ring is None or ring.count == 0:
+            return Stats(0, 0.0, 0.0, 0.0, 0.0)
+        values = ring.recent()
+        p50, p99 = np.percentile(values, (50, 99))
+        return Stats(ring.count, float(values.mean()), float(p50), float(p99), float(values.max()))
+
+    def summary(self) -> Dict[ProfileMetrics, Stats]:
+        return {name: self.stats(name) for name in self._rings}
+
+    def stats_lines(self) -> List[str]:
+        return [f"{name.value:<18}p50 {s.p50:7.2f}  p99 {s.p99:7.2f}" for name, s in self.summary().items()]
+
+    def reset(self):
+        self._rings.clear()
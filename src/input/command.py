@@ -1,11 +1,16 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 from src.enums.states_names import StatesNames
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Command:
     timestamp: int          # ms since game start
     piece_id: str
     type: StatesNames               # "Move" | "Jump" | …
-    params: List          # payload (e.g. ["e2", "e4"])
\ No newline at end of file
+    params: Tuple          # (source, destination) square numbers, row * W_cells + col (e.g. (52, 36) for e2 -> e4)
+
+    def __post_init__(self):
+        # Commands are shared between pieces, states and journals, so their payload must not change
+        if type(self.params) is not tuple:
+            object.__setattr__(self, 'params', tuple(self.params))
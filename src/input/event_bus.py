@@ -1,30 +1,157 @@
-from typing import Callable, Dict, List
+import queue
+import threading
+import traceback
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+from src.enums.dispatch_modes import DispatchModes
 from src.enums.events_names import EventsNames
 
 
 class Event:
-    def __init__(self, name : EventsNames, data: dict):
+    """Base of every published event. Subclasses declare their fields in __slots__, and subscribers read them directly."""
+    __slots__ = ('name',)
+
+    def __init__(self, name: EventsNames):
         self.name = name
+
+
+class DataEvent(Event):
+    """An event carrying a free-form dict."""
+    __slots__ = ('data',)
+
+    def __init__(self, name: EventsNames, data: dict):
+        super().__init__(name)
         self.data = data
 
+
+class SoundEvent(Event):
+    __slots__ = ('sound',)
+
+    def __init__(self, name: EventsNames, sound: str):
+        super().__init__(name)
+        self.sound = sound
+
+
+class MoveEvent(SoundEvent):
+    __slots__ = ('player', 'time', 'source', 'destination')
+
+    def __init__(self, name: EventsNames, player: str, time: int, source: str, destination: str,
+                 sound: str = 'move.wav'):
+        super().__init__(name, sound)
+        self.player = player
+        self.time = time
+        self.source = source
+        self.destination = destination
+
+
+class CaptureEvent(SoundEvent):
+    __slots__ = ('capture_piece', 'captured_piece')
+
+    def __init__(self, name: EventsNames, capture_piece: str, captured_piece: str, sound: str = 'capture.wav'):
+        super().__init__(name, sound)
+        self.capture_piece = capture_piece
+        self.captured_piece = captured_piece
+
+
+Subscriber = Callable[[Event], None]
+
+
 class EventBus:
-    def __init__(self):
-        self._subscribers: Dict[EventsNames, List[Callable[[Event], None]]] = {}
+    """
+    Delivers events to subscribers in one of three modes, chosen per subscription:
+    SYNC calls the subscriber inside publish, DEFERRED batches it until flush() (the game
+    calls it at the end of every tick) and WORKER hands it to a small pool of threads, so
+    slow subscribers such as audio never run inside the game loop. Deferred and worker
+    events are bounded per topic: past queue_limit pending events a topic drops new ones
+    and counts them in `dropped`.
+    """
 
-    def subscribe(self, topic: EventsNames, callback: Callable[[Event], None]) -> None:
-        if topic not in self._subscribers:
-            self._subscribers[topic] = []
-        self._subscribers[topic].append(callback)
+    def __init__(self, queue_limit: int = 64, workers: int = 2):
+        self._subscribers: Dict[EventsNames, List[Tuple[Subscriber, DispatchModes]]] = {}
+        self.queue_limit = queue_limit
+        self.dropped: Dict[EventsNames, int] = {}
+        self._deferred: List[Tuple[Subscriber, Event, EventsNames]] = []
+        self._pending: Dict[EventsNames, int] = {}  # queued deferred or worker deliveries per topic
+        self._pending_lock = threading.Lock()
+        self._worker_count = workers
+        self._work: Optional[queue.Queue] = None  # created with the workers on first WORKER subscription
+        self._workers: List[threading.Thread] = []
 
-    def unsubscribe(self, topic: EventsNames, callback: Callable[[Event], None]) -> None:
-        if topic in self._subscribers:
-            self._subscribers[topic].remove(callback)
+    def subscribe(self, topic: EventsNames, callback: Subscriber,
+                  mode: DispatchModes = DispatchModes.SYNC) -> None:
+        if mode == DispatchModes.WORKER:
+            self._start_workers()
+        self._subscribers.setdefault(topic, []).append((callback, mode))
 
-    def publish(self, topic: EventsNames, data: dict) -> None:
+    def unsubscribe(self, topic: EventsNames, callback: Subscriber) -> None:
         if topic in self._subscribers:
-            event = Event(topic, data)
-            for callback in self._subscribers[topic]:
+            self._subscribers[topic] = [(c, m) for c, m in self._subscribers[topic] if c != callback]
+
+    def publish(self, topic: EventsNames, data: Union[Event, dict]) -> None:
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+        event = data if isinstance(data, Event) else DataEvent(topic, data)
+        for callback, mode in subscribers:
+            if mode == DispatchModes.SYNC:
+                callback(event)
+            elif self._reserve(topic):
+                if mode == DispatchModes.DEFERRED:
+                    self._deferred.append((callback, event, topic))
+                else:
+                    self._work.put((callback, event, topic))
+
+    def flush(self) -> None:
+        """Deliver the deferred events, in publish order; call from the thread that publishes."""
+        while self._deferred:
+            batch, self._deferred = self._deferred, []
+            for callback, event, topic in batch:
+                self._release(topic)
+                callback(event)
+
+    def close(self) -> None:
+        """Deliver what is deferred, let the workers finish their queue and stop them."""
+        self.flush()
+        for _ in self._workers:
+            self._work.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        self._work = None
+
+    def _reserve(self, topic: EventsNames) -> bool:
+        with self._pending_lock:
+            pending = self._pending.get(topic, 0)
+            if pending >= self.queue_limit:
+                self.dropped[topic] = self.dropped.get(topic, 0) + 1
+                return False
+            self._pending[topic] = pending + 1
+            return True
+
+    def _release(self, topic: EventsNames):
+        with self._pending_lock:
+            self._pending[topic] -= 1
+
+    def _start_workers(self):
+        if self._workers:
+            return
+        self._work = queue.Queue()
+        for i in range(self._worker_count):
+            worker = threading.Thread(target=self._work_loop, args=(self._work,), name=f"event-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _work_loop(self, work: queue.Queue):
+        while True:
+            item = work.get()
+            if item is None:
+                return
+            callback, event, topic = item
+            self._release(topic)
+            try:
                 callback(event)
+            except Exception:
+                # A failing subscriber must not take the worker down with it
+                traceback.print_exc()
 
-event_bus = EventBus()
\ No newline at end of file
+event_bus = EventBus()
@@ -0,0 +1,104 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.core.clock import Clock
+from src.enums.input_actions import InputActions
+
+# key name -> (player, action); player 0 is for keys that are not tied to a player
+DEFAULT_BINDINGS: Dict[str, Tuple[int, InputActions]] = {
+    'up': (1, InputActions.UP),
+    'down': (1, InputActions.DOWN),
+    'left': (1, InputActions.LEFT),
+    'right': (1, InputActions.RIGHT),
+    'enter': (1, InputActions.SELECT),
+    'w': (2, InputActions.UP),
+    's': (2, InputActions.DOWN),
+    'a': (2, InputActions.LEFT),
+    'd': (2, InputActions.RIGHT),
+    'space': (2, InputActions.SELECT),
+    'esc': (0, InputActions.QUIT),
+}
+
+# Actions that fire again while their key is held
+REPEATING = frozenset({InputActions.UP, InputActions.DOWN, InputActions.LEFT, InputActions.RIGHT})
+
+
+@dataclass(frozen=True)
+class PlayerAction:
+    timestamp: int          # ms of game time
+    player: int
+    action: InputActions
+
+
+class KeyboardInput:
+    """
+    Turns key events into timestamped PlayerActions. Key events arrive on the keyboard
+    library's listener thread and are only appended to a per-player deque (append and
+    popleft are atomic, so no lock is shared with the game loop). Everything else,
+    including key-repeat, happens in poll() on the game loop, with a separate repeat
+    schedule for every held key so one player's held key never delays the other's input.
+    """
+
+    def __init__(self, clock: Clock, backend: Any = None,
+                 bindings: Optional[Dict[str, Tuple[int, InputActions]]] = None,
+                 repeat_delay_ms: int = 250, repeat_interval_ms: int = 120):
+        self._clock = clock
+        self._backend = backend
+        self._bindings = dict(bindings if bindings is not None else DEFAULT_BINDINGS)
+        self.repeat_delay_ms = repeat_delay_ms
+        self.repeat_interval_ms = repeat_interval_ms
+        # player -> raw (timestamp, key, pressed) events, filled by the listener thread
+        self._queues: Dict[int, Deque[Tuple[int, str, bool]]] = {
+            player: deque() for player, _ in self._bindings.values()}
+        # key -> time of its next repeat; owned by the game loop
+        self._held: Dict[str, int] = {}
+        self._hook = None
+
+    def start(self):
+        """Start receiving key events from the backend (the `keyboard` module)."""
+        if self._hook is None and self._backend is not None:
+            self._hook = self._backend.hook(self._on_key_event)
+
+    def stop(self):
+        if self._hook is not None:
+            self._backend.unhook(self._hook)
+            self._hook = None
+
+    def push(self, key: str, pressed: bool, timestamp_ms: Optional[int] = None):
+        """Record a key press or release; safe to call from any thread. Unbound keys are ignored."""
+        binding = self._bindings.get(key)
+        if binding is None:
+            return
+        if timestamp_ms is None:
+            timestamp_ms = self._clock.now_ms()
+        self._queues[binding[0]].append((timestamp_ms, key, pressed))
+
+    def poll(self, now_ms: int) -> List[PlayerAction]:
+        """Every action due by now_ms, from all players, in timestamp order."""
+        actions = []
+        for queue in self._queues.values():
+            while queue:
+                timestamp, key, pressed = queue.popleft()
+                if not pressed:
+                    self._held.pop(key, None)
+                elif key not in self._held:  # the OS's own auto-repeat is ignored
+                    player, action = self._bindings[key]
+                    actions.append(PlayerAction(timestamp, player, action))
+                    if action in REPEATING:
+                        self._held[key] = timestamp + self.repeat_delay_ms
+
+        for key, next_ms in self._held.items():
+            if next_ms <= now_ms:
+                player, action = self._bindings[key]
+                actions.append(PlayerAction(next_ms, player, action))
+                next_ms += self.repeat_interval_ms
+                if next_ms <= now_ms:  # a stalled frame yields one repeat, not a burst
+                    next_ms = now_ms + self.repeat_interval_ms
+                self._held[key] = next_ms
+        actions.sort(key=lambda a: a.timestamp)
+        return actions
+
+    def _on_key_event(self, event):
+        if event.name and event.event_type in ('down', 'up'):
+            self.push(event.name.lower(), event.event_type == 'down')
@@ -0,0 +1,34 @@
+from collections import deque
+from typing import Iterable, List, Optional, TYPE_CHECKING
+
+from src.input.command import Command
+
+if TYPE_CHECKING:
+    from src.core.board import Board
+
+
+class ScriptedCommandSource:
+    """Feeds a fixed list of commands, releasing each once game time reaches its timestamp."""
+
+    def __init__(self, commands: Iterable[Command]):
+        self._pending = deque(sorted(commands, key=lambda cmd: cmd.timestamp))
+
+    @classmethod
+    def from_notation(cls, board: "Board", commands: Iterable[Command]) -> "ScriptedCommandSource":
+        """A source for commands written with notation cells ("e2"), parsed into board's square numbers."""
+        return cls(Command(cmd.timestamp, cmd.piece_id, cmd.type,
+                           tuple(board.algebraic_to_square(cell) for cell in cmd.params))
+                   for cmd in commands)
+
+    def poll(self, now_ms: int) -> List[Command]:
+        """Return every command that is due at now_ms, in timestamp order."""
+        due = []
+        while self._pending and self._pending[0].timestamp <= now_ms:
+            due.append(self._pending.popleft())
+        return due
+
+    def next_timestamp(self) -> Optional[int]:
+        return self._pending[0].timestamp if self._pending else None
+
+    def exhausted(self) -> bool:
+        return not self._pending
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 from abc import ABC, abstractmethod
 
 from src.input.command import Command
@@ -6,9 +6,12 @@ from src.core.board import Board
 
 
 class Physics(ABC):
+    __slots__ = ('start_cell', 'board', 'speed_m_s', 'speed', 'pos', 'start_time', 'cmd', 'finished')
+
     def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0):
         self.start_cell = start_cell
         self.board = board
+        self.speed_m_s = speed_m_s
         self.speed = speed_m_s * 100
         self.pos = self.board.cell_to_world(start_cell)  # (x, y) in meters
         self.start_time = 0
@@ -38,11 +41,35 @@ class Physics(ABC):
     def get_pos_in_cell(self):
         return self.board.world_to_cell(self.pos)
 
+    def position_at(self, now_ms: int) -> Tuple[float, float]:
+        """Position at game time now_ms, without advancing this physics."""
+        return self.pos
+
+    def cell_at(self, now_ms: int) -> Tuple[int, int]:
+        return self.board.world_to_cell(self.position_at(now_ms))
+
+    def next_event_ms(self) -> Optional[int]:
+        """Game time this physics finishes, or None if it never does or has not started yet."""
+        hold = self.hold_ms()
+        if hold is None or self.start_time is None:
+            return None
+        return self.start_time + hold
+
+    def get_target_cell(self) -> Tuple[int, int]:
+        """The cell this physics is heading to; pieces that do not travel stay on start_cell."""
+        return self.start_cell
+
+    def hold_ms(self) -> Optional[int]:
+        """How long this physics runs before it finishes, when that does not depend on the command."""
+        return None
+
 
 class IdlePhysics(Physics):
+    __slots__ = ()
+
     def reset(self, cmd: Command):
         super().reset(cmd)
-        self.start_cell = tuple(cmd.params[0])
+        self.start_cell = self.board.square_to_cell(cmd.params[0])
         self.pos = self.board.cell_to_world(self.start_cell)
 
     def update(self, now_ms: int):
@@ -57,6 +84,8 @@ class IdlePhysics(Physics):
 
 
 class MovePhysics(Physics):
+    __slots__ = ('start_pos', 'end_pos', 'end_cell', 'duration_ms', 'total_duration_ms', 'extra_delay_ms')
+
     def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0):
         super().__init__(start_cell, board, speed_m_s)
         self.start_pos = self.board.cell_to_world(start_cell)
@@ -69,19 +98,24 @@ class MovePhysics(Physics):
     def reset(self, cmd: Command):
         self.cmd = cmd
         self.finished = False
-        self.start_cell = self.board.algebraic_to_cell(cmd.params[0])
-        self.end_cell = self.board.algebraic_to_cell(cmd.params[1])
+        self.start_cell = self.board.square_to_cell(cmd.params[0])
+        self.end_cell = self.board.square_to_cell(cmd.params[1])
         self.start_pos = self.board.cell_to_world(self.start_cell)
         self.end_pos = self.board.cell_to_world(self.end_cell)
         self.pos = self.start_pos
-        dist = ((self.end_pos[0] - self.start_pos[0]) ** 2 +
-                (self.end_pos[1] - self.start_pos[1]) ** 2) ** 0.5
-        # Calculate the required time based on distance and speed – movement part
-        self.duration_ms = max(1, int((dist / self.speed) * 1000))
+        self.duration_ms = self.travel_ms(self.start_cell, self.end_cell)
         # Total time including the delay after movement
         self.total_duration_ms = self.duration_ms + self.extra_delay_ms
         self.start_time = None
 
+    def travel_ms(self, start_cell: Tuple[int, int], end_cell: Tuple[int, int]) -> int:
+        """Time the movement part of start_cell -> end_cell takes at this piece's speed."""
+        start_pos = self.board.cell_to_world(start_cell)
+        end_pos = self.board.cell_to_world(end_cell)
+        dist = ((end_pos[0] - start_pos[0]) ** 2 + (end_pos[1] - start_pos[1]) ** 2) ** 0.5
+        # Calculate the required time based on distance and speed – movement part
+        return max(1, int((dist / self.speed) * 1000))
+
     def update(self, now_ms: int):
         if self.finished:
             return self.cmd
@@ -89,19 +123,28 @@ class MovePhysics(Physics):
         if self.start_time is None:
             self.start_time = now_ms
 
-        elapsed = now_ms - self.start_time
-        if elapsed < self.duration_ms:
-            # Normal movement until destination – position updates linearly
-            t = elapsed / self.duration_ms
-            self.pos = (
-                self.start_pos[0] + t * (self.end_pos[0] - self.start_pos[0]),
-                self.start_pos[1] + t * (self.end_pos[1] - self.start_pos[1])
-            )
-        elif elapsed < self.total_duration_ms:
-            self.pos = self.end_pos
-        else:
+        self.pos = self.position_at(now_ms)
+        if now_ms - self.start_time >= self.total_duration_ms:
             self.finished = True
 
+    def position_at(self, now_ms: int) -> Tuple[float, float]:
+        if self.start_time is None:
+            return self.start_pos
+        elapsed = now_ms - self.start_time
+        if elapsed >= self.duration_ms:
+            return self.end_pos
+        # Normal movement until destination – position updates linearly
+        t = max(0.0, elapsed / self.duration_ms)
+        return (
+            self.start_pos[0] + t * (self.end_pos[0] - self.start_pos[0]),
+            self.start_pos[1] + t * (self.end_pos[1] - self.start_pos[1])
+        )
+
+    def next_event_ms(self) -> Optional[int]:
+        if self.start_time is None:
+            return None
+        return self.start_time + self.total_duration_ms
+
     def can_be_captured(self) -> bool:
         return True
 
@@ -111,14 +154,24 @@ class MovePhysics(Physics):
     def get_pos(self) -> Tuple[int, int]:
         return self.pos
 
+    def get_target_cell(self) -> Tuple[int, int]:
+        return self.end_cell
+
 
 class JumpPhysics(Physics):
+    __slots__ = ('jump_duration', 'end_cell')
+    JUMP_MS = 1000
+
+    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0,
+                 duration_ms: Optional[int] = None):
+        super().__init__(start_cell, board, speed_m_s)
+        self.jump_duration = self.JUMP_MS if duration_ms is None else duration_ms
+
     def reset(self, cmd: Command):
         super().reset(cmd)
-        self.jump_duration = 1000
         self.start_time = None
-        self.start_cell = self.board.algebraic_to_cell(cmd.params[0])
-        self.end_cell = self.board.algebraic_to_cell(cmd.params[1])
+        self.start_cell = self.board.square_to_cell(cmd.params[0])
+        self.end_cell = self.board.square_to_cell(cmd.params[1])
         self.pos = self.board.cell_to_world(self.end_cell)
 
     def update(self, now_ms: int):
@@ -132,12 +185,25 @@ class JumpPhysics(Physics):
     def can_capture(self) -> bool:
         return False
 
+    def get_target_cell(self) -> Tuple[int, int]:
+        return self.end_cell
+
+    def hold_ms(self) -> Optional[int]:
+        return self.jump_duration
+
 class ShortRestPhysics(Physics):
+    __slots__ = ('rest_duration',)
+    REST_MS = 500  # half sec
+
+    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0,
+                 duration_ms: Optional[int] = None):
+        super().__init__(start_cell, board, speed_m_s)
+        self.rest_duration = self.REST_MS if duration_ms is None else duration_ms
+
     def reset(self, cmd: Command):
         super().reset(cmd)
-        self.rest_duration = 500  # half sec
         self.start_time = None
-        self.start_cell = tuple(cmd.params[0])
+        self.start_cell = self.board.square_to_cell(cmd.params[0])
         self.pos = self.board.cell_to_world(self.start_cell)
         self.finished = False
 
@@ -153,12 +219,22 @@ class ShortRestPhysics(Physics):
     def can_capture(self) -> bool:
         return False
 
+    def hold_ms(self) -> Optional[int]:
+        return self.rest_duration
+
 class LongRestPhysics(Physics):
+    __slots__ = ('rest_duration',)
+    REST_MS = 1500  # 1.5 sec
+
+    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0,
+                 duration_ms: Optional[int] = None):
+        super().__init__(start_cell, board, speed_m_s)
+        self.rest_duration = self.REST_MS if duration_ms is None else duration_ms
+
     def reset(self, cmd: Command):
         super().reset(cmd)
-        self.rest_duration = 1500  # 1.5 sec
         self.start_time = None
-        self.start_cell = tuple(cmd.params[0])
+        self.start_cell = self.board.square_to_cell(cmd.params[0])
         self.pos = self.board.cell_to_world(self.start_cell)
         self.finished = False
 
@@ -173,4 +249,7 @@ class LongRestPhysics(Physics):
         return True
 
     def can_capture(self) -> bool:
-        return False
\ No newline at end of file
+        return False
+
+    def hold_ms(self) -> Optional[int]:
+        return self.rest_duration
@@ -11,6 +11,7 @@ class PhysicsFactory:
         """Create a physics object with the given configuration."""
         physics_cfg = cfg.get("physics", {})
         speed = physics_cfg.get("speed_m_per_sec", 1.0)
+        duration_ms = physics_cfg.get("duration_ms")  # fixed-length states only; None keeps the class default
 
         match state_name:
             case StatesNames.IDLE:
@@ -18,11 +19,11 @@ class PhysicsFactory:
             case StatesNames.MOVE:
                 return MovePhysics(start_cell, self.board, speed)
             case StatesNames.JUMP:
-                return JumpPhysics(start_cell, self.board, speed)
+                return JumpPhysics(start_cell, self.board, speed, duration_ms)
             case StatesNames.SHORT_REST:
-                return ShortRestPhysics(start_cell, self.board, speed)
+                return ShortRestPhysics(start_cell, self.board, speed, duration_ms)
             case StatesNames.LONG_REST:
-                return LongRestPhysics(start_cell, self.board, speed)
+                return LongRestPhysics(start_cell, self.board, speed, duration_ms)
             case _:
                 raise ValueError(f"Unknown state name: {state_name}")
 
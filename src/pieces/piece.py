@@ -1,20 +1,26 @@
 from src.physics.physics_factory import PhysicsFactory
 from src.core.board import Board
 from src.input.command import Command
-from src.input.event_bus import event_bus
+from src.input.event_bus import EventBus, MoveEvent, SoundEvent, event_bus
 from src.enums.events_names import EventsNames
 from src.core.state import State
-from typing import Optional
-import cv2
+from typing import Dict, FrozenSet, Optional, Tuple, TYPE_CHECKING
+from src.graphics.compositing import PremultipliedSprite, blit
 
 from src.enums.states_names import StatesNames
 
+if TYPE_CHECKING:
+    from src.pieces.piece_store import PieceStore
+
 
 class Piece:
-    def __init__(self, piece_id: str, init_state: State):
+    def __init__(self, piece_id: str, init_state: State, bus: Optional[EventBus] = None):
         self._id = piece_id
         self._state = init_state
         self._current_cmd: Optional[Command] = None
+        self._bus = bus if bus is not None else event_bus
+        self._store: Optional["PieceStore"] = None  # set by attach; positions and frames are then read from it
+        self._slot = -1
 
     @property
     def state(self):
@@ -26,21 +32,27 @@ class Piece:
                 self.publish_move(EventsNames.BLACK_MOVE if self._id[1] == 'B' else EventsNames.WHITE_MOVE, cmd, now_ms)
                 self._current_cmd = cmd
             if cmd.type == StatesNames.JUMP:
-                event_bus.publish(EventsNames('jump'), {'sound': 'jump.wav'})
+                self._bus.publish(EventsNames.JUMP, SoundEvent(EventsNames.JUMP, 'jump.wav'))
             self._state = self._state.process_command(cmd)
 
     def publish_move(self, event_name : EventsNames, cmd : Command, now_ms : int):
         player : str = cmd.piece_id[1]
-        source_cell : str = cmd.params[0]
-        destination_cell : str = cmd.params[1]
-        event_bus.publish(event_name, {'player': player, 'time': now_ms, 'source': source_cell, 'destination': destination_cell, 'sound': 'move.wav'})
+        board = self._state._physics.board
+        # The move log shows notation; everywhere else a move names its squares by number
+        source_cell : str = board.square_to_algebraic(cmd.params[0])
+        destination_cell : str = board.square_to_algebraic(cmd.params[1])
+        self._bus.publish(event_name, MoveEvent(event_name, player, now_ms, source_cell, destination_cell))
 
     def is_command_possible(self, cmd: Command, dst_empty: bool) -> bool:
         if cmd.type != StatesNames.MOVE:
             return cmd is not None and cmd.type in self._state.transitions
 
         src = self._state._physics.start_cell
-        dst = self._state._physics.board.algebraic_to_cell(cmd.params[1])
+        dst = self._state._physics.board.square_to_cell(cmd.params[1])
+        return self.is_move_legal(src, dst, dst_empty)
+
+    def is_move_legal(self, src: Tuple[int, int], dst: Tuple[int, int], dst_empty: bool) -> bool:
+        """Whether the piece's movement rules allow src -> dst, ignoring other pieces on the path."""
         legal = self._state._moves.get_moves(*src)
 
         if self._id[0] == 'P':
@@ -52,7 +64,7 @@ class Piece:
             if dst_x == src_x and dst_y == src_y + direction and dst_empty:
                 return True
 
-            start_row = 6 if self._id[1] == 'W' else 1
+            start_row = self._state._physics.board.H_cells - 2 if self._id[1] == 'W' else 1
             if (src_y == start_row and
                     dst_x == src_x and
                     dst_y == src_y + 2 * direction and
@@ -72,47 +84,38 @@ class Piece:
 
     def update(self, now_ms: int):
         self._state.update(now_ms)
-        if self._state._physics.finished:
+        physics = self._state._physics
+        if physics.finished:
             next_state =  next(iter(self._state.transitions.keys()))
-            new_cell = self._state._physics.get_pos_in_cell()
-            cmd = Command(now_ms, self._id, next_state, [new_cell, new_cell])
+            square = physics.board.cell_to_square(physics.get_pos_in_cell())
+            cmd = Command(now_ms, self._id, next_state, (square, square))
             self.on_command(cmd, now_ms)
 
-    def draw_on_board(self, board: Board, now_ms: int):
-        pos = self._state._physics.get_pos()
-        img = self._state._graphics.get_img().img
-        if img is not None:
-            h, w = img.shape[:2]
-            x, y = int(pos[0]), int(pos[1])
-
-            board_img = board.img.img
-
-            # התאמה אם חורג מגבולות
-            h = min(h, board_img.shape[0] - y)
-            w = min(w, board_img.shape[1] - x)
-
-            if h > 0 and w > 0:
-                piece_img = img[:h, :w]
-                base = board_img[y:y + h, x:x + w]
-
-                target_channels = base.shape[2]
-                piece_img = self._match_channels(piece_img, target_channels)
-
-                board_img[y:y + h, x:x + w] = self._blend(base, piece_img)
-
-    def _blend(self, base, overlay):
-        alpha = 0.8  # Simple fixed alpha
-        return cv2.addWeighted(overlay, alpha, base, 1 - alpha, 0)
-
-    def _match_channels(self, img, target_channels=3):
-        """Convert image to target_channels (3=BGR, 4=BGRA)."""
-        if img.shape[2] == target_channels:
-            return img
-        if target_channels == 3 and img.shape[2] == 4:
-            return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-        if target_channels == 4 and img.shape[2] == 3:
-            return cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
-        return img
+    def attach(self, store: "PieceStore", now_ms: int):
+        """Keep this piece's row in store, which then answers position_at and sprite_at."""
+        self._store = store
+        self._slot = store.add(self, now_ms)
+
+    def position_at(self, now_ms: int) -> Tuple[float, float]:
+        store = self._store
+        if store is not None and store.time_ms == now_ms:
+            return store.position(self._slot)
+        return self._state._physics.position_at(now_ms)
+
+    def sprite_at(self, now_ms: int) -> PremultipliedSprite:
+        """The sprite frame the current state shows at now_ms."""
+        graphics = self._state._graphics
+        store = self._store
+        if store is not None and store.time_ms == now_ms:
+            graphics.current_frame = store.frame_index(self._slot)
+        else:
+            graphics.update(now_ms)
+        return graphics.get_premultiplied()
+
+    def draw_on_board(self, board: Board, now_ms: int, clip: Optional[Tuple[int, int, int, int]] = None):
+        """Composite the current sprite onto the board, limited to clip=(x0, y0, x1, y1) when given."""
+        x, y = map(int, self.position_at(now_ms))
+        blit(board.img.img, self.sprite_at(now_ms), x, y, clip)
 
     def get_id(self):
         return self._id
@@ -120,25 +123,66 @@ class Piece:
     def get_command(self):
         return self._state.get_command()
 
-    def clone_to(self, cell: tuple[int, int], physics_factory: PhysicsFactory) -> "Piece":
+    def state_machine(self) -> Dict[StatesNames, State]:
+        """Every state of this piece by name."""
+        states: Dict[StatesNames, State] = {}
+        pending = [self._state]
+        while pending:
+            state = pending.pop()
+            if state.name not in states:
+                states[state.name] = state
+                pending.extend(state.transitions.values())
+        return states
+
+    def finished_states(self) -> FrozenSet[StatesNames]:
+        """States whose physics currently reports finished (it is kept between visits of a state)."""
+        return frozenset(name for name, state in self.state_machine().items() if state._physics.finished)
+
+    def restore(self, state_name: StatesNames, cmd: Optional[Command], start_cell: Tuple[int, int],
+                start_time: Optional[int], finished: FrozenSet[StatesNames]):
         """
-        Clone this piece to a new piece at a different cell.
-        Graphics is copied, physics is recreated (new cell), moves are shared.
+        Put the piece into state_name as if cmd had just entered it, with its physics started at
+        start_time. With cmd None the state is entered without a command, like a freshly placed piece.
         """
+        states = self.state_machine()
+        state = states[state_name]
+        if cmd is None:
+            square = state._physics.board.cell_to_square(start_cell)
+            state.reset(Command(0, self._id, state_name, (square, square)))
+            state._current_command = None
+        else:
+            state.reset(cmd)
+            if cmd.type == StatesNames.MOVE:
+                self._current_cmd = cmd
+        state._physics.start_time = start_time
+        for name, other in states.items():
+            other._physics.finished = name in finished
+        self._state = state
 
-        graphics_copy = self._state._graphics.copy()
-
-
-        state_name = self._state._physics.__class__.__name__.replace("Physics", "").lower()
-        speed = getattr(self._state._physics, "speed", 1.0)
-
-        cfg = {"physics": {"speed_m_per_sec": speed}}
-
-        new_physics = physics_factory.create(state_name, cell, cfg)
-
-        new_state = State(self._state._moves, graphics_copy, new_physics)
-
-        for event, target in self._state.transitions.items():
-            new_state.set_transition(event, target)
-
-        return Piece(self._id, new_state)
\ No newline at end of file
+    def clone_to(self, cell: tuple[int, int], physics_factory: PhysicsFactory,
+                 piece_id: Optional[str] = None) -> "Piece":
+        """
+        Clone this piece's whole state machine to a new piece at a different cell.
+        Graphics is copied (sprites stay shared), physics is recreated (new cell), moves are shared.
+        """
+        clones: Dict[int, State] = {}
+        originals = []
+        pending = [self._state]
+        while pending:
+            state = pending.pop()
+            if id(state) in clones:
+                continue
+            physics_cfg = {"speed_m_per_sec": state._physics.speed_m_s}
+            if state._physics.hold_ms() is not None:
+                physics_cfg["duration_ms"] = state._physics.hold_ms()
+            cfg = {"physics": physics_cfg}
+            new_physics = physics_factory.create(state.name, cell, cfg)
+            clones[id(state)] = State(state._moves, state._graphics.copy(), new_physics, state.name)
+            originals.append(state)
+            pending.extend(state.transitions.values())
+
+        for state in originals:
+            for event, target in state.transitions.items():
+                clones[id(state)].set_transition(event, clones[id(target)])
+
+        return Piece(piece_id if piece_id is not None else self._id, clones[id(self._state)], self._bus)
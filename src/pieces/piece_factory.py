@@ -1,18 +1,20 @@
 import pathlib
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import json
 from src.core.board import Board
 from src.graphics.graphics_factory import GraphicsFactory
 from src.core.moves import Moves
 from src.physics.physics_factory import PhysicsFactory
-from piece import Piece
+from src.pieces.piece import Piece
 from src.core.state import State
 from src.enums.states_names import StatesNames
+from src.input.event_bus import EventBus
 
 
 class PieceFactory:
-    def __init__(self, board: Board, pieces_root: pathlib.Path):
+    def __init__(self, board: Board, pieces_root: pathlib.Path, bus: Optional[EventBus] = None):
         self.board = board
+        self.bus = bus
         self.pieces_root = pieces_root
         self._physics_factory = PhysicsFactory(board)
         self._graphics_factory = GraphicsFactory(board)
@@ -22,7 +24,7 @@ class PieceFactory:
     def _build_state_machine(self, piece_dir: pathlib.Path, cell: Tuple[int, int]) -> State:
         """Build a state machine for a piece from its directory."""
         states: Dict[StatesNames, State] = {}
-        moves = Moves(piece_dir / "moves.txt", (self.board.H_cells, self.board.W_cells))
+        moves = Moves.load(piece_dir / "moves.txt", (self.board.H_cells, self.board.W_cells))
         states_root = piece_dir / "states"
         for state_dir in states_root.iterdir():
             if not state_dir.is_dir():
@@ -31,17 +33,13 @@ class PieceFactory:
             cfg_path = state_dir / "config.json"
             with open(cfg_path, "r") as f:
                 cfg = json.load(f)
-            physics = self._physics_factory.create(
-                state_name,
-                cell,
-                cfg["physics"]
-            )
+            physics = self._physics_factory.create(state_name, cell, cfg)
             graphics = self._graphics_factory.load(
                 state_dir / "sprites",
                 cfg["graphics"],
                 (self.board.cell_H_pix, self.board.cell_W_pix)
             )
-            states[state_name] = State(moves, graphics, physics)
+            states[state_name] = State(moves, graphics, physics, state_name)
 
         states[StatesNames.IDLE].set_transition(StatesNames.MOVE, states[StatesNames.MOVE])
         states[StatesNames.IDLE].set_transition(StatesNames.JUMP, states[StatesNames.JUMP])
@@ -52,14 +50,27 @@ class PieceFactory:
 
         return states[StatesNames.IDLE]
 
-    def create_piece(self, p_type: str, cell: Tuple[int, int]) -> Piece:
-        if p_type not in self._templates:
+    def template(self, p_type: str, cell: Tuple[int, int] = (0, 0)) -> Piece:
+        """The prototype every piece of p_type is cloned from, named p_type; treat it as read-only."""
+        template = self._templates.get(p_type)
+        if template is None:
+            # The first piece of a type reads its assets once; every piece is then a clone of this prototype
             piece_dir = self.pieces_root / p_type
-            init_state = self._build_state_machine(piece_dir,cell)
+            template = Piece(piece_id=p_type, init_state=self._build_state_machine(piece_dir, cell), bus=self.bus)
+            self._templates[p_type] = template
+        return template
+
+    def create_piece(self, p_type: str, cell: Tuple[int, int], piece_id: Optional[str] = None) -> Piece:
+        """New piece of p_type at cell, named p_type_N with the next N unless piece_id is given."""
+        template = self.template(p_type, cell)
         if p_type not in self.counter:
             self.counter[p_type] = 0
-        self.counter[p_type] += 1
-        unique_id = f"{p_type}_{self.counter[p_type]}"
+        if piece_id is not None:
+            # Keep later generated ids from colliding with this one
+            self.counter[p_type] = max(self.counter[p_type], int(piece_id.rsplit('_', 1)[1]))
+            unique_id = piece_id
+        else:
+            self.counter[p_type] += 1
+            unique_id = f"{p_type}_{self.counter[p_type]}"
         # Create and return the piece with the unique id.
-        piece = Piece(piece_id=unique_id, init_state=init_state)
-        return piece
+        return template.clone_to(cell, self._physics_factory, piece_id=unique_id)
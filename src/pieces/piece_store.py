@@ -0,0 +1,162 @@
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from src.enums.states_names import StatesNames
+from src.physics.physics import MovePhysics
+
+if TYPE_CHECKING:
+    from src.pieces.piece import Piece
+
+STATE_CODES: Dict[StatesNames, int] = {name: code for code, name in enumerate(StatesNames)}
+_MOVE = STATE_CODES[StatesNames.MOVE]
+
+# name: (shape of one row, dtype, value of an empty row)
+_COLUMNS = {
+    'active': ((), bool, False),
+    'state': ((), np.uint8, STATE_CODES[StatesNames.IDLE]),
+    'start_ms': ((), np.float64, np.nan),           # physics start time, NaN until it is taken
+    'start_pos': ((2,), np.float64, 0.0),
+    'end_pos': ((2,), np.float64, 0.0),
+    'displacement': ((2,), np.float64, 0.0),        # end_pos - start_pos, covered in travel_ms
+    'travel_ms': ((), np.float64, 1.0),
+    'due_ms': ((), np.float64, np.inf),             # next update the piece needs
+    'anim_start_ms': ((), np.float64, 0.0),
+    'frame_ms': ((), np.float64, 1.0),
+    'frame_count': ((), np.int64, 1),
+    'loop': ((), bool, True),
+    # Outputs of advance
+    'pos': ((2,), np.float64, 0.0),
+    'frame': ((), np.int64, 0),
+}
+
+
+class PieceStore:
+    """
+    The per-tick quantities of every piece, one row per piece in NumPy columns: state,
+    physics start time, start and end position, travel time, next due update, and the
+    animation clock of the current sprite sequence.
+
+    Pieces keep their state machines; the store mirrors a piece's row whenever the game
+    schedules it, i.e. whenever its state or physics start time changes. The continuous
+    work then runs over all rows at once: `due` finds the pieces whose timers ran out and
+    `advance` interpolates moves and picks animation frames, so its cost barely grows
+    with the number of pieces on the board.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._pieces: List[Optional["Piece"]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self.time_ms: Optional[int] = None  # game time of the last advance, None once a row changed after it
+        self._positions: List[Tuple[float, float]] = []
+        self._frames: List[int] = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        """Size every column for capacity rows, keeping the rows filled so far."""
+        for name, (width, dtype, fill) in _COLUMNS.items():
+            column = np.full((capacity,) + width, fill, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                column[:len(old)] = old
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, piece: "Piece", now_ms: int) -> int:
+        """Give piece a row and fill it in; returns the row."""
+        if self._free:
+            slot = self._free.pop()
+            self._pieces[slot] = piece
+        else:
+            slot = len(self._pieces)
+            if slot == len(self.active):
+                self._allocate(2 * slot)
+            self._pieces.append(piece)
+        self._slots[piece.get_id()] = slot
+        self.active[slot] = True
+        self.write(piece, now_ms)
+        return slot
+
+    def remove(self, piece_id: str):
+        slot = self._slots.pop(piece_id, None)
+        if slot is None:
+            return
+        self.active[slot] = False
+        self.due_ms[slot] = np.inf
+        self._pieces[slot] = None
+        self._free.append(slot)
+
+    def piece(self, slot: int) -> "Piece":
+        return self._pieces[slot]
+
+    def write(self, piece: "Piece", now_ms: int):
+        """Copy piece's current state into its row; now_ms is when the game scheduled it."""
+        slot = self._slots[piece.get_id()]
+        state = piece.state
+        physics, graphics = state.physics, state.graphics
+        self.state[slot] = STATE_CODES.get(state.name, STATE_CODES[StatesNames.IDLE])
+        self.start_ms[slot] = np.nan if physics.start_time is None else physics.start_time
+        if isinstance(physics, MovePhysics):
+            self.start_pos[slot] = physics.start_pos
+            self.end_pos[slot] = physics.end_pos
+            self.displacement[slot] = (physics.end_pos[0] - physics.start_pos[0],
+                                       physics.end_pos[1] - physics.start_pos[1])
+            self.travel_ms[slot] = physics.duration_ms
+        else:
+            self.start_pos[slot] = self.end_pos[slot] = physics.pos
+            self.displacement[slot] = 0.0
+            self.travel_ms[slot] = 1.0
+        # Same rule as the game's wake-up heap: due at once until started (or when stale), else when finished
+        if physics.start_time is None or physics.finished:
+            self.due_ms[slot] = now_ms
+        else:
+            due = physics.next_event_ms()
+            self.due_ms[slot] = np.inf if due is None else due
+        self.anim_start_ms[slot] = graphics.start_time
+        self.frame_ms[slot] = graphics.frame_time_ms
+        self.frame_count[slot] = len(graphics.sprites)
+        self.loop[slot] = graphics.loop
+        self.time_ms = None  # the outputs of the last advance no longer hold for this row
+
+    def due(self, now_ms: int) -> np.ndarray:
+        """Rows whose piece needs an update at now_ms."""
+        return np.flatnonzero(self.due_ms[:len(self._pieces)] <= now_ms)
+
+    def next_due_ms(self) -> Optional[float]:
+        """Earliest time a piece needs an update, None while none ever does."""
+        n = len(self._pieces)
+        if n == 0:
+            return None
+        due = self.due_ms[:n].min()
+        return None if due == np.inf else float(due)
+
+    def advance(self, now_ms: int):
+        """Compute every piece's position and animation frame at now_ms into pos and frame."""
+        n = len(self._pieces)
+        # Moves interpolate linearly from start to end, exactly as MovePhysics.position_at does
+        elapsed = now_ms - self.start_ms[:n]
+        moving = (self.state[:n] == _MOVE) & ~np.isnan(elapsed) & (elapsed < self.travel_ms[:n])
+        t = np.where(moving, np.maximum(0.0, elapsed / self.travel_ms[:n]), 0.0)[:, None]
+        started = ~np.isnan(elapsed)[:, None]
+        settled = np.where(started, self.end_pos[:n], self.start_pos[:n])
+        np.copyto(self.pos[:n], np.where(moving[:, None], self.start_pos[:n] + t * self.displacement[:n], settled))
+
+        # Animation frames, as Graphics.update computes them
+        index = (np.maximum(0.0, now_ms - self.anim_start_ms[:n]) / self.frame_ms[:n]).astype(np.int64)
+        count = self.frame_count[:n]
+        np.copyto(self.frame[:n], np.where(self.loop[:n], index % count, np.minimum(index, count - 1)))
+        # Converted in bulk: reading NumPy scalars one piece at a time would cost more than the pass itself
+        self._positions = list(map(tuple, self.pos[:n].tolist()))
+        self._frames = self.frame[:n].tolist()
+        self.time_ms = now_ms
+
+    def position(self, slot: int) -> Tuple[float, float]:
+        """A piece's position as of the last advance."""
+        return self._positions[slot]
+
+    def frame_index(self, slot: int) -> int:
+        """A piece's sprite frame as of the last advance."""
+        return self._frames[slot]
@@ -0,0 +1,73 @@
+import asyncio
+import base64
+import json
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from src.core.snapshot import decode_snapshot
+from src.server.game_server import encode
+
+
+class GameClient:
+    """
+    Minimal asyncio client for GameServer. Replies to requests are matched by op; every
+    other message (deltas, match over, errors) is kept in arrival order for recv().
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._inbox: Deque[Dict[str, Any]] = deque()
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "GameClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def create_match(self) -> int:
+        reply = await self._request({'op': 'create'}, 'created')
+        return reply['match']
+
+    async def join(self, match: int, color: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Join as 'W', 'B' or, with color None, as a spectator. The reply carries the current
+        pieces and, under 'snapshot', the decoded Snapshot of the match.
+        """
+        reply = await self._request({'op': 'join', 'match': match, 'color': color}, 'joined')
+        reply['snapshot'] = decode_snapshot(base64.b64decode(reply['snapshot']))
+        return reply
+
+    async def move(self, match: int, src: str, dst: str):
+        await self._send({'op': 'move', 'match': match, 'from': src, 'to': dst})
+
+    async def jump(self, match: int, cell: str):
+        await self._send({'op': 'jump', 'match': match, 'cell': cell})
+
+    async def recv(self) -> Dict[str, Any]:
+        if self._inbox:
+            return self._inbox.popleft()
+        return await self._read()
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def _send(self, msg: Dict[str, Any]):
+        self._writer.write(encode(msg))
+        await self._writer.drain()
+
+    async def _request(self, msg: Dict[str, Any], reply_op: str) -> Dict[str, Any]:
+        await self._send(msg)
+        while True:
+            reply = await self._read()
+            if reply['op'] == reply_op:
+                return reply
+            if reply['op'] == 'error':
+                raise ValueError(reply['message'])
+            self._inbox.append(reply)
+
+    async def _read(self) -> Dict[str, Any]:
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection")
+        return json.loads(line)
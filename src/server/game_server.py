@@ -0,0 +1,292 @@
+import asyncio
+import base64
+import itertools
+import json
+import pathlib
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from src.core.board import Board
+from src.core.clock import SimulatedClock
+from src.core.snapshot import encode_snapshot
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+from src.input.event_bus import EventBus
+
+if TYPE_CHECKING:
+    from src.core.game import Game
+    from src.pieces.piece import Piece
+
+PieceView = Tuple[int, int, str]  # (row, col, state name) as sent to clients
+
+# A client whose unsent output grows past this is too slow to keep up and is dropped
+MAX_CLIENT_BUFFER = 1 << 20
+
+
+def headless_game_factory(board: Board, pieces_root: pathlib.Path,
+                          placement_csv: pathlib.Path) -> Callable[[], "Game"]:
+    """Build windowless, silent Games on a simulated clock, each with its own event bus."""
+    from src.core.game import Game
+
+    def make_game() -> "Game":
+        return Game(None, board, pieces_root, placement_csv, None, clock=SimulatedClock(), bus=EventBus())
+
+    return make_game
+
+
+def piece_view(piece: "Piece", now_ms: int) -> PieceView:
+    """Cell and state of a piece at game time now_ms."""
+    row, col = piece.state.physics.cell_at(now_ms)
+    return row, col, piece.state.name.value
+
+
+def piece_views(game: "Game") -> Dict[str, PieceView]:
+    now_ms = game.game_time_ms()
+    return {piece_id: piece_view(piece, now_ms) for piece_id, piece in game.pieces.items()}
+
+
+def encode(msg: Dict[str, Any]) -> bytes:
+    return json.dumps(msg, separators=(',', ':')).encode() + b'\n'
+
+
+class Session:
+    """One connected client; it may play one or both colors of several matches."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+        self.colors: Dict[int, Set[str]] = {}  # match id -> colors this client plays
+        self.closed = False
+
+    def send(self, msg: Dict[str, Any]):
+        if self.closed:
+            return
+        if self._writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+            self.close()
+            return
+        self._writer.write(encode(msg))
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._writer.close()
+
+
+class Match:
+    """One hosted game: its pending commands, its clients and the last state sent to them."""
+
+    def __init__(self, match_id: int, game: "Game"):
+        self.match_id = match_id
+        self.game = game
+        self.players: Dict[str, Session] = {}  # 'W' / 'B' -> session
+        self.sessions: Set[Session] = set()
+        self.started = False
+        self.finished = False
+        self.abandoned = False  # every client that created, played or watched it has left
+        self._pending: List[Command] = []
+        self._last: Dict[str, PieceView] = piece_views(game)
+        # piece id -> (state, position) its last view was computed from
+        self._sources: Dict[str, Tuple[Any, Any]] = {}
+
+    def join(self, session: Session, color: Optional[str]) -> Dict[str, Any]:
+        if color is not None:
+            if color not in ('W', 'B'):
+                raise ValueError(f"Unknown color {color!r}")
+            if self.players.get(color, session) is not session:
+                raise ValueError(f"Color {color} is already taken in match {self.match_id}")
+            self.players[color] = session
+            session.colors.setdefault(self.match_id, set()).add(color)
+        self.sessions.add(session)
+        if not self.started and len(self.players) == 2:
+            self.started = True
+            self.game.reset_pieces(self.game.game_time_ms())
+        # The binary snapshot lets spectators and reconnecting clients pick up the exact match state
+        snapshot = base64.b64encode(encode_snapshot(self.game.snapshot())).decode()
+        return {'op': 'joined', 'match': self.match_id, 'color': color, 'started': self.started,
+                'time': self.game.game_time_ms(), 'pieces': self._last, 'snapshot': snapshot}
+
+    def leave(self, session: Session):
+        if session not in self.sessions:
+            return
+        self.sessions.discard(session)
+        for color in [c for c, s in self.players.items() if s is session]:
+            del self.players[color]
+        if not self.sessions:
+            self.abandoned = True
+
+    def submit(self, session: Session, src: str, dst: str):
+        """Queue a move (or a jump when src == dst) for the next tick, on behalf of a player."""
+        if not self.started or self.finished:
+            raise ValueError(f"Match {self.match_id} is not in progress")
+        board = self.game.board
+        src_square, dst_square = board.algebraic_to_square(src), board.algebraic_to_square(dst)
+        piece = self.game.pos_to_piece.get(board.square_to_cell(src_square))
+        if piece is None:
+            raise ValueError(f"No piece on {src}")
+        if piece.get_id()[1] not in session.colors.get(self.match_id, ()):
+            raise ValueError(f"{piece.get_id()} is not yours to move")
+        move_type = StatesNames.JUMP if src_square == dst_square else StatesNames.MOVE
+        self._pending.append(Command(self.game.game_time_ms(), piece.get_id(), move_type, (src_square, dst_square)))
+
+    def step(self, tick_ms: int):
+        """Advance the game one tick and send every client what changed."""
+        commands, self._pending = self._pending, []
+        self.game.step(commands, tick_ms)
+
+        changed = self._changed_views()
+        removed = [pid for pid in self._last if pid not in self.game.pieces]
+        for pid in removed:
+            del self._last[pid]
+            self._sources.pop(pid, None)
+        if changed or removed:
+            self._broadcast({'op': 'delta', 'match': self.match_id, 'time': self.game.game_time_ms(),
+                             'changed': changed, 'removed': removed})
+
+        winner = self.game.winner()
+        if winner is not None:
+            self.finished = True
+            self._broadcast({'op': 'over', 'match': self.match_id, 'winner': winner})
+
+    def _changed_views(self) -> Dict[str, PieceView]:
+        # Views are only rebuilt for pieces whose state object or position changed since the last tick
+        changed = {}
+        now_ms = self.game.game_time_ms()
+        for pid, piece in self.game.pieces.items():
+            state = piece.state
+            source = (state, state.physics.position_at(now_ms))
+            last_source = self._sources.get(pid)
+            if last_source is not None and last_source[0] is source[0] and last_source[1] == source[1]:
+                continue
+            self._sources[pid] = source
+            view = piece_view(piece, now_ms)
+            if self._last.get(pid) != view:
+                self._last[pid] = view
+                changed[pid] = view
+        return changed
+
+    def _broadcast(self, msg: Dict[str, Any]):
+        for session in list(self.sessions):
+            if session.closed:
+                self.leave(session)
+            else:
+                session.send(msg)
+
+
+class GameServer:
+    """
+    Hosts many headless matches in one asyncio process. Clients speak newline-delimited
+    JSON over TCP; every started match advances on one shared tick loop, so a match costs
+    one Game.step per tick rather than a thread and a window.
+    """
+
+    def __init__(self, game_factory: Callable[[], "Game"], tick_ms: int = 16,
+                 host: str = '127.0.0.1', port: int = 0):
+        if tick_ms <= 0:
+            raise ValueError(f"tick_ms must be positive, got {tick_ms}")
+        self._game_factory = game_factory
+        self.tick_ms = tick_ms
+        self.host = host
+        self.port = port
+        self.matches: Dict[int, Match] = {}
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._ticker: Optional[asyncio.Task] = None
+
+    def create_match(self, owner: Optional[Session] = None) -> Match:
+        """A new match; its owner counts as one of its clients until joining or leaving."""
+        match = Match(next(self._ids), self._game_factory())
+        if owner is not None:
+            match.sessions.add(owner)
+        self.matches[match.match_id] = match
+        return match
+
+    def tick(self):
+        """Advance every started match by one tick and drop the ones that ended or that every client left."""
+        for match in list(self.matches.values()):
+            if match.abandoned:
+                del self.matches[match.match_id]
+                continue
+            if match.started:
+                match.step(self.tick_ms)
+            if match.finished:
+                del self.matches[match.match_id]
+
+    async def start(self) -> Tuple[str, int]:
+        """Start listening and ticking; returns the bound (host, port)."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self._ticker = asyncio.create_task(self._tick_loop())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _tick_loop(self):
+        loop = asyncio.get_running_loop()
+        period = self.tick_ms / 1000
+        deadline = loop.time()
+        while True:
+            self.tick()
+            deadline += period
+            delay = deadline - loop.time()
+            if delay < 0:  # overran the tick: carry on from now instead of bursting to catch up
+                deadline, delay = loop.time(), 0
+            await asyncio.sleep(delay)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = Session(writer)
+        try:
+            while not session.closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = self._handle_message(session, json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {'op': 'error', 'message': str(e)}
+                if reply is not None:
+                    session.send(reply)
+        except ConnectionError:
+            pass
+        finally:
+            for match in self.matches.values():
+                match.leave(session)
+            session.close()
+
+    def _handle_message(self, session: Session, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        op = msg['op']
+        if op == 'create':
+            return {'op': 'created', 'match': self.create_match(session).match_id}
+        match = self.matches.get(msg['match'])
+        if match is None:
+            raise ValueError(f"No match {msg['match']}")
+        if op == 'join':
+            return match.join(session, msg.get('color'))
+        if op == 'move':
+            match.submit(session, msg['from'], msg['to'])
+            return None
+        if op == 'jump':
+            match.submit(session, msg['cell'], msg['cell'])
+            return None
+        raise ValueError(f"Unknown op {op!r}")
+
+
+if __name__ == "__main__":
+    from src.graphics.img import Img
+
+    root = pathlib.Path(__file__).resolve().parents[2]
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    server = GameServer(headless_game_factory(board, root / "assets" / "pieces", root / "src" / "board.csv"),
+                        host='0.0.0.0', port=8765)
+
+    async def serve():
+        host, port = await server.start()
+        print(f"Serving matches on {host}:{port}")
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
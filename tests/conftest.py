@@ -0,0 +1,57 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pathlib
+import pytest
+from src.core.board import Board
+from src.core.clock import SimulatedClock
+from src.core.game import Game
+from src.input.event_bus import EventBus
+from src.server.game_server import headless_game_factory
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PIECES_ROOT = ROOT / 'assets' / 'pieces'
+START_CSV = ROOT / 'src' / 'board.csv'
+
+
+@pytest.fixture
+def make_board():
+    """Windowless boards of 80 px, 1 m cells; 8x8 unless sized otherwise."""
+    def make(width=8, height=8, img=None):
+        return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=width, H_cells=height, img=img)
+    return make
+
+
+@pytest.fixture
+def board(make_board):
+    return make_board()
+
+
+@pytest.fixture
+def placement(tmp_path):
+    """Writes a placement file with {cell: code} on an otherwise empty board."""
+    def write(pieces, width=8, height=8):
+        rows = [[pieces.get((r, c), '') for c in range(width)] for r in range(height)]
+        path = tmp_path / 'placement.csv'
+        path.write_text('\n'.join(','.join(row) for row in rows) + '\n')
+        return path
+    return write
+
+
+@pytest.fixture
+def make_game(make_board):
+    """Headless Games on a simulated clock with their pieces reset at time 0."""
+    def make(placement_csv=START_CSV, board=None, **options):
+        game = Game(None, board or make_board(), PIECES_ROOT, placement_csv, None,
+                    clock=SimulatedClock(), bus=EventBus(), **options)
+        game.reset_pieces(0)
+        return game
+    return make
+
+
+@pytest.fixture
+def game_factory(make_board):
+    """The server's headless game factory over the standard start position."""
+    def make(pieces_root=PIECES_ROOT, img=None):
+        return headless_game_factory(make_board(img=img), pieces_root, START_CSV)
+    return make
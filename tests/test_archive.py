@@ -0,0 +1,56 @@
+import pytest
+from src.enums.states_names import StatesNames
+from src.infrastructure.archive import ArchiveWriter, GameArchive, GameResult
+from src.infrastructure.journal import JournalEntry
+
+
+def result(winner, *moves):
+    commands = tuple(JournalEntry(t, t - 4, piece_id, StatesNames.MOVE, (6, 4), (4, 4)) for t, piece_id in moves)
+    return GameResult(winner, 3, 1, 9000, commands)
+
+
+def test_games_are_found_by_id_and_read_in_place(tmp_path):
+    path = tmp_path / 'games.kfa'
+    first, second = result('white', (16, 'PW_1'), (32, 'PB_2')), result(None)
+    with ArchiveWriter(path) as writer:
+        assert writer.append(first, game_id=10) == 10
+        writer.append(second, game_id=25)
+
+    with GameArchive(path) as archive:
+        assert len(archive) == 2 and 25 in archive and 11 not in archive
+        game = archive[10]
+        assert game.winner == 'white' and (game.white_score, game.black_score, game.end_ms) == (3, 1, 9000)
+        assert list(game.commands['applied_at']) == [16, 32] and game.commands.base is not None
+        assert game.result() == first
+        assert [g.game_id for g in archive] == [10, 25]
+        assert list(archive.index['winner']) == [1, 0]
+        with pytest.raises(KeyError):
+            archive[11]
+        del game
+
+
+def test_reopening_appends_after_the_existing_games(tmp_path):
+    path = tmp_path / 'games.kfa'
+    with ArchiveWriter(path) as writer:
+        writer.append(result('black', (16, 'QB_1')))
+    with ArchiveWriter(path) as writer:
+        assert writer.append(result('white')) == 1
+        with pytest.raises(ValueError):
+            writer.append(result('white'), game_id=0)
+
+    with GameArchive(path) as archive:
+        assert [g.winner for g in archive] == ['black', 'white']
+
+
+def test_archive_without_footer_is_recovered_by_the_writer(tmp_path):
+    path = tmp_path / 'games.kfa'
+    with ArchiveWriter(path) as writer:
+        writer.append(result('white', (16, 'PW_1')))
+    data = path.read_bytes()
+    path.write_bytes(data[:-30])  # crash while writing the footer
+
+    with pytest.raises(ValueError):
+        GameArchive(path)
+    ArchiveWriter(path).close()
+    with GameArchive(path) as archive:
+        assert archive[0].result() == result('white', (16, 'PW_1'))
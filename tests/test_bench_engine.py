@@ -0,0 +1,32 @@
+import json
+import numpy as np
+from benchmarks.bench_engine import composite_single_layer, frame_sprite_draws, main, midgame, regressions
+from src.graphics.compositing import blit_all
+
+
+def test_regressions_only_flag_slowdowns_past_the_threshold():
+    baseline = {'a': {'median_us': 10.0}, 'b': {'median_us': 10.0}}
+    results = {'a': {'median_us': 11.5}, 'b': {'median_us': 12.5}, 'new': {'median_us': 1.0}}
+    assert regressions(results, baseline, threshold=0.2) == ['b: 10.00 us -> 12.50 us']
+
+
+def test_quick_run_writes_machine_readable_results(tmp_path):
+    output = tmp_path / 'results.json'
+    assert main(['--quick', '--filter', 'moves_get_moves', '--output', str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert set(report['results']) == {'moves_get_moves'}
+    assert report['results']['moves_get_moves']['ops_per_sec'] > 0 and 'python' in report['environment']
+
+    assert main(['--quick', '--filter', 'moves_get_moves', '--output', str(tmp_path / 'again.json'),
+                 '--compare', str(output), '--threshold', '10']) == 0
+
+
+def test_the_single_layer_alternative_draws_the_frame_blit_all_draws():
+    game = midgame()
+    draws = frame_sprite_draws(game, game.game_time_ms())
+    looped, layered = game.board.img.img.copy(), game.board.img.img.copy()
+
+    assert blit_all(looped, draws) == composite_single_layer(layered, draws) == len(draws)
+    # Overlapping sprites round once in the layer instead of once per blit
+    assert np.abs(looped.astype(int) - layered.astype(int)).max() <= 1
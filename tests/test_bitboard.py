@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+from src.core.bitboard import BoardGeometry, Bitboards
+from src.core.occupancy import Occupancy
+
+
+def make_piece(piece_id):
+    return SimpleNamespace(get_id=lambda: piece_id)
+
+
+def test_geometry_is_shared_per_board_size():
+    assert BoardGeometry.for_board(8, 8) is BoardGeometry.for_board(8, 8)
+    assert BoardGeometry.for_board(8, 8) is not BoardGeometry.for_board(10, 8)
+
+
+def test_between_on_file_and_diagonal():
+    geo = BoardGeometry.for_board(8, 8)
+    assert geo.cells(geo.between((7, 0), (4, 0))) == [(5, 0), (6, 0)]
+    assert geo.path_cells((7, 0), (4, 0)) == [(6, 0), (5, 0)]
+    assert geo.path_cells((0, 0), (3, 3)) == [(1, 1), (2, 2)]
+
+
+def test_between_is_empty_for_unaligned_or_adjacent_cells():
+    geo = BoardGeometry.for_board(8, 8)
+    assert geo.between((7, 1), (5, 2)) == 0
+    assert geo.between((4, 4), (4, 5)) == 0
+
+
+def test_geometry_supports_boards_larger_than_64_squares():
+    geo = BoardGeometry.for_board(12, 10)
+    assert geo.path_cells((9, 11), (9, 8)) == [(9, 10), (9, 9)]
+    assert geo.bit((9, 11)) == 1 << 119
+
+
+def test_path_clear_follows_occupancy():
+    geo = BoardGeometry.for_board(8, 8)
+    occupancy = Occupancy(Bitboards(geo))
+    blocker = make_piece("PW_1")
+    occupancy.place(blocker, (6, 0))
+
+    assert not occupancy.bitboards.is_path_clear((7, 0), (4, 0))
+    occupancy.remove(blocker)
+    assert occupancy.bitboards.is_path_clear((7, 0), (4, 0))
+
+
+def test_reachable_stops_at_first_blocker_in_each_direction():
+    geo = BoardGeometry.for_board(8, 8)
+    bitboards = Bitboards(geo)
+    bitboards.add("PB_1", (4, 2))
+    bitboards.add("PW_1", (2, 4))
+
+    rook_rules = geo.mask_of([(4, c) for c in range(8) if c != 4] + [(r, 4) for r in range(8) if r != 4])
+    legal = geo.cells(bitboards.legal_destinations((4, 4), rook_rules, 'W'))
+
+    assert (4, 2) in legal  # capture the first enemy
+    assert (4, 1) not in legal  # but not beyond it
+    assert (2, 4) not in legal and (3, 4) in legal  # own piece blocks and is not a target
+    assert (7, 4) in legal and (4, 7) in legal
+
+
+def test_bitboards_track_color_and_type():
+    bitboards = Bitboards(BoardGeometry.for_board(8, 8))
+    bitboards.add("QB_1", (0, 3))
+    bitboards.add("QW_1", (7, 3))
+
+    assert bitboards.pieces_of('Q', 'B') == bitboards.geometry.bit((0, 3))
+    bitboards.remove("QB_1", (0, 3))
+    assert bitboards.pieces_of('Q', 'B') == 0
+    assert bitboards.occupied == bitboards.geometry.bit((7, 3))
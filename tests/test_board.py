@@ -0,0 +1,40 @@
+import pytest
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+
+
+def test_notation_on_the_standard_board(board):
+    assert board.algebraic_to_cell('a1') == (7, 0) and board.algebraic_to_cell('H8') == (0, 7)
+    assert board.algebraic_to_square('e2') == 52 and board.square_to_algebraic(52) == 'e2'
+    assert board.square_to_cell(52) == (6, 4) and board.cell_to_square((6, 4)) == 52
+
+
+def test_notation_round_trips_on_any_board_size(make_board):
+    board = make_board(30, 12)
+    assert board.cell_to_algebraic((0, 29)) == 'ad12' and board.cell_to_algebraic((11, 25)) == 'z1'
+    for square in range(30 * 12):
+        assert board.algebraic_to_square(board.square_to_algebraic(square)) == square
+
+
+@pytest.mark.parametrize('notation', ['i1', 'a9', 'a0', 'e', '4', 'e-1'])
+def test_squares_off_the_board_are_rejected(board, notation):
+    with pytest.raises(ValueError):
+        board.algebraic_to_cell(notation)
+
+
+def test_a_game_runs_on_a_larger_board(make_board, make_game, placement):
+    width, height = 10, 12
+    pieces = {(height - 1, 0): 'KW', (0, 9): 'KB', (height - 2, 4): 'PW', (height - 1, 9): 'RW', (5, 9): 'PB'}
+    board = make_board(width, height)
+    game = make_game(placement(pieces, width, height), board=board)
+
+    # Commands name squares by number; on a 10-wide board e2 is square 104
+    game.step([Command(0, 'PW', StatesNames.MOVE, [104, 84]),
+               Command(0, 'RW', StatesNames.MOVE, (board.algebraic_to_square('j1'), board.algebraic_to_square('j7')))])
+    while game.game_time_ms() < 8000:
+        game.step()
+
+    assert game.occupancy.cell_of(game.pieces['PW_1']) == (8, 4)  # a double step from the second rank
+    assert 'PB_1' not in game.pieces and game.occupancy.cell_of(game.pieces['RW_1']) == (5, 9)
+    assert [(e.src, e.dst) for e in game.accepted_commands] == [((10, 4), (8, 4)), ((11, 9), (5, 9))]
+    assert game.white_log.log[0]['source'] == 'e2' and game.white_log.log[1]['destination'] == 'j7'
@@ -0,0 +1,81 @@
+import numpy as np
+from src.core.board import Board
+from src.graphics.img import Img
+from src.graphics.board_renderer import BoardRenderer
+from src.graphics.compositing import premultiply
+
+
+class FakePiece:
+    """Paints a solid, fully opaque 10x10 sprite at its position."""
+    def __init__(self, piece_id, pos, value=200):
+        self._id = piece_id
+        self.pos = pos
+        self.sprite = premultiply(np.full((10, 10, 3), value, dtype=np.uint8))
+
+    def position_at(self, now_ms):
+        return self.pos
+
+    def sprite_at(self, now_ms):
+        return self.sprite
+
+    def get_id(self):
+        return self._id
+
+
+def make_board():
+    img = Img()
+    img.img = np.full((40, 40, 3), 50, dtype=np.uint8)
+    return Board(cell_H_pix=10, cell_W_pix=10, cell_H_m=1, cell_W_m=1, W_cells=4, H_cells=4, img=img)
+
+
+def test_first_render_paints_everything_and_keeps_background_untouched():
+    board = make_board()
+    renderer = BoardRenderer(board)
+    piece = FakePiece("RW_1", (10, 20))
+
+    dirty = renderer.render([piece], [], now_ms=0)
+
+    assert dirty == [(0, 0, 40, 40)]
+    assert renderer.frame.img.img[25, 15, 0] == 200
+    assert board.img.img[25, 15, 0] == 50
+
+
+def test_unchanged_frame_repaints_nothing():
+    renderer = BoardRenderer(make_board())
+    piece = FakePiece("RW_1", (10, 20))
+    renderer.render([piece], [], now_ms=0)
+
+    assert renderer.render([piece], [], now_ms=16) == []
+
+
+def test_moving_piece_repaints_only_the_cells_it_left_and_entered():
+    renderer = BoardRenderer(make_board())
+    still = FakePiece("KB_1", (30, 0))
+    mover = FakePiece("RW_1", (0, 0))
+    renderer.render([still, mover], [], now_ms=0)
+
+    mover.pos = (5, 0)
+    dirty = renderer.render([still, mover], [], now_ms=16)
+
+    assert sorted(dirty) == [(0, 0, 10, 10), (10, 0, 20, 10)]
+    frame = renderer.frame.img.img
+    assert frame[5, 2, 0] == 50  # uncovered background restored
+    assert frame[5, 12, 0] == 200
+    assert frame[5, 35, 0] == 200  # untouched piece still drawn
+
+
+def test_highlight_change_repaints_its_cell():
+    renderer = BoardRenderer(make_board())
+    renderer.render([], [((1, 1), (0, 0, 255))], now_ms=0)
+
+    dirty = renderer.render([], [((1, 1), (0, 255, 0))], now_ms=16)
+
+    assert (10, 10, 20, 20) in dirty
+    assert tuple(renderer.frame.img.img[10, 15]) == (0, 255, 0)
+
+
+def test_invalidate_forces_full_repaint():
+    renderer = BoardRenderer(make_board())
+    renderer.render([], [], now_ms=0)
+    renderer.invalidate()
+    assert renderer.render([], [], now_ms=16) == [(0, 0, 40, 40)]
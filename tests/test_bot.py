@@ -0,0 +1,71 @@
+import time
+from src.ai.bot import BotPlayer, TimedSearch
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+
+
+def notation(game, cmd):
+    return tuple(game.board.square_to_algebraic(square) for square in cmd.params)
+
+
+def test_takes_an_undefended_piece(make_game, placement):
+    game = make_game(placement({(7, 4): 'KW', (0, 0): 'KB', (4, 3): 'QW', (4, 7): 'RB'}))
+    search = TimedSearch(game.piece_factory, game.board, 'W', seed=0)
+
+    cmd = search.decide(game.snapshot(0))
+
+    assert cmd.type == StatesNames.MOVE and notation(game, cmd) == ('d4', 'h4')
+
+
+def test_does_not_trade_the_queen_for_a_defended_pawn(make_game, placement):
+    game = make_game(placement({(7, 0): 'KW', (0, 0): 'KB', (7, 4): 'QW', (3, 4): 'PB', (2, 3): 'PB'}))
+    search = TimedSearch(game.piece_factory, game.board, 'W', seed=0)
+
+    cmd = search.decide(game.snapshot(0))
+
+    assert cmd is None or notation(game, cmd)[1] != 'e5'
+
+
+def test_jumps_over_a_piece_about_to_land_on_it(make_game, placement):
+    game = make_game(placement({(7, 7): 'KW', (0, 7): 'KB', (4, 0): 'NW', (0, 0): 'RB'}))
+    search = TimedSearch(game.piece_factory, game.board, 'W', seed=0)
+    game.step([Command(0, 'RB', StatesNames.MOVE, [0, 32])])  # a8-a4
+    # Four cells take the rook 3200 ms; a jump lasts 1000 ms
+    while game.game_time_ms() < 2700:
+        game.step()
+
+    cmd = search.decide(game.snapshot(game.game_time_ms()))
+
+    assert cmd.type == StatesNames.JUMP and notation(game, cmd) == ('a4', 'a4')
+
+
+def test_a_budget_cuts_the_search_short(make_game):
+    game = make_game()
+    search = TimedSearch(game.piece_factory, game.board, 'W', seed=0)
+    snapshot = game.snapshot(0)
+
+    search.decide(snapshot)
+    assert search.last_depth == 2
+
+    start = time.perf_counter()
+    search.decide(snapshot, budget_ms=0.01)
+    assert search.last_depth == 1 and time.perf_counter() - start < 0.25
+
+
+def test_bot_player_queues_its_orders_from_its_own_thread(make_game, placement):
+    game = make_game(placement({(7, 4): 'KW', (0, 0): 'KB', (4, 3): 'QB', (4, 7): 'RW'}))
+    bot = BotPlayer(game, 'B', budget_ms=5, decision_interval_ms=100, seed=0)
+    assert not bot.wants_snapshot(0)
+
+    bot.start()
+    try:
+        assert bot.wants_snapshot(0)
+        bot.observe(game.snapshot(0))
+        assert not bot.wants_snapshot(50) and bot.wants_snapshot(100)
+        cmd = game.user_input_queue.get(timeout=5)
+    finally:
+        bot.stop()
+
+    assert notation(game, cmd) == ('d4', 'h4') and cmd.piece_id.startswith('QB')
+    game.step([cmd])
+    assert game.pieces[cmd.piece_id].state.name == StatesNames.MOVE
@@ -0,0 +1,43 @@
+import pytest
+from src.core.clock import SimulatedClock
+from src.input.command import Command
+from src.input.scripted_source import ScriptedCommandSource
+from src.enums.states_names import StatesNames
+
+
+def test_simulated_clock_starts_at_given_time():
+    clock = SimulatedClock(start_ms=250)
+    assert clock.now_ms() == 250
+
+
+def test_simulated_clock_advances_only_when_told():
+    clock = SimulatedClock()
+    clock.advance(16)
+    clock.advance(16)
+    assert clock.now_ms() == 32
+    clock.advance_to(100)
+    assert clock.now_ms() == 100
+
+
+def test_simulated_clock_rejects_going_backwards():
+    clock = SimulatedClock(start_ms=100)
+    with pytest.raises(ValueError):
+        clock.advance_to(50)
+
+
+def test_scripted_source_releases_commands_when_due():
+    late = Command(500, "PW_1", StatesNames.MOVE, [52, 36])
+    early = Command(100, "PB_1", StatesNames.MOVE, [12, 28])
+    source = ScriptedCommandSource([late, early])
+
+    assert source.poll(50) == []
+    assert source.next_timestamp() == 100
+    assert source.poll(100) == [early]
+    assert source.poll(1000) == [late]
+    assert source.exhausted()
+
+
+def test_scripted_source_parses_notation_into_squares(board):
+    source = ScriptedCommandSource.from_notation(board, [Command(100, "PW_1", StatesNames.MOVE, ["e2", "e4"])])
+
+    assert source.poll(100) == [Command(100, "PW_1", StatesNames.MOVE, (52, 36))]
@@ -0,0 +1,62 @@
+import pytest
+from types import SimpleNamespace
+from src.core.bitboard import BoardGeometry
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+from src.physics.collisions import CollisionSweep, Crossing, Segment
+
+GEOMETRY = BoardGeometry.for_board(8, 8)
+
+
+def move(start_cell, end_cell, start_time, duration_ms):
+    return SimpleNamespace(start_cell=start_cell, end_cell=end_cell, start_time=start_time, duration_ms=duration_ms)
+
+
+def test_segment_enters_each_cell_when_the_center_crosses_into_it():
+    segment = Segment(GEOMETRY, (7, 0), (4, 0), start_ms=100, duration_ms=2400)
+    assert segment.entries == [(500.0, (6, 0)), (1300.0, (5, 0)), (2100.0, (4, 0))]
+
+
+def test_knight_moves_only_enter_their_target():
+    segment = Segment(GEOMETRY, (7, 1), (5, 2), start_ms=0, duration_ms=1000)
+    assert segment.entries == [(500.0, (5, 2))]
+
+
+def test_sweep_reports_every_crossing_once_in_time_order():
+    sweep = CollisionSweep(GEOMETRY)
+    moves = [('RW_1', move((7, 0), (5, 0), 0, 1600)), ('BB_1', move((0, 2), (2, 4), 100, 1600))]
+
+    first = sweep.due(moves, 1000)
+    second = sweep.due(moves, 5000)
+
+    assert first == [Crossing(400.0, 'RW_1', (6, 0), False), Crossing(500.0, 'BB_1', (1, 3), False)]
+    assert [c.time_ms for c in second] == [1200.0, 1300.0] and all(c.final for c in second)
+    assert sweep.due(moves, 6000) == []
+
+
+def test_a_new_move_of_the_same_piece_starts_a_new_segment():
+    sweep = CollisionSweep(GEOMETRY)
+    sweep.due([('RW_1', move((7, 0), (6, 0), 0, 800))], 800)
+    assert sweep.due([('RW_1', move((6, 0), (7, 0), 2000, 800))], 2400) == [Crossing(2400.0, 'RW_1', (7, 0), True)]
+
+
+@pytest.mark.parametrize('tick_ms', [16, 48, 100])
+def test_pieces_moving_head_on_collide_whatever_the_tick(make_game, placement, tick_ms):
+    game = make_game(placement({(7, 0): 'RW', (0, 0): 'RB', (7, 7): 'KW', (0, 7): 'KB'}), tick_ms=tick_ms)
+    game.step([Command(0, 'RW', StatesNames.MOVE, [56, 0]), Command(0, 'RB', StatesNames.MOVE, [0, 56])])  # a1-a8, a8-a1
+    while game.game_time_ms() < 8000:
+        game.step()
+
+    # Both start on the same tick; the tie on the crossing goes to the piece already holding the cell
+    assert 'RB_1' not in game.pieces and game.white_score.score == 5
+    assert game.occupancy.cell_of(game.pieces['RW_1']) == (0, 0)
+
+
+def test_a_moving_piece_holds_the_cell_it_is_crossing(make_game, placement):
+    game = make_game(placement({(7, 0): 'RW', (7, 7): 'KW', (0, 7): 'KB'}), tick_ms=16)
+    game.step([Command(0, 'RW', StatesNames.MOVE, [56, 24])])  # a1-a5
+    while game.game_time_ms() < 1500:
+        game.step()
+
+    assert game.occupancy.cell_of(game.pieces['RW_1']) == (5, 0)
+    assert not game.is_path_clean((3, 0), (7, 0))
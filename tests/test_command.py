@@ -0,0 +1,13 @@
+import dataclasses
+import pytest
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+
+
+def test_command_is_immutable_and_hashable():
+    cmd = Command(16, 'PW_5', StatesNames.MOVE, [52, 36])
+
+    assert cmd.params == (52, 36) and not hasattr(cmd, '__dict__')
+    assert cmd == Command(16, 'PW_5', StatesNames.MOVE, (52, 36)) and len({cmd, cmd}) == 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cmd.timestamp = 32
@@ -0,0 +1,54 @@
+import cv2
+import numpy as np
+from src.graphics.compositing import SPRITE_OPACITY, blit, blit_all, premultiply
+
+
+def test_per_pixel_alpha_matches_float_reference():
+    rng = np.random.default_rng(0)
+    sprite = rng.integers(0, 256, (8, 8, 4), dtype=np.uint8)
+    dst = rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)
+    alpha = sprite[..., 3:] / 255.0
+    expected = sprite[..., :3] * alpha + dst * (1 - alpha)
+
+    blit(dst, premultiply(sprite), 0, 0)
+
+    assert np.abs(dst - expected).max() <= 1
+
+
+def test_opaque_sprite_opacity_matches_weighted_blend_and_keeps_target_alpha():
+    rng = np.random.default_rng(1)
+    sprite = rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)
+    dst = rng.integers(0, 256, (8, 8, 4), dtype=np.uint8)
+    expected = cv2.addWeighted(sprite, SPRITE_OPACITY, dst[..., :3], 1 - SPRITE_OPACITY, 0)
+    original_alpha = dst[..., 3].copy()
+
+    blit(dst, premultiply(sprite, SPRITE_OPACITY), 0, 0)
+
+    assert np.abs(dst[..., :3].astype(int) - expected).max() <= 1
+    assert np.array_equal(dst[..., 3], original_alpha)
+
+
+def test_blit_clips_to_target_and_clip_rect():
+    dst = np.zeros((10, 10, 3), dtype=np.uint8)
+    sprite = premultiply(np.full((4, 4, 3), 255, dtype=np.uint8))
+
+    assert not blit(dst, sprite, 20, 20)
+    assert blit(dst, sprite, 8, -2)
+    assert dst[:2, 8:].min() == 255 and dst[2:, :].max() == 0
+
+    dst[...] = 0
+    assert blit(dst, sprite, 0, 0, clip=(2, 2, 10, 10))
+    assert dst[2:4, 2:4].min() == 255
+    assert dst[:2, :].max() == 0 and dst[:, :2].max() == 0
+
+
+def test_blit_all_draws_in_order():
+    dst = np.zeros((10, 10, 3), dtype=np.uint8)
+    below = premultiply(np.full((4, 4, 3), 100, dtype=np.uint8))
+    above = premultiply(np.full((4, 4, 3), 200, dtype=np.uint8))
+
+    drawn = blit_all(dst, [(below, 0, 0, None), (above, 2, 2, None), (above, 50, 50, None)])
+
+    assert drawn == 2
+    assert dst[1, 1, 0] == 100
+    assert dst[3, 3, 0] == 200
@@ -0,0 +1,57 @@
+import threading
+from src.enums.dispatch_modes import DispatchModes
+from src.enums.events_names import EventsNames
+from src.input.event_bus import CaptureEvent, EventBus, MoveEvent
+
+
+def test_typed_events_have_slots():
+    event = MoveEvent(EventsNames.WHITE_MOVE, 'W', 1500, 'e2', 'e4')
+    assert not hasattr(event, '__dict__') and not hasattr(event, 'data')
+    assert (event.player, event.time, event.source, event.destination, event.sound) == ('W', 1500, 'e2', 'e4', 'move.wav')
+
+
+def test_sync_subscribers_run_inside_publish_and_dicts_are_wrapped():
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventsNames.JUMP, received.append)
+    bus.publish(EventsNames.JUMP, {'sound': 'jump.wav'})
+    assert received[0].name == EventsNames.JUMP and received[0].data == {'sound': 'jump.wav'}
+
+
+def test_deferred_subscribers_run_on_flush_in_publish_order():
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventsNames.WHITE_CAPTURE, lambda e: received.append(e.captured_piece), DispatchModes.DEFERRED)
+    bus.subscribe(EventsNames.BLACK_CAPTURE, lambda e: received.append(e.captured_piece), DispatchModes.DEFERRED)
+    bus.publish(EventsNames.WHITE_CAPTURE, CaptureEvent(EventsNames.WHITE_CAPTURE, 'QW_1', 'PB_1'))
+    bus.publish(EventsNames.BLACK_CAPTURE, CaptureEvent(EventsNames.BLACK_CAPTURE, 'RB_1', 'QW_1'))
+    assert received == []
+
+    bus.flush()
+    assert received == ['PB_1', 'QW_1']
+
+
+def test_topic_queue_is_bounded_and_counts_drops():
+    bus = EventBus(queue_limit=2)
+    received = []
+    bus.subscribe(EventsNames.JUMP, received.append, DispatchModes.DEFERRED)
+    for _ in range(5):
+        bus.publish(EventsNames.JUMP, {'sound': 'jump.wav'})
+    bus.flush()
+    assert len(received) == 2 and bus.dropped == {EventsNames.JUMP: 3}
+
+    bus.publish(EventsNames.JUMP, {'sound': 'jump.wav'})
+    bus.flush()
+    assert len(received) == 3
+
+
+def test_worker_subscribers_run_off_the_publishing_thread():
+    bus = EventBus(workers=1)
+    threads = []
+    done = threading.Event()
+    bus.subscribe(EventsNames.VICTORY, lambda e: (threads.append(threading.current_thread()), done.set()),
+                  DispatchModes.WORKER)
+    bus.publish(EventsNames.VICTORY, {'sound': 'victory.WAV'})
+    assert done.wait(2)
+    bus.close()
+    assert threads[0] is not threading.current_thread()
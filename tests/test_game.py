@@ -1,10 +1,17 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import subprocess
 from pathlib import Path
 import pytest
 from unittest.mock import MagicMock, patch
-from Board import Board
-from Game import Game
-from Screen import Screen
-from Img import Img
+from src.core.board import Board
+from src.core.game import Game
+from src.graphics.screen import Screen
+from src.graphics.img import Img
+from src.enums.events_names import EventsNames
+from src.input.event_bus import CaptureEvent
+from src.input.keyboard_input import KeyboardInput
 
 @pytest.fixture
 def mock_screen():
@@ -35,13 +42,10 @@ def mock_board():
 def game(mock_screen, mock_board):
     base_path = Path(__file__).resolve().parent.parent
     pieces_root = base_path.parent / "PIECES"
-    placement_csv = base_path / "board.csv"
+    placement_csv = base_path / "src" / "board.csv"
     sounds_root = base_path.parent / "sounds"
 
-    with patch('Game.PieceFactory'), \
-         patch('Game.playsound'), \
-         patch('Game.cv2'), \
-         patch('Game.keyboard'):
+    with patch('src.core.game.PieceFactory'):
         game = Game(mock_screen, mock_board, pieces_root, placement_csv, sounds_root)
         return game
 
@@ -59,8 +63,7 @@ def test_game_reset_selection(game):
     assert game._selection_mode == "source"
     assert game._selected_source == None
 
-@patch('Game.cv2')
-def test_game_announce_win(mock_cv2, game, mock_screen):
+def test_game_announce_win(game, mock_screen):
     # Mock a king piece
     king_piece = MagicMock()
     king_piece.get_id.return_value = "KB"
@@ -127,3 +130,69 @@ def test_handle_selection_valid_move(game):
 
     assert new_mode == "dest"
     assert new_source == (0,0)
+
+def test_update_position_mapping_skips_idle_pieces(game):
+    idle_piece = MagicMock()
+    idle_piece.get_id.return_value = "RB_1"
+    game.pieces = {"RB_1": idle_piece}
+    game.pos_to_piece = {(0, 0): idle_piece}
+
+    game._update_position_mapping()
+
+    idle_piece.state.physics.get_pos.assert_not_called()
+    assert game.pos_to_piece == {(0, 0): idle_piece}
+
+def test_update_position_mapping_moves_piece_between_cells(game):
+    moving_piece = MagicMock()
+    moving_piece.get_id.return_value = "RB_1"
+    moving_piece.state.physics.get_pos.return_value = (0, 200)
+    moving_piece.state.current_command = None  # arrived and settled this tick
+    game.pieces = {"RB_1": moving_piece}
+    game.pos_to_piece = {(0, 0): moving_piece}
+    game._moving = {"RB_1": moving_piece}
+
+    game._update_position_mapping()
+
+    assert game.pos_to_piece == {(2, 0): moving_piece}
+    assert "RB_1" not in game._moving
+
+def test_handle_input_moves_each_players_focus_and_quits(game):
+    game._input = KeyboardInput(game.clock)
+    game._input.push('right', True, timestamp_ms=0)
+    game._input.push('w', True, timestamp_ms=0)
+    game._handle_input(0)
+
+    assert game.focus_cell == (0, 1)
+    assert game.focus_cell2 == (6, 0)
+
+    game._input.push('esc', True, timestamp_ms=1)
+    game._handle_input(1)
+    assert game._running == False
+
+def test_scores_update_in_the_end_of_tick_flush(game):
+    game._bus.publish(EventsNames.WHITE_CAPTURE, CaptureEvent(EventsNames.WHITE_CAPTURE, 'QW_1', 'PB_1'))
+    assert game.white_score.score == 0
+
+    game._bus.flush()
+    assert game.white_score.score == 1
+
+
+def test_headless_games_are_quiet_and_do_not_load_the_keyboard():
+    root = Path(__file__).resolve().parent.parent
+    script = """
+import pathlib
+import sys
+from src.core.board import Board
+from src.server.game_server import headless_game_factory
+from src.input.command import Command
+from src.enums.states_names import StatesNames
+board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=None)
+game = headless_game_factory(board, pathlib.Path(sys.argv[1]), pathlib.Path(sys.argv[2]))()
+game.reset_pieces(0)
+game.step([Command(0, 'PW', StatesNames.MOVE, (36, 28))])  # e4 is empty: rejected
+assert 'keyboard' not in sys.modules
+"""
+    run = subprocess.run([sys.executable, '-c', script, str(root / 'assets' / 'pieces'), str(root / 'src' / 'board.csv')],
+                         cwd=root, capture_output=True, text=True)
+    assert run.returncode == 0, run.stderr
+    assert run.stdout == ''
@@ -0,0 +1,170 @@
+import asyncio
+from types import SimpleNamespace
+from src.core.board import Board
+from src.core.snapshot import Snapshot
+from src.enums.states_names import StatesNames
+from src.graphics.img import Img
+from src.server.client import GameClient
+from src.server.game_server import GameServer
+
+
+class FakePiece:
+    def __init__(self, piece_id, cell):
+        self._id = piece_id
+        self.state = SimpleNamespace(name=StatesNames.IDLE, physics=SimpleNamespace())
+        self.place(cell)
+
+    def place(self, cell):
+        self.cell = cell
+        self.state.physics.position_at = lambda now_ms: (cell[1] * 10, cell[0] * 10)
+        self.state.physics.cell_at = lambda now_ms: cell
+
+    def get_id(self):
+        return self._id
+
+
+class FakeGame:
+    """Teleports pieces on command; capturing a king ends the match."""
+    def __init__(self):
+        self.now = 0
+        self.board = Board(cell_H_pix=10, cell_W_pix=10, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=None)
+        self.pieces = {p.get_id(): p for p in (FakePiece('KW_1', (7, 4)), FakePiece('KB_1', (0, 4)),
+                                               FakePiece('QW_1', (7, 3)))}
+
+    @property
+    def pos_to_piece(self):
+        return {p.cell: p for p in self.pieces.values()}
+
+    def game_time_ms(self):
+        return self.now
+
+    def reset_pieces(self, now):
+        pass
+
+    def step(self, commands, tick_ms):
+        for cmd in commands:
+            dst = self.board.square_to_cell(cmd.params[1])
+            victim = self.pos_to_piece.get(dst)
+            if victim is not None:
+                del self.pieces[victim.get_id()]
+            self.pieces[cmd.piece_id].place(dst)
+        self.now += tick_ms
+
+    def snapshot(self):
+        return Snapshot(self.now, 8, 8, 0, 0, {})
+
+    def winner(self):
+        kings = [pid for pid in self.pieces if pid[0] == 'K']
+        return None if len(kings) > 1 else ('white' if kings[0][1] == 'W' else 'black')
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_loopback_client_plays_a_match_to_the_end():
+    async def scenario():
+        server = GameServer(FakeGame, tick_ms=5)
+        host, port = await server.start()
+        client = await GameClient.connect(host, port)
+        match = await client.create_match()
+
+        joined = await client.join(match, 'W')
+        assert not joined['started'] and joined['pieces']['QW_1'] == [7, 3, 'idle']
+        joined = await client.join(match, 'B')
+        assert joined['started'] and joined['snapshot'] == Snapshot(0, 8, 8, 0, 0, {})
+
+        await client.move(match, 'd1', 'd4')
+        delta = await client.recv()
+        assert delta['op'] == 'delta' and delta['changed'] == {'QW_1': [4, 3, 'idle']}
+
+        await client.move(match, 'd4', 'e8')
+        delta = await client.recv()
+        assert delta['removed'] == ['KB_1']
+        assert await client.recv() == {'op': 'over', 'match': match, 'winner': 'white'}
+        assert match not in server.matches
+
+        await client.close()
+        await server.close()
+
+    run(scenario())
+
+
+def test_players_cannot_move_the_other_color():
+    async def scenario():
+        server = GameServer(FakeGame, tick_ms=5)
+        host, port = await server.start()
+        white = await GameClient.connect(host, port)
+        black = await GameClient.connect(host, port)
+        match = await white.create_match()
+        await white.join(match, 'W')
+        await black.join(match, 'B')
+
+        await black.move(match, 'd1', 'd4')
+        reply = await black.recv()
+        assert reply['op'] == 'error' and 'QW_1' in reply['message']
+
+        for client in (white, black):
+            await client.close()
+        await server.close()
+
+    run(scenario())
+
+
+def test_a_match_every_client_left_is_dropped():
+    async def scenario():
+        server = GameServer(FakeGame, tick_ms=5)
+        host, port = await server.start()
+        white = await GameClient.connect(host, port)
+        black = await GameClient.connect(host, port)
+        match = await white.create_match()
+        await white.join(match, 'W')
+        await black.join(match, 'B')
+        unjoined = await black.create_match()
+
+        await white.close()
+        await asyncio.sleep(0.05)
+        assert match in server.matches  # black is still playing
+        await black.close()
+        while match in server.matches or unjoined in server.matches:
+            await asyncio.sleep(0.01)
+        await server.close()
+
+    run(scenario())
+
+
+def test_matches_only_tick_once_both_colors_joined():
+    server = GameServer(FakeGame, tick_ms=5)
+    waiting = server.create_match()
+    server.tick()
+    assert waiting.game.now == 0
+
+    waiting.started = True
+    server.tick()
+    assert waiting.game.now == 5
+
+
+def test_real_headless_game_plays_a_move(game_factory):
+    factory = game_factory(img=Img())
+
+    async def scenario():
+        server = GameServer(factory, tick_ms=50)
+        host, port = await server.start()
+        client = await GameClient.connect(host, port)
+        match = await client.create_match()
+        await client.join(match, 'W')
+        joined = await client.join(match, 'B')
+        pawn = next(pid for pid, view in joined['pieces'].items() if view[:2] == [6, 4])
+
+        await client.move(match, 'e2', 'e4')
+        views = []
+        while not views or views[-1][:2] != [4, 4]:
+            delta = await client.recv()
+            if pawn in delta['changed']:
+                views.append(delta['changed'][pawn])
+        assert views[0] == [6, 4, 'move']
+
+        await client.close()
+        await server.close()
+
+    run(scenario())
@@ -1,7 +1,10 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pathlib
 import pytest
 from types import SimpleNamespace
-from Graphics import Graphics
+from src.graphics.graphics import Graphics
 
 # ─── Fake Classes ──────────────────────────────────────────────────────────
 
@@ -17,8 +20,8 @@ def fake_load_sprites(self, folder):
 # ─── Fixtures / Arrange Helpers ────────────────────────────────────────────
 
 @pytest.fixture
-def graphics():
-    Graphics._load_sprites = fake_load_sprites
+def graphics(monkeypatch):
+    monkeypatch.setattr(Graphics, "_load_sprites", fake_load_sprites)
     g = Graphics(pathlib.Path(""), board=SimpleNamespace(), loop=True, fps=2.0)
     return g
 
@@ -56,9 +59,9 @@ def test_WhenUpdateLooping_ThenFrameCycles(graphics):
     # יש 3 פריימים => 4 % 3 = 1
     assert graphics.current_frame == 1
 
-def test_WhenUpdateNotLooping_ThenFrameStops():
+def test_WhenUpdateNotLooping_ThenFrameStops(monkeypatch):
     # Arrange
-    Graphics._load_sprites = fake_load_sprites
+    monkeypatch.setattr(Graphics, "_load_sprites", fake_load_sprites)
     g = Graphics(pathlib.Path(""), board=SimpleNamespace(), loop=False, fps=2.0)
     g.start_time = 0
 
@@ -0,0 +1,55 @@
+import pytest
+from src.core.snapshot import PieceRecord, Snapshot
+from src.enums.states_names import StatesNames
+from src.infrastructure.journal import CommandJournal, read_journal
+from src.input.command import Command
+
+E2, E4 = 52, 36  # squares on the 8x8 board
+
+
+def snapshot(time_ms):
+    pawn = PieceRecord('PW_1', StatesNames.IDLE, (6, 4), (6, 4), (6, 4), 0, None, frozenset())
+    return Snapshot(time_ms, 8, 8, 0, 0, {'PW_1': pawn})
+
+
+def write_match(path, board):
+    journal = CommandJournal(path, board, tick_ms=16, keyframe_interval_ms=100)
+    journal.write_keyframe(snapshot(0))
+    journal.record(32, Command(20, 'PW', StatesNames.MOVE, (E2, E4)), piece_id='PW_1')
+    assert not journal.keyframe_due(96) and journal.keyframe_due(112)
+    journal.write_keyframe(snapshot(112))
+    journal.record(128, Command(128, 'PW_1', StatesNames.JUMP, (E4, E4)))
+    journal.close(end_ms=144)
+
+
+def test_journal_round_trips_commands_keyframes_and_end(board, tmp_path):
+    path = tmp_path / 'match.kfj'
+    write_match(path, board)
+
+    contents = read_journal(path)
+
+    assert (contents.tick_ms, contents.width, contents.height, contents.end_ms) == (16, 8, 8, 144)
+    assert [k.time_ms for k in contents.keyframes] == [0, 112]
+    move, jump = contents.commands
+    assert (move.applied_at, move.piece_id, move.src, move.dst) == (32, 'PW_1', (6, 4), (4, 4))
+    assert move.to_command(board).params == (E2, E4)
+    assert (board.square_to_algebraic(E2), board.square_to_algebraic(E4)) == ('e2', 'e4')
+    assert jump.type == StatesNames.JUMP and jump.timestamp == 128
+
+
+def test_torn_tail_is_ignored(board, tmp_path):
+    path = tmp_path / 'match.kfj'
+    write_match(path, board)
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])  # crash in the middle of the end entry
+
+    contents = read_journal(path)
+
+    assert len(contents.commands) == 2 and contents.end_ms is None
+
+
+def test_rejects_files_that_are_not_journals(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'NOPE' + bytes(16))
+    with pytest.raises(ValueError):
+        read_journal(path)
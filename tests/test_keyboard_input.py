@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from src.core.clock import SimulatedClock
+from src.enums.input_actions import InputActions
+from src.input.keyboard_input import KeyboardInput, PlayerAction
+
+
+def make_input():
+    return KeyboardInput(SimulatedClock(), repeat_delay_ms=200, repeat_interval_ms=100)
+
+
+def test_press_is_available_on_the_next_poll_with_its_timestamp():
+    keys = make_input()
+    keys.push('left', True, timestamp_ms=5)
+
+    assert keys.poll(6) == [PlayerAction(5, 1, InputActions.LEFT)]
+    assert keys.poll(7) == []
+
+
+def test_held_key_repeats_after_delay_then_at_interval():
+    keys = make_input()
+    keys.push('up', True, timestamp_ms=0)
+    keys.poll(0)
+
+    assert keys.poll(150) == []
+    assert keys.poll(200) == [PlayerAction(200, 1, InputActions.UP)]
+    assert keys.poll(300) == [PlayerAction(300, 1, InputActions.UP)]
+
+    keys.push('up', False, timestamp_ms=350)
+    assert keys.poll(1000) == []
+
+
+def test_players_repeat_independently_and_os_repeats_are_ignored():
+    keys = make_input()
+    keys.push('left', True, timestamp_ms=0)
+    keys.push('d', True, timestamp_ms=50)
+    keys.push('left', True, timestamp_ms=80)  # auto-repeat from the OS
+    assert [a.player for a in keys.poll(100)] == [1, 2]
+
+    assert keys.poll(200) == [PlayerAction(200, 1, InputActions.LEFT)]
+    assert keys.poll(250) == [PlayerAction(250, 2, InputActions.RIGHT)]
+
+
+def test_select_does_not_repeat_and_unbound_keys_are_ignored():
+    keys = make_input()
+    keys.push('enter', True, timestamp_ms=0)
+    keys.push('x', True, timestamp_ms=0)
+
+    assert keys.poll(0) == [PlayerAction(0, 1, InputActions.SELECT)]
+    assert keys.poll(1000) == []
+
+
+def test_backend_hook_feeds_events():
+    backend = MagicMock()
+    clock = SimulatedClock(start_ms=40)
+    keys = KeyboardInput(clock, backend)
+    keys.start()
+    callback = backend.hook.call_args[0][0]
+
+    callback(SimpleNamespace(name='Space', event_type='down'))
+
+    assert keys.poll(40) == [PlayerAction(40, 2, InputActions.SELECT)]
+    keys.stop()
+    backend.unhook.assert_called_once()
@@ -1,18 +1,17 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
-from unittest.mock import MagicMock
-from Log import Log
+from src.enums.events_names import EventsNames
+from src.infrastructure.log import Log
+from src.input.event_bus import MoveEvent
 
 def test_log_initially_empty():
     log = Log()
     assert log.log == []
 
 def test_log_updates_with_valid_time():
-    event = MagicMock()
-    event.data = {
-        'time': 3723000,  # 1 hour, 2 minutes, 3 seconds
-        'source': 'A1',
-        'destination': 'B2'
-    }
+    event = MoveEvent(EventsNames.WHITE_MOVE, 'W', 3723000, 'A1', 'B2')
 
     log = Log()
     log.update_log(event)
@@ -23,12 +22,7 @@ def test_log_updates_with_valid_time():
     assert log.log[0]['destination'] == 'B2'
 
 def test_log_updates_with_invalid_time_prints_warning_and_defaults_to_zero(capsys):
-    event = MagicMock()
-    event.data = {
-        'time': 'invalid',
-        'source': 'A2',
-        'destination': 'B3'
-    }
+    event = MoveEvent(EventsNames.WHITE_MOVE, 'W', 'invalid', 'A2', 'B3')
 
     log = Log()
     log.update_log(event)
@@ -45,12 +39,7 @@ def test_log_multiple_entries():
     log = Log()
 
     for i in range(3):
-        event = MagicMock()
-        event.data = {
-            'time': i * 1000,
-            'source': f'A{i}',
-            'destination': f'B{i}'
-        }
+        event = MoveEvent(EventsNames.WHITE_MOVE, 'W', i * 1000, f'A{i}', f'B{i}')
         log.update_log(event)
 
     assert len(log.log) == 3
@@ -0,0 +1,63 @@
+import logging
+import wave
+import numpy as np
+from src.audio.mixer import Mixer, SoundBank, decode_wav
+from src.audio.sinks import FileSink, NullSink
+
+
+def write_wav(path, samples, rate=22050, channels=1):
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(np.asarray(samples, dtype='<i2').tobytes())
+
+
+def test_decode_resamples_and_upmixes_to_the_mixer_format(tmp_path):
+    write_wav(tmp_path / 'beep.wav', [16384] * 100, rate=22050)
+    samples = decode_wav(tmp_path / 'beep.wav', sample_rate=44100, channels=2)
+    assert samples.shape == (200, 2) and samples.dtype == np.float32
+    assert np.allclose(samples, 0.5)
+
+
+def test_voices_are_summed_clipped_and_retired():
+    bank = SoundBank({'Move.wav': np.full((3, 2), 0.25, np.float32), 'capture.wav': np.full((5, 2), 0.9, np.float32)})
+    mixer = Mixer(bank, NullSink())
+    mixer.play('move.wav')
+    mixer.play('CAPTURE.wav')
+
+    block = mixer.render(4)
+    assert list(block[:, 0]) == [32767, 32767, 32767, int(0.9 * 32767)]
+    assert mixer.active_voices() == 1
+    mixer.render(4)
+    assert mixer.active_voices() == 0
+
+
+def test_voice_limit_cuts_off_the_oldest_sound():
+    bank = SoundBank({'a.wav': np.full((10, 2), 0.1, np.float32)})
+    mixer = Mixer(bank, NullSink(), max_voices=2)
+    for _ in range(5):
+        mixer.play('a.wav')
+    assert mixer.active_voices() == 2 and mixer.stolen == 3
+
+
+def test_worker_mixes_into_a_file_sink(tmp_path):
+    bank = SoundBank({'a.wav': np.full((1000, 2), 0.5, np.float32)})
+    mixer = Mixer(bank, FileSink(tmp_path / 'out.wav', 44100, 2), block_frames=256)
+    mixer.start()
+    mixer.play('a.wav')
+    mixer.close(drain=True)
+
+    with wave.open(str(tmp_path / 'out.wav'), 'rb') as f:
+        frames = np.frombuffer(f.readframes(f.getnframes()), dtype='<i2').reshape(-1, 2)
+    assert len(frames) == 1024 and (frames[:1000] == 16383).all() and (frames[1000:] == 0).all()
+
+
+def test_unknown_sounds_are_skipped_and_reported_once(caplog):
+    mixer = Mixer(SoundBank({'move.wav': np.zeros((3, 2), np.float32)}), NullSink())
+    with caplog.at_level(logging.WARNING):
+        mixer.play('missing.wav')
+        mixer.play('MISSING.wav')
+
+    assert mixer.active_voices() == 0 and mixer.missing == {'missing.wav'}
+    assert len(caplog.records) == 1 and 'missing.wav' in caplog.records[0].getMessage()
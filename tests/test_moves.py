@@ -0,0 +1,46 @@
+import pathlib
+import pytest
+from src.core.moves import Moves
+
+PIECES_ROOT = pathlib.Path(__file__).resolve().parent.parent / "assets" / "pieces"
+
+
+def test_knight_moves_are_clipped_to_the_board():
+    moves = Moves(PIECES_ROOT / "NW" / "moves.txt", (8, 8))
+    assert sorted(moves.get_moves(7, 1)) == [(5, 0), (5, 2), (6, 3)]
+
+
+def test_moves_mask_matches_destinations():
+    moves = Moves(PIECES_ROOT / "KW" / "moves.txt", (8, 8))
+    expected = 0
+    for r, c in moves.get_moves(0, 0):
+        expected |= 1 << (r * 8 + c)
+    assert moves.get_moves_mask(0, 0) == expected
+
+
+def test_out_of_board_square_has_no_moves():
+    moves = Moves(PIECES_ROOT / "KW" / "moves.txt", (8, 8))
+    assert moves.get_moves(8, 0) == []
+    assert moves.get_moves_mask(-1, 3) == 0
+
+
+def test_moves_are_a_fresh_list_in_rules_order():
+    moves = Moves(PIECES_ROOT / "RW" / "moves.txt", (8, 8))
+    expected = [(dr, dc) for dr, dc in moves.rules if 0 <= dr < 8 and 0 <= dc < 8]  # from the a8 corner
+    first = moves.get_moves(0, 0)
+    assert first == expected
+    first.clear()
+    assert moves.get_moves(0, 0) == expected
+
+
+def test_load_shares_tables_per_rules_file_and_board_size():
+    path = PIECES_ROOT / "QW" / "moves.txt"
+    assert Moves.load(path, (8, 8)) is Moves.load(path, (8, 8))
+    assert Moves.load(path, (8, 8)) is not Moves.load(path, (10, 10))
+
+
+def test_invalid_rules_file_raises(tmp_path):
+    bad = tmp_path / "moves.txt"
+    bad.write_text("1,2,3\n")
+    with pytest.raises(ValueError):
+        Moves(bad, (8, 8))
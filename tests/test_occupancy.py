@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+from src.core.occupancy import Occupancy
+
+
+def make_piece(piece_id):
+    return SimpleNamespace(get_id=lambda: piece_id)
+
+
+def test_place_and_lookup():
+    occupancy = Occupancy()
+    piece = make_piece("PW_1")
+    occupancy.place(piece, (6, 4))
+
+    assert occupancy.piece_at((6, 4)) is piece
+    assert occupancy.cell_of(piece) == (6, 4)
+    assert (6, 4) in occupancy
+    assert len(occupancy) == 1
+
+
+def test_place_moves_piece_out_of_previous_cell():
+    occupancy = Occupancy()
+    piece = make_piece("PW_1")
+    occupancy.place(piece, (6, 4))
+    occupancy.place(piece, (4, 4))
+
+    assert (6, 4) not in occupancy
+    assert occupancy.piece_at((4, 4)) is piece
+    assert len(occupancy) == 1
+
+
+def test_place_evicts_previous_occupant():
+    occupancy = Occupancy()
+    victim = make_piece("PB_1")
+    attacker = make_piece("QW_1")
+    occupancy.place(victim, (3, 3))
+    occupancy.place(attacker, (3, 3))
+
+    assert occupancy.piece_at((3, 3)) is attacker
+    assert occupancy.cell_of(victim) is None
+
+
+def test_remove_returns_vacated_cell():
+    occupancy = Occupancy()
+    piece = make_piece("RB_1")
+    occupancy.place(piece, (0, 0))
+
+    assert occupancy.remove(piece) == (0, 0)
+    assert occupancy.remove(piece) is None
+    assert len(occupancy) == 0
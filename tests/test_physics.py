@@ -1,22 +1,23 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from unittest.mock import MagicMock
-from Physics import IdlePhysics, MovePhysics, JumpPhysics, ShortRestPhysics, LongRestPhysics
-from Command import Command
+from src.physics.physics import IdlePhysics, MovePhysics, JumpPhysics, ShortRestPhysics, LongRestPhysics
+from src.input.command import Command
 
 
 def mock_board():
     board = MagicMock()
     board.cell_to_world.side_effect = lambda cell: (cell[1] * 1.0, cell[0] * 1.0)
     board.world_to_cell.side_effect = lambda pos: (int(pos[1]), int(pos[0]))
-    board.algebraic_to_cell.side_effect = lambda alg: {
-        "a1": (0, 0), "a2": (0, 1), "a3": (2, 0), "b2": (1, 1), "c3": (2, 2), "e5": (4, 4)
-    }[alg]
+    board.square_to_cell.side_effect = lambda square: divmod(square, 8)
     return board
 
 
 def test_idle_physics():
     board = mock_board()
     phys = IdlePhysics((2, 3), board)
-    cmd = Command(0, "P", "idle", [(2, 3)])
+    cmd = Command(0, "P", "idle", [19])
     phys.reset(cmd)
     assert phys.get_pos_in_cell() == (2, 3)
     assert phys.can_capture()
@@ -27,7 +28,7 @@ def test_idle_physics():
 def test_move_physics():
     board = mock_board()
     phys = MovePhysics((0, 0), board, speed_m_s=1.0)
-    cmd = Command(0, "PB", "move", ["a2", "a3"])
+    cmd = Command(0, "PB", "move", [1, 16])
     phys.reset(cmd)
 
     assert not phys.finished
@@ -43,7 +44,7 @@ def test_move_physics():
 def test_jump_physics():
     board = mock_board()
     phys = JumpPhysics((1, 1), board)
-    cmd = Command(0, "P", "jump", ["b2", "c3"])
+    cmd = Command(0, "P", "jump", [9, 18])
     phys.reset(cmd)
 
     assert not phys.finished
@@ -58,7 +59,7 @@ def test_jump_physics():
 def test_short_rest_physics():
     board = mock_board()
     phys = ShortRestPhysics((2, 2), board)
-    cmd = Command(0, "P", "rest", [(2, 2)])
+    cmd = Command(0, "P", "rest", [18])
     phys.reset(cmd)
 
     assert not phys.finished
@@ -73,7 +74,7 @@ def test_short_rest_physics():
 def test_long_rest_physics():
     board = mock_board()
     phys = LongRestPhysics((4, 4), board)
-    cmd = Command(0, "P", "rest", [(4, 4)])
+    cmd = Command(0, "P", "rest", [36])
     phys.reset(cmd)
 
     assert not phys.finished
@@ -83,3 +84,35 @@ def test_long_rest_physics():
     assert phys.finished
     assert phys.can_be_captured()
     assert not phys.can_capture()
+
+
+def test_move_physics_position_and_next_event_are_closed_form():
+    board = mock_board()
+    phys = MovePhysics((0, 0), board, speed_m_s=1.0)
+    phys.reset(Command(0, "PB", "move", [0, 16]))
+    assert phys.next_event_ms() is None and phys.position_at(100) == (0.0, 0.0)
+
+    phys.update(100)  # the first update takes the start time
+
+    assert phys.position_at(100 + phys.duration_ms // 2) == (0.0, 1.0)
+    assert phys.position_at(100 + phys.duration_ms + 1) == (0.0, 2.0)
+    assert phys.next_event_ms() == 100 + phys.duration_ms + phys.extra_delay_ms
+    assert not phys.finished
+
+
+def test_rest_and_idle_physics_next_event():
+    board = mock_board()
+    rest = LongRestPhysics((4, 4), board)
+    rest.reset(Command(0, "P", "rest", [36]))
+    rest.update(200)
+    assert rest.next_event_ms() == 200 + LongRestPhysics.REST_MS
+
+    idle = IdlePhysics((2, 3), board)
+    idle.reset(Command(0, "P", "idle", [19]))
+    assert idle.next_event_ms() is None
+
+
+def test_physics_states_keep_no_instance_dict():
+    board = mock_board()
+    for cls in (IdlePhysics, MovePhysics, JumpPhysics, ShortRestPhysics, LongRestPhysics):
+        assert not hasattr(cls((0, 0), board), '__dict__')
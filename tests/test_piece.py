@@ -1,42 +1,53 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
 from unittest.mock import MagicMock
-from Piece import Piece
-from Command import Command
-from State import State
+from src.pieces.piece import Piece
+from src.input.command import Command
+from src.core.state import State
+from src.enums.states_names import StatesNames
 
 
-def make_mock_state(name="idle", transitions=None, physics=None, graphics=None, moves=None):
+def make_mock_state(name=StatesNames.IDLE, transitions=None, physics=None, graphics=None, moves=None):
     physics = physics or MagicMock()
     graphics = graphics or MagicMock()
+    moves = moves or MagicMock()
     state = State(moves=moves, graphics=graphics, physics=physics)
     state.name = name
     state.transitions = transitions or {}
     state.is_command_possible = MagicMock(return_value=True)
-    state.process_command = MagicMock(side_effect=lambda cmd: transitions.get(cmd.type, state))
+    state.process_command = MagicMock(side_effect=lambda cmd: state.transitions.get(cmd.type, state))
+    state.update = MagicMock()
+    state.reset = MagicMock()
     return state
 
 
 
 def test_on_command_executes_valid_command_and_transitions():
-    next_state = make_mock_state("move")
-    current_state = make_mock_state("idle", transitions={"move": next_state})
+    next_state = make_mock_state(StatesNames.MOVE)
+    current_state = make_mock_state(StatesNames.IDLE, transitions={StatesNames.MOVE: next_state})
+    current_state._physics.start_cell = (6, 4)
+    current_state._physics.board.square_to_cell.return_value = (5, 4)
 
-    piece = Piece("PW_1", current_state)
-    cmd = Command(100, "PW_1", "move", [(4, 4), (4, 5)])
+    piece = Piece("PW_1", current_state, bus=MagicMock())
+    cmd = Command(100, "PW_1", StatesNames.MOVE, [52, 44])
 
     piece.on_command(cmd, now_ms=100, dst_empty=True)
 
     current_state.is_command_possible.assert_called_once_with(cmd)
-    next_state = current_state.process_command.return_value
-    assert piece._state == next_state
+    current_state.process_command.assert_called_once_with(cmd)
+    assert piece._state is next_state
     assert piece._current_cmd == cmd
 
 
 def test_on_command_rejects_invalid_command():
-    state = make_mock_state("idle")
+    state = make_mock_state(StatesNames.IDLE, transitions={StatesNames.MOVE: make_mock_state(StatesNames.MOVE)})
     state.is_command_possible.return_value = False
-    piece = Piece("PW_1", state)
-    cmd = Command(100, "PW_1", "move", [(4, 4), (4, 5)])
+    state._physics.start_cell = (6, 4)
+    state._physics.board.square_to_cell.return_value = (5, 4)
+    piece = Piece("PW_1", state, bus=MagicMock())
+    cmd = Command(100, "PW_1", StatesNames.MOVE, [52, 44])
 
     piece.on_command(cmd, now_ms=100, dst_empty=True)
 
@@ -47,36 +58,37 @@ def test_on_command_rejects_invalid_command():
 
 def test_is_command_possible_pawn_forward_one_step():
     state = make_mock_state()
-    state._physics.board.algebraic_to_cell.return_value = (5, 4)
+    state._physics.board.square_to_cell.return_value = (5, 4)
     state._physics.start_cell = (6, 4)
     state._moves.get_moves.return_value = [(5, 4)]
 
     piece = Piece("PW_1", state)
-    cmd = Command(0, "PW_1", "move", [(6, 4), (5, 4)])
+    cmd = Command(0, "PW_1", StatesNames.MOVE, [52, 44])
 
     assert piece.is_command_possible(cmd, dst_empty=True) is True
 
 
 def test_is_command_possible_pawn_illegal_move():
     state = make_mock_state()
-    state._physics.board.algebraic_to_cell.return_value = (4, 5)
+    state._physics.board.square_to_cell.return_value = (4, 5)
     state._physics.start_cell = (6, 4)
     state._moves.get_moves.return_value = []
 
     piece = Piece("PW_1", state)
-    cmd = Command(0, "PW_1", "move", [(6, 4), (4, 5)])
+    cmd = Command(0, "PW_1", StatesNames.MOVE, [52, 37])
 
     assert piece.is_command_possible(cmd, dst_empty=True) is False
 
 
 def test_update_triggers_auto_transition_when_finished():
-    next_state = make_mock_state("idle")
-    state = make_mock_state("move", transitions={"done": next_state})
+    next_state = make_mock_state(StatesNames.IDLE)
+    state = make_mock_state(StatesNames.MOVE, transitions={StatesNames.IDLE: next_state})
     state._physics.finished = True
     state._physics.get_pos_in_cell.return_value = (4, 4)
+    state._physics.board.cell_to_square.return_value = 36
 
     piece = Piece("PW_1", state)
-    piece._current_cmd = Command(0, "PW_1", "move", [(4, 4), (4, 5)])
+    piece._current_cmd = Command(0, "PW_1", StatesNames.MOVE, [52, 36])
 
     piece.update(1000)
 
@@ -87,7 +99,7 @@ def test_update_triggers_auto_transition_when_finished():
 def test_reset_invokes_state_reset_with_last_command():
     state = make_mock_state()
     piece = Piece("PW_1", state)
-    cmd = Command(0, "PW_1", "move", [(4, 4), (4, 5)])
+    cmd = Command(0, "PW_1", StatesNames.MOVE, [52, 36])
     piece._current_cmd = cmd
 
     piece.reset(start_ms=500)
@@ -114,3 +126,41 @@ def test_clone_to_creates_new_piece_with_new_physics():
     factory.create.assert_called_once()
     assert isinstance(cloned, Piece)
     assert cloned.get_id() == "PW_1"
+
+
+def test_clone_to_copies_the_whole_state_machine():
+    idle = State(moves=MagicMock(), graphics=MagicMock(), physics=MagicMock(), name=StatesNames.IDLE)
+    move = State(moves=idle._moves, graphics=MagicMock(), physics=MagicMock(), name=StatesNames.MOVE)
+    idle.set_transition(StatesNames.MOVE, move)
+    move.set_transition(StatesNames.IDLE, idle)
+
+    factory = MagicMock()
+    factory.create.side_effect = lambda name, cell, cfg: MagicMock(name=f"{name}@{cell}")
+
+    cloned = Piece("QW", idle).clone_to((3, 3), factory, piece_id="QW_2")
+
+    assert cloned.get_id() == "QW_2"
+    assert factory.create.call_count == 2
+    cloned_idle = cloned.state
+    cloned_move = cloned_idle.transitions[StatesNames.MOVE]
+    assert cloned_idle is not idle and cloned_move is not move
+    assert cloned_move.transitions[StatesNames.IDLE] is cloned_idle
+    assert cloned_move._moves is move._moves
+    assert cloned_move.physics is not move.physics
+
+
+def test_restore_enters_the_named_state_with_its_physics_progress():
+    idle = State(moves=MagicMock(), graphics=MagicMock(), physics=MagicMock(finished=False), name=StatesNames.IDLE)
+    move = State(moves=idle._moves, graphics=MagicMock(), physics=MagicMock(finished=False), name=StatesNames.MOVE)
+    idle.set_transition(StatesNames.MOVE, move)
+    move.set_transition(StatesNames.IDLE, idle)
+    piece = Piece("QW_1", idle)
+    cmd = Command(timestamp=400, piece_id="QW_1", type=StatesNames.MOVE, params=[59, 35])
+
+    piece.restore(StatesNames.MOVE, cmd, (7, 3), 416, frozenset({StatesNames.IDLE}))
+
+    assert piece.state is move
+    assert move.current_command is cmd
+    move.physics.reset.assert_called_once_with(cmd)
+    assert move.physics.start_time == 416
+    assert piece.finished_states() == frozenset({StatesNames.IDLE})
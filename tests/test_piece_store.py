@@ -0,0 +1,47 @@
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+from src.pieces.piece_store import PieceStore
+
+
+def script():
+    def move(t, src, dst):
+        return Command(t, 'PW', StatesNames.MOVE, [src, dst])
+    # e2-e4 and Ng1-f3, d7-d5, e4xd5, then a knight jump on f3
+    return {0: [move(0, 52, 36), move(0, 62, 45)], 160: [move(160, 11, 27)],
+            4000: [move(4000, 36, 27)], 4800: [Command(4800, 'PW', StatesNames.JUMP, [45, 45])]}
+
+
+def test_store_positions_and_frames_match_the_pieces(make_game):
+    game = make_game(piece_store=PieceStore(capacity=4))  # grows while the 32 pieces are added
+    commands = script()
+    for t in range(0, 6000, 16):
+        game.step(commands.get(t, []))
+        now = game.game_time_ms() + 5  # between ticks, where moves are mid-cell
+        game._store.advance(now)
+        for piece in game.pieces.values():
+            assert piece.position_at(now) == piece.state.physics.position_at(now)
+            frame = piece.sprite_at(now)
+            piece.state.graphics.update(now)
+            assert frame is piece.state.graphics.get_premultiplied()
+
+
+def test_a_game_plays_the_same_with_a_store(make_game):
+    plain, stored = make_game(), make_game(piece_store=PieceStore())
+    commands = script()
+    for t in range(0, 8000, 16):
+        plain.step(commands.get(t, []))
+        stored.step(commands.get(t, []))
+
+    assert 'PB_4' not in stored.pieces and len(stored._store) == len(stored.pieces) == 31
+    assert stored.snapshot() == plain.snapshot() and stored.accepted_commands == plain.accepted_commands
+
+
+def test_rows_written_after_an_advance_are_not_read_stale(make_game):
+    game = make_game(piece_store=PieceStore())
+    pawn = game.pieces['PW_5']
+    game._store.advance(0)
+    game.step([Command(0, 'PW', StatesNames.MOVE, [52, 36])])  # e2-e4
+    game.step()
+
+    assert game._store.time_ms is None
+    assert pawn.position_at(16 + 400) == pawn.state.physics.position_at(16 + 400) == (320.0, 440.0)
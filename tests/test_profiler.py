@@ -0,0 +1,38 @@
+import pytest
+from src.enums.profile_metrics import ProfileMetrics
+from src.infrastructure import profiler as profiler_module
+from src.infrastructure.profiler import TickProfiler
+
+
+def test_ring_buffer_keeps_only_the_last_capacity_samples():
+    profiler = TickProfiler(capacity=4)
+    for value in [100, 100, 1, 2, 3, 4]:
+        profiler.record(ProfileMetrics.CAPTURES, value)
+
+    stats = profiler.stats(ProfileMetrics.CAPTURES)
+
+    assert stats.samples == 6 and stats.max == 4 and stats.p50 == 2.5
+
+
+def test_p99_tracks_the_slow_tail():
+    profiler = TickProfiler(capacity=1000)
+    for i in range(1000):
+        profiler.record(ProfileMetrics.UPDATE, 50.0 if i % 100 == 0 else 1.0)
+
+    stats = profiler.stats(ProfileMetrics.UPDATE)
+
+    assert stats.p50 == 1.0 and stats.p99 > 1.0 and stats.max == 50.0
+
+
+def test_laps_time_the_span_since_the_previous_mark(monkeypatch):
+    times = iter([0.0, 0.0, 0.002, 0.005])
+    monkeypatch.setattr(profiler_module.time, 'perf_counter', lambda: next(times))
+    profiler = TickProfiler()
+    profiler.mark()
+    profiler.lap(ProfileMetrics.UPDATE)
+    profiler.lap(ProfileMetrics.COMMANDS)
+
+    assert profiler.stats(ProfileMetrics.UPDATE).mean == pytest.approx(2.0)
+    assert profiler.stats(ProfileMetrics.COMMANDS).mean == pytest.approx(3.0)
+    assert profiler.stats(ProfileMetrics.SHOW).samples == 0
+    assert profiler.stats_lines()[0].startswith('update')
@@ -0,0 +1,36 @@
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+from src.input.scripted_source import ScriptedCommandSource
+
+
+def script():
+    def move(t, piece, src, dst):
+        return Command(t, piece, StatesNames.MOVE, [src, dst])
+    # e2-e4, d7-d5, e4xd5, Kd8-d7, Qd5-d2, Qd2-e1, then a knight jump on g1
+    return [move(0, 'PW', 52, 36), move(100, 'PB', 11, 27), move(4000, 'PW', 36, 27),
+            move(6000, 'KB', 3, 11), move(9000, 'QB', 27, 51), move(12000, 'QB', 51, 60),
+            Command(12500, 'NW', StatesNames.JUMP, [62, 62])]
+
+
+def test_only_pieces_with_a_due_state_change_are_updated(make_game):
+    game = make_game()
+    game.step([Command(0, 'PW', StatesNames.MOVE, [52, 36])])  # e2-e4
+
+    assert game._wake(16) == 1  # the pawn takes its start time; the 31 idle pieces cost nothing
+    assert game.next_event_ms() == 16 + 1600 + 300  # two cells of travel, then settling
+    for now in range(32, 1916, 16):
+        assert game._wake(now) == 0
+    assert game._wake(1916) == 1
+    assert game.pieces['PW_1'].state.name != StatesNames.MOVE
+
+
+def test_skipping_idle_ticks_plays_the_same_match(make_game):
+    results = []
+    for skip_idle in (False, True):
+        game = make_game()
+        game.run_headless(ScriptedCommandSource(script()), max_time_ms=20000, skip_idle=skip_idle)
+        states = {pid: (piece.state.name, game.occupancy.cell_of(piece)) for pid, piece in game.pieces.items()}
+        results.append((game.accepted_commands, states, game.white_score.score, game.black_score.score,
+                        game.game_time_ms()))
+
+    assert results[0] == results[1]
@@ -1,6 +1,10 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
-from unittest.mock import MagicMock
-from Score import Score
+from src.core.score import Score
+from src.enums.events_names import EventsNames
+from src.input.event_bus import CaptureEvent
 
 def test_score_initial_value():
     score = Score()
@@ -15,8 +19,7 @@ def test_score_initial_value():
     ("K", 0),
 ])
 def test_score_update_score_adds_correct_value(captured_type, expected_score):
-    event = MagicMock()
-    event.data = {"captured_piece": captured_type + "x"}  # כל מחרוזת שמתחילה באות המתאימה
+    event = CaptureEvent(EventsNames.WHITE_CAPTURE, "QW_1", captured_type + "x")  # כל מחרוזת שמתחילה באות המתאימה
 
     score = Score()
     score.update_score(event)
@@ -26,11 +29,9 @@ def test_score_update_score_adds_correct_value(captured_type, expected_score):
 def test_score_accumulates_score_correctly():
     score = Score()
 
-    event1 = MagicMock()
-    event1.data = {"captured_piece": "P1"}
+    event1 = CaptureEvent(EventsNames.WHITE_CAPTURE, "QW_1", "P1")
 
-    event2 = MagicMock()
-    event2.data = {"captured_piece": "Q5"}
+    event2 = CaptureEvent(EventsNames.WHITE_CAPTURE, "QW_1", "Q5")
 
     score.update_score(event1)
     score.update_score(event2)
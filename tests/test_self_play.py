@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+from src.ai import self_play
+from src.ai.self_play import MatchSpec, SelfPlayRunner, failed, in_game_id_order, match_specs, play_match
+from src.enums.states_names import StatesNames
+from src.input.command import Command
+
+
+class CrashPolicy:
+    """Kills the worker process outright, as a segfault in a native extension would."""
+    def __init__(self, game, color, seed):
+        pass
+
+    def poll(self, now_ms):
+        os._exit(3)
+
+
+class FaultyPolicy(CrashPolicy):
+    def poll(self, now_ms):
+        raise RuntimeError("bad policy")
+
+
+def pawn_move_ms(make_game):
+    """Game time a white pawn takes from e2 to e4 until it is idle again, in 1 ms ticks."""
+    game = make_game()
+    game.reset_pieces(0)
+    game.step([Command(0, 'PW', StatesNames.MOVE, [52, 36])], tick_ms=1)
+    pawn = game.pieces['PW_5']
+    while pawn.state.name != StatesNames.IDLE:
+        game.step(tick_ms=1)
+    return game.game_time_ms()
+
+
+def test_a_match_is_reproducible_from_its_seed(game_factory):
+    make_game = game_factory()
+    spec = MatchSpec(0, seed=7, white='random', black='random', max_time_ms=6000)
+
+    first, second = play_match(spec, make_game), play_match(spec, make_game)
+
+    assert first.error is None and first.duration_ms > 0
+    assert first.result.commands == second.result.commands and first[:8] == second[:8]
+
+
+def test_runner_streams_every_outcome():
+    runner = SelfPlayRunner(workers=2, queue_size=1, start_method='fork')
+
+    outcomes = list(runner.run(match_specs(4, 'random', 'random', seed=3, max_time_ms=3000)))
+
+    assert sorted(o.game_id for o in outcomes) == [0, 1, 2, 3]
+    assert all(o.error is None and o.result is not None for o in outcomes) and runner.crashed == 0
+
+
+def test_a_crashed_worker_loses_only_its_match(monkeypatch):
+    monkeypatch.setitem(self_play.POLICIES, 'crash', CrashPolicy)
+    monkeypatch.setitem(self_play.POLICIES, 'faulty', FaultyPolicy)
+    specs = match_specs(3, 'random', 'random', max_time_ms=3000) + \
+        [MatchSpec(3, 3, 'crash', 'random', 3000), MatchSpec(4, 4, 'faulty', 'random', 3000)]
+    runner = SelfPlayRunner(workers=2, start_method='fork')
+
+    outcomes = {o.game_id: o for o in runner.run(specs)}
+
+    assert sorted(outcomes) == [0, 1, 2, 3, 4] and runner.crashed == 1
+    assert all(outcomes[i].error is None for i in range(3))
+    assert 'exited with code 3' in outcomes[3].error and outcomes[3].result is None
+    assert outcomes[4].error == 'RuntimeError: bad policy'
+
+
+def test_tuned_piece_configs_change_play(game_factory, tmp_path):
+    tuned = tmp_path / 'pieces'
+    shutil.copytree(self_play.PIECES_ROOT, tuned)
+    for state, key, value in (('move', 'speed_m_per_sec', 3.0), ('long_rest', 'duration_ms', 200)):
+        cfg_path = tuned / 'PW' / 'states' / state / 'config.json'
+        cfg = json.loads(cfg_path.read_text())
+        cfg['physics'][key] = value
+        cfg_path.write_text(json.dumps(cfg))
+
+    # 1600 ms over two cells at 1 m/s, 300 ms settling and 1500 ms of long rest, each state
+    # starting on the tick after it was entered
+    assert pawn_move_ms(game_factory()) == 1600 + 300 + 1500 + 3
+    # Three times the speed and a 200 ms rest
+    assert pawn_move_ms(game_factory(tuned)) == 533 + 300 + 200 + 3
+
+
+def test_outcomes_are_released_in_game_id_order():
+    specs = match_specs(4, 'random', 'random')
+    finished = [failed(specs[i], 'x') for i in (2, 0, 3, 1)]
+
+    assert [o.game_id for o in in_game_id_order(finished)] == [0, 1, 2, 3]
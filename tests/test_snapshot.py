@@ -0,0 +1,55 @@
+import pytest
+from src.core.snapshot import (PIECE_RECORD, SNAPSHOT_HEADER, PieceRecord, Snapshot, apply_delta,
+                               decode_snapshot, encode_delta, encode_snapshot)
+from src.enums.states_names import StatesNames
+
+
+def record(piece_id, **changes):
+    fields = dict(piece_id=piece_id, state=StatesNames.IDLE, cell=(6, 4), start_cell=(6, 4), target_cell=(6, 4),
+                  start_time=0, command_time=None, finished=frozenset())
+    fields.update(changes)
+    return PieceRecord(**fields)
+
+
+def make_snapshot(time_ms=0, *records):
+    return Snapshot(time_ms, 8, 8, 3, 5, {r.piece_id: r for r in records})
+
+
+def test_snapshot_round_trips_with_fixed_width_records():
+    moving = record('QW_12', state=StatesNames.MOVE, cell=None, start_cell=(7, 3), target_cell=(3, 7),
+                    start_time=None, command_time=1500, finished=frozenset({StatesNames.JUMP}))
+    snapshot = make_snapshot(123456, record('PW_1'), moving)
+
+    data = encode_snapshot(snapshot)
+
+    assert len(data) == SNAPSHOT_HEADER.size + 2 * PIECE_RECORD.size
+    assert PIECE_RECORD.size == 20
+    assert decode_snapshot(data) == snapshot
+
+
+def test_delta_carries_only_changed_and_removed_pieces():
+    base = make_snapshot(100, record('PW_1'), record('PW_2', cell=(6, 5)), record('KB_1', cell=(0, 4)))
+    moved = record('PW_1', state=StatesNames.MOVE, cell=None, target_cell=(4, 4), start_time=116, command_time=100)
+    current = Snapshot(116, 8, 8, 4, 5, {'PW_1': moved, 'KB_1': base.pieces['KB_1']})
+
+    delta = encode_delta(base, current)
+
+    assert len(delta) < len(encode_snapshot(current))
+    assert apply_delta(base, delta) == current
+
+
+def test_delta_must_match_its_base():
+    base = make_snapshot(100, record('PW_1'))
+    delta = encode_delta(base, make_snapshot(116, record('PW_1')))
+
+    with pytest.raises(ValueError):
+        apply_delta(make_snapshot(84, record('PW_1')), delta)
+
+
+def test_corrupt_data_is_rejected():
+    data = encode_snapshot(make_snapshot(0, record('PW_1')))
+
+    with pytest.raises(ValueError):
+        decode_snapshot(data[:-1])
+    with pytest.raises(ValueError):
+        decode_snapshot(b'XXXX' + data[4:])
@@ -0,0 +1,48 @@
+import cv2
+import numpy as np
+import pytest
+from src.graphics.sprite_cache import SpriteCache
+
+
+@pytest.fixture
+def sprites_dir(tmp_path):
+    for i, color in enumerate([(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 0)], start=1):
+        frame = np.full((20, 20, 4), color, dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f"{i}.png"), frame)
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_frames_are_views_into_one_atlas(sprites_dir):
+    cache = SpriteCache()
+    frames = cache.get(sprites_dir, (10, 8))
+    atlas = cache.atlas(sprites_dir, (10, 8))
+
+    assert atlas.shape == (3, 8, 10, 4)
+    assert len(frames) == 3
+    for frame in frames:
+        assert frame.img.base is atlas
+    assert tuple(frames[1].img[0, 0]) == (0, 255, 0, 128)
+
+
+def test_folder_is_decoded_once_per_size(sprites_dir, monkeypatch):
+    cache = SpriteCache()
+    reads = []
+    original_imread = cv2.imread
+    monkeypatch.setattr(cv2, "imread", lambda *a, **kw: reads.append(a[0]) or original_imread(*a, **kw))
+
+    cache.get(sprites_dir, (10, 8))
+    cache.get(sprites_dir, (10, 8))
+    assert len(reads) == 3
+    assert len(cache) == 1
+
+    cache.get(sprites_dir, (16, 16))
+    assert len(reads) == 6
+    assert len(cache) == 2
+
+
+def test_atlas_is_read_only(sprites_dir):
+    cache = SpriteCache()
+    frame = cache.get(sprites_dir, (10, 8))[0]
+    with pytest.raises(ValueError):
+        frame.img[0, 0] = 0
@@ -3,10 +3,11 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
 from unittest.mock import MagicMock
-from Piece import Piece
-from Command import Command
-from State import State
-def make_mock_state(name="idle", transitions=None, physics=None, graphics=None, moves=None):
+from src.pieces.piece import Piece
+from src.input.command import Command
+from src.core.state import State
+from src.enums.states_names import StatesNames
+def make_mock_state(name=StatesNames.IDLE, transitions=None, physics=None, graphics=None, moves=None):
     physics = physics or MagicMock()
     graphics = graphics or MagicMock()
     moves = moves or MagicMock()
@@ -14,30 +15,30 @@ def make_mock_state(name="idle", transitions=None, physics=None, graphics=None,
     state.name = name
     state.transitions = transitions or {}
     state.is_command_possible = MagicMock(return_value=True)
-    state.process_command = MagicMock(side_effect=lambda cmd: transitions.get(cmd.type, state))
+    state.process_command = MagicMock(side_effect=lambda cmd: state.transitions.get(cmd.type, state))
     state.update = MagicMock()
     state.reset = MagicMock()
     return state
 
 def test_on_command_executes_valid_command_and_transitions():
-    next_state = make_mock_state("move")
-    current_state = make_mock_state("idle", transitions={"move": next_state})
-    piece = Piece("PW_1", current_state)
+    next_state = make_mock_state(StatesNames.MOVE)
+    current_state = make_mock_state(StatesNames.IDLE, transitions={StatesNames.MOVE: next_state})
+    piece = Piece("PW_1", current_state, bus=MagicMock())
     piece.is_command_possible = MagicMock(return_value=True)  # <- הוספנו את זה
-    cmd = Command(100, "PW_1", "move", [(4, 4), (4, 5)])
+    cmd = Command(100, "PW_1", StatesNames.MOVE, [36, 37])
     current_state._physics.start_cell = (4, 4)
-    current_state._physics.board.algebraic_to_cell.return_value = (4, 5)
+    current_state._physics.board.square_to_cell.return_value = (4, 5)
     current_state._moves.get_moves.return_value = [(4, 5)]
     piece.on_command(cmd, now_ms=100, dst_empty=True)
     current_state.is_command_possible.assert_called_once_with(cmd)
 
 def test_on_command_rejects_invalid_command():
-    state = make_mock_state("idle")
+    state = make_mock_state(StatesNames.IDLE)
     state.is_command_possible.return_value = False
     piece = Piece("PW_1", state)
-    cmd = Command(100, "PW_1", "move", [(4, 4), (4, 5)])
+    cmd = Command(100, "PW_1", StatesNames.MOVE, [36, 37])
     state._physics.start_cell = (4, 4)
-    state._physics.board.algebraic_to_cell.return_value = (4, 5)
+    state._physics.board.square_to_cell.return_value = (4, 5)
     state._moves.get_moves.return_value = []
     piece.on_command(cmd, now_ms=100, dst_empty=True)
     state.process_command.assert_not_called()
@@ -45,35 +46,36 @@ def test_on_command_rejects_invalid_command():
     assert piece._current_cmd is None
 def test_is_command_possible_pawn_forward_one_step():
     state = make_mock_state()
-    state._physics.board.algebraic_to_cell.return_value = (5, 4)
+    state._physics.board.square_to_cell.return_value = (5, 4)
     state._physics.start_cell = (6, 4)
     state._moves.get_moves.return_value = [(5, 4)]
     piece = Piece("PW_1", state)
-    cmd = Command(0, "PW_1", "move", [(6, 4), (5, 4)])
+    cmd = Command(0, "PW_1", StatesNames.MOVE, [52, 44])
     assert piece.is_command_possible(cmd, dst_empty=True) is True
 def test_is_command_possible_pawn_illegal_move():
     state = make_mock_state()
-    state._physics.board.algebraic_to_cell.return_value = (4, 5)
+    state._physics.board.square_to_cell.return_value = (4, 5)
     state._physics.start_cell = (6, 4)
     state._moves.get_moves.return_value = []
     piece = Piece("PW_1", state)
-    cmd = Command(0, "PW_1", "move", [(6, 4), (4, 5)])
+    cmd = Command(0, "PW_1", StatesNames.MOVE, [52, 37])
     assert piece.is_command_possible(cmd, dst_empty=True) is False
 
 def test_update_triggers_auto_transition_when_finished():
-    next_state = make_mock_state("idle")
-    state = make_mock_state("move", transitions={"done": next_state})
+    next_state = make_mock_state(StatesNames.IDLE)
+    state = make_mock_state(StatesNames.MOVE, transitions={StatesNames.IDLE: next_state})
     state._physics.finished = True
     state._physics.get_pos_in_cell.return_value = (4, 4)
+    state._physics.board.cell_to_square.return_value = 36
     piece = Piece("PW_1", state)
-    piece._current_cmd = Command(0, "PW_1", "move", [(4, 4), (4, 5)])
+    piece._current_cmd = Command(0, "PW_1", StatesNames.MOVE, [36, 37])
     piece.update(1000)
     assert piece._state == next_state
     state.update.assert_called_once_with(1000)
 def test_reset_invokes_state_reset_with_last_command():
     state = make_mock_state()
     piece = Piece("PW_1", state)
-    cmd = Command(0, "PW_1", "move", [(4, 4), (4, 5)])
+    cmd = Command(0, "PW_1", StatesNames.MOVE, [36, 37])
     piece._current_cmd = cmd
     piece.reset(start_ms=500)
     state.reset.assert_called_once_with(cmd)
@@ -0,0 +1,52 @@
+import numpy as np
+from src.core.table import Table
+
+HEADERS = ['time', 'source', 'destination']
+
+
+def entry(i):
+    return {'time': f"00:00:{i:02d}", 'source': f"a{i % 8 + 1}", 'destination': f"b{i % 8 + 1}"}
+
+
+def test_appending_and_scrolling_matches_full_render():
+    log = [entry(i) for i in range(12)]
+    incremental = Table(HEADERS, max_rows=5)
+    for n in range(1, len(log) + 1):
+        incremental.sync_log(log[:n])
+
+    full = Table(HEADERS, max_rows=5)
+    full.update_data(Table.log_to_table_data(log)[1:])
+
+    assert incremental.rows == full.rows
+    assert np.array_equal(incremental.img, full.img)
+
+
+def test_sync_log_only_renders_new_entries(monkeypatch):
+    table = Table(HEADERS, max_rows=5)
+    log = [entry(i) for i in range(3)]
+    table.sync_log(log)
+    version = table.version
+
+    rendered = []
+    original = table._draw_row
+    monkeypatch.setattr(table, '_draw_row', lambda img, row: (rendered.append(row), original(img, row)))
+
+    table.sync_log(log)
+    assert table.version == version and rendered == []
+
+    log.append(entry(3))
+    table.sync_log(log)
+    assert table.version == version + 1
+    assert rendered == [['00:00:03', 'a4', 'b4']]
+
+
+def test_cleared_table_resyncs_from_whole_log():
+    table = Table(HEADERS, max_rows=5)
+    log = [entry(i) for i in range(3)]
+    table.sync_log(log)
+
+    table.update_data([])
+    table.sync_log(log)
+
+    assert len(table.rows) == 3
+    assert table.rows[-1] == ['00:00:02', 'a3', 'b3']